@@ -0,0 +1,30 @@
+"""Move the connection settings hash out of schema_analyses.schema_data.
+
+schema_data is returned to clients as-is, so the hash, which is keyed over
+the connection password, gets a column of its own.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "006"
+down_revision = "005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("schema_analyses", sa.Column("settings_hash", sa.String(64), nullable=True))
+    op.execute("""
+        UPDATE schema_analyses
+        SET settings_hash = schema_data->>'settings_hash',
+            schema_data = (schema_data::jsonb - 'settings_hash')::json
+        WHERE schema_data::jsonb ? 'settings_hash'
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column("schema_analyses", "settings_hash")
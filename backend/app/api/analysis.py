@@ -1,23 +1,199 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
 from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from datetime import datetime
 from typing import Optional
 
-from app.core.database import get_db
+from app.core.config import get_settings
+from app.core.database import get_db, async_session
 from app.core.security import get_current_user
 from app.core.encryption import decrypt_password
 from app.models import User, Connection, Project, SchemaAnalysis, AnalysisStatus
 from app.schemas import (
     AnalysisRequest, AnalysisResponse, AnalysisDetailResponse,
-    QuickAnalysisRequest, QuickAnalysisResponse
+    QuickAnalysisRequest, QuickAnalysisResponse, BatchAnalysisRequest
 )
-from app.services.schema_analyzer import SchemaAnalyzer
+from app.services.schema_analyzer import SchemaAnalyzer, SUPPORTED_DB_TYPES
+from app.services.connection_pool import settings_hash
 from app.services.sql_parser import SQLParser
 from app.services.ddl_generator import SnowflakeDDLGenerator
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+settings = get_settings()
+
+# The database drivers block, so analyses run on their own threads
+_analysis_executor = ThreadPoolExecutor(
+    max_workers=settings.analysis_workers, thread_name_prefix="schema-analysis"
+)
+# Analyses running at once, and per source host so a batch over many
+# databases on one legacy server does not overload it
+_analysis_slots = asyncio.Semaphore(settings.analysis_workers)
+_host_slots: dict[str, asyncio.Semaphore] = {}
+# Strong references to running analysis tasks so they are not garbage collected
+_analysis_tasks: set[asyncio.Task] = set()
+
+
+def _host_slot(host: str) -> asyncio.Semaphore:
+    key = host.lower()
+    slot = _host_slots.get(key)
+    if slot is None:
+        slot = _host_slots[key] = asyncio.Semaphore(settings.analysis_per_host)
+    return slot
+
+
+def _analyzer_args(connection: Connection) -> dict:
+    """Keyword arguments for SchemaAnalyzer.analyze from a saved connection."""
+    return {
+        "db_type": connection.db_type,
+        "host": connection.host,
+        "port": connection.port,
+        "database": connection.database,
+        "username": connection.username,
+        "password": decrypt_password(connection.password_encrypted),
+        "ssl": connection.ssl_enabled,
+        "schema": connection.schema_name or "public",
+        "connection_id": connection.id,
+    }
+
+
+def _settings_hash(analyzer_args: dict) -> str:
+    """Hash of the connection settings an analysis ran with."""
+    return settings_hash(
+        analyzer_args["host"], analyzer_args["port"], analyzer_args["database"],
+        analyzer_args["username"], analyzer_args["password"], analyzer_args["ssl"]
+    )
+
+
+async def _previous_tables(db: AsyncSession, connection: Connection) -> Optional[list]:
+    """Tables of the latest completed analysis of the connection's schema.
+
+    Handed to the analyzer so that unchanged tables are not introspected
+    again. Nothing is reused once the connection settings differ from the
+    ones that analysis ran with, or it covered another database or schema.
+    Marking the connection as tested does not count as a change.
+    """
+    result = await db.execute(
+        select(SchemaAnalysis)
+        .where(
+            SchemaAnalysis.connection_id == connection.id,
+            SchemaAnalysis.status == AnalysisStatus.COMPLETED
+        )
+        .order_by(SchemaAnalysis.created_at.desc())
+        .limit(1)
+    )
+    latest = result.scalar_one_or_none()
+    if not latest or not latest.schema_data:
+        return None
+    data = latest.schema_data
+    if (
+        latest.settings_hash != _settings_hash(_analyzer_args(connection))
+        or data.get("db_type") != connection.db_type.value
+        or data.get("database") != connection.database
+        or data.get("schema") not in (None, connection.schema_name or "public")
+    ):
+        return None
+    return data.get("tables")
+
+
+async def _analyze(analyzer_args: dict, on_start=None) -> dict:
+    """Run SchemaAnalyzer.analyze on the analysis threads.
+
+    Waits for a free global and per-host slot first; on_start, if given, is
+    awaited once the analysis is about to run.
+    """
+    async with _host_slot(analyzer_args["host"]), _analysis_slots:
+        if on_start is not None:
+            await on_start()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _analysis_executor, partial(SchemaAnalyzer.analyze, **analyzer_args)
+        )
+
+
+def _store_result(analysis: SchemaAnalysis, analysis_result: dict, connection_hash: str) -> None:
+    """Copy an analyzer result onto its SchemaAnalysis record.
+
+    connection_hash identifies the connection settings the analysis ran with,
+    so a later run can tell whether its tables may be reused. It is stored
+    outside schema_data because that is returned to clients.
+    """
+    if analysis_result["success"]:
+        analysis.status = AnalysisStatus.COMPLETED
+        analysis.tables_count = analysis_result["tables_count"]
+        analysis.total_rows = analysis_result["total_rows"]
+        analysis.schema_data = {
+            "database": analysis_result.get("database"),
+            "db_type": analysis_result.get("db_type"),
+            "schema": analysis_result.get("schema"),
+            "tables": analysis_result["tables"]
+        }
+        analysis.risks = analysis_result["risks"]
+        analysis.settings_hash = connection_hash
+    else:
+        analysis.status = AnalysisStatus.FAILED
+        analysis.error_message = analysis_result.get("error", "Unknown error")
+    analysis.completed_at = datetime.utcnow()
+
+
+async def _run_analysis_job(analysis_id: str, analyzer_args: dict) -> None:
+    """Analyze in the background and record the outcome on the analysis row."""
+    async def mark_running():
+        async with async_session() as db:
+            analysis = await db.get(SchemaAnalysis, analysis_id)
+            if analysis is not None and analysis.status == AnalysisStatus.PENDING:
+                analysis.status = AnalysisStatus.RUNNING
+                analysis.started_at = datetime.utcnow()
+                await db.commit()
+
+    try:
+        analysis_result = await _analyze(analyzer_args, on_start=mark_running)
+    except Exception as exc:
+        logger.error("Schema analysis %s crashed: %s", analysis_id, exc)
+        analysis_result = {"success": False, "error": f"Analysis failed: {exc}"}
+
+    async with async_session() as db:
+        analysis = await db.get(SchemaAnalysis, analysis_id)
+        if analysis is None:
+            return
+        _store_result(analysis, analysis_result, _settings_hash(analyzer_args))
+        await db.commit()
+
+
+async def fail_interrupted_analyses() -> int:
+    """Mark analyses left pending or running by a previous process as failed.
+
+    Analyses run as tasks inside the server process, so any still unfinished
+    at startup were cut off by a restart and will never complete. Returns
+    how many were marked.
+    """
+    async with async_session() as db:
+        result = await db.execute(
+            select(SchemaAnalysis).where(
+                SchemaAnalysis.status.in_([AnalysisStatus.PENDING, AnalysisStatus.RUNNING])
+            )
+        )
+        interrupted = result.scalars().all()
+        for analysis in interrupted:
+            analysis.status = AnalysisStatus.FAILED
+            analysis.error_message = "Analysis was interrupted by a server restart"
+            analysis.completed_at = datetime.utcnow()
+        await db.commit()
+    return len(interrupted)
+
+
+def _start_analysis_job(analysis_id: str, analyzer_args: dict) -> None:
+    task = asyncio.create_task(_run_analysis_job(analysis_id, analyzer_args))
+    _analysis_tasks.add(task)
+    task.add_done_callback(_analysis_tasks.discard)
+
 
 @router.get("/project/{project_id}", response_model=list[AnalysisResponse])
 async def list_project_analyses(
@@ -134,19 +310,7 @@ async def quick_analysis(
             detail="Connection not found"
         )
 
-    # Decrypt password and run analysis
-    password = decrypt_password(connection.password_encrypted)
-
-    analysis_result = SchemaAnalyzer.analyze(
-        db_type=connection.db_type,
-        host=connection.host,
-        port=connection.port,
-        database=connection.database,
-        username=connection.username,
-        password=password,
-        ssl=connection.ssl_enabled,
-        schema=connection.schema_name or "public"
-    )
+    analysis_result = await _analyze(_analyzer_args(connection))
 
     # Generate Snowflake DDL if analysis was successful
     if analysis_result.get('success') and analysis_result.get('tables'):
@@ -155,7 +319,11 @@ async def quick_analysis(
     return QuickAnalysisResponse(**analysis_result)
 
 
-@router.post("/run/{project_id}", response_model=AnalysisResponse)
+@router.post(
+    "/run/{project_id}",
+    response_model=AnalysisResponse,
+    status_code=status.HTTP_202_ACCEPTED
+)
 async def run_analysis(
     project_id: str,
     request: AnalysisRequest,
@@ -163,8 +331,9 @@ async def run_analysis(
     current_user: User = Depends(get_current_user)
 ):
     """
-    Run schema analysis for a project and store results.
-    This is the full analysis that saves to database.
+    Start a schema analysis for a project and store results.
+    The analysis runs in the background: the returned record is RUNNING
+    until it completes or fails - poll GET /api/analysis/{id} for it.
     """
     # Get project
     result = await db.execute(
@@ -203,40 +372,96 @@ async def run_analysis(
     await db.commit()
     await db.refresh(analysis)
 
-    # Run analysis
-    password = decrypt_password(connection.password_encrypted)
-
-    analysis_result = SchemaAnalyzer.analyze(
-        db_type=connection.db_type,
-        host=connection.host,
-        port=connection.port,
-        database=connection.database,
-        username=connection.username,
-        password=password,
-        ssl=connection.ssl_enabled,
-        schema=connection.schema_name or "public"
+    analyzer_args = _analyzer_args(connection)
+    analyzer_args["previous"] = await _previous_tables(db, connection)
+    _start_analysis_job(analysis.id, analyzer_args)
+
+    return analysis
+
+
+@router.post(
+    "/batch/{project_id}",
+    response_model=list[AnalysisResponse],
+    status_code=status.HTTP_202_ACCEPTED
+)
+async def run_batch_analysis(
+    project_id: str,
+    request: Optional[BatchAnalysisRequest] = None,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Start schema analyses for several connections of a project at once.
+    Analyzes the given connection_ids, or by default the project's source
+    and target connections that can be analyzed. Each connection gets its
+    own analysis record, PENDING until a slot frees up (ANALYSIS_WORKERS
+    overall, ANALYSIS_PER_HOST per database server), then RUNNING.
+    """
+    # Get project
+    result = await db.execute(
+        select(Project)
+        .where(Project.id == project_id, Project.owner_id == current_user.id)
     )
+    project = result.scalar_one_or_none()
 
-    # Update analysis with results
-    if analysis_result["success"]:
-        analysis.status = AnalysisStatus.COMPLETED
-        analysis.tables_count = analysis_result["tables_count"]
-        analysis.total_rows = analysis_result["total_rows"]
-        analysis.schema_data = {
-            "database": analysis_result.get("database"),
-            "db_type": analysis_result.get("db_type"),
-            "tables": analysis_result["tables"]
-        }
-        analysis.risks = analysis_result["risks"]
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found"
+        )
+
+    if request and request.connection_ids:
+        connection_ids = list(dict.fromkeys(request.connection_ids))
     else:
-        analysis.status = AnalysisStatus.FAILED
-        analysis.error_message = analysis_result.get("error", "Unknown error")
+        connection_ids = [
+            cid for cid in (project.source_connection_id, project.target_connection_id) if cid
+        ]
 
-    analysis.completed_at = datetime.utcnow()
+    result = await db.execute(
+        select(Connection)
+        .where(Connection.id.in_(connection_ids), Connection.owner_id == current_user.id)
+    )
+    found = {c.id: c for c in result.scalars().all()}
+
+    if request and request.connection_ids:
+        missing = [cid for cid in connection_ids if cid not in found]
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Connection not found: {', '.join(missing)}"
+            )
+        connections = [found[cid] for cid in connection_ids]
+    else:
+        connections = [
+            found[cid] for cid in connection_ids
+            if cid in found and found[cid].db_type in SUPPORTED_DB_TYPES
+        ]
+
+    if not connections:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Project has no connections to analyze"
+        )
+
+    # Create analysis records
+    analyses = [
+        SchemaAnalysis(
+            project_id=project_id,
+            connection_id=connection.id,
+            status=AnalysisStatus.PENDING
+        )
+        for connection in connections
+    ]
+    db.add_all(analyses)
     await db.commit()
-    await db.refresh(analysis)
 
-    return analysis
+    for analysis, connection in zip(analyses, connections):
+        await db.refresh(analysis)
+        analyzer_args = _analyzer_args(connection)
+        analyzer_args["previous"] = await _previous_tables(db, connection)
+        _start_analysis_job(analysis.id, analyzer_args)
+
+    return analyses
 
 
 @router.get("/{analysis_id}", response_model=AnalysisDetailResponse)
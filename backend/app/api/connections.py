@@ -12,6 +12,7 @@ from app.schemas import (
     ConnectionList, ConnectionTestResult
 )
 from app.services.db_connector import DatabaseConnector
+from app.services.connection_pool import source_pool
 
 router = APIRouter()
 
@@ -111,7 +112,8 @@ async def test_saved_connection(
         ssl=connection.ssl_enabled,
         warehouse=connection.warehouse,
         schema_name=connection.schema_name,
-        role=connection.role
+        role=connection.role,
+        connection_id=connection.id
     )
 
     # Update connection test status
@@ -165,3 +167,6 @@ async def delete_connection(
 
     await db.delete(connection)
     await db.commit()
+
+    # Drop its pooled source database connections
+    source_pool.evict(connection_id)
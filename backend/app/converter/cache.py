@@ -0,0 +1,140 @@
+"""Content-addressed cache of conversion results.
+
+Entries are keyed by the SHA-256 of the uploaded bytes together with the
+source format, target and conversion options, so the same file converted
+the same way is only processed once:
+
+    <root>/<key[:2]>/<key>.out   the packaged result (ZIP, gzip or zstd)
+    <root>/<key[:2]>/<key>.json  packaging and table/row/warning counts
+
+An entry's mtime is its last use; when the cache grows past its byte
+budget the least recently used entries are evicted.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+from pathlib import Path
+
+from .engine import ConversionResult
+from .models import ConvertOptions
+
+logger = logging.getLogger(__name__)
+
+# Options that change how a conversion runs but not what it produces
+_RUNTIME_OPTIONS = {"table_workers", "parallel_min_bytes"}
+
+
+class ResultCache:
+    def __init__(self, root: Path, max_bytes: int):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(input_sha256: str, source_fmt: str, target: str, options: ConvertOptions) -> str:
+        opts = {
+            k: v for k, v in dataclasses.asdict(options).items() if k not in _RUNTIME_OPTIONS
+        }
+        raw = json.dumps(
+            {"input": input_sha256, "source": source_fmt, "target": target, "options": opts},
+            sort_keys=True,
+        )
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        base = self.root / key[:2] / key
+        return base.with_suffix(".out"), base.with_suffix(".json")
+
+    def get(self, key: str) -> ConversionResult | None:
+        """Return the cached result for key and mark it as recently used."""
+        out_path, meta_path = self._paths(key)
+        try:
+            meta = json.loads(meta_path.read_text())
+            now = time.time()
+            os.utime(out_path, (now, now))
+            os.utime(meta_path, (now, now))
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return ConversionResult(archive_path=out_path, **meta)
+
+    def put(self, key: str, result: ConversionResult) -> None:
+        """Store a copy of result's archive under key, then evict down to the budget."""
+        out_path, meta_path = self._paths(key)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = out_path.with_name(f".{uuid.uuid4().hex}.tmp")
+        try:
+            try:
+                os.link(result.archive_path, tmp)
+            except OSError:
+                # Different filesystem (or no hard links): copy instead
+                shutil.copyfile(result.archive_path, tmp)
+            meta_path.write_text(json.dumps({
+                "tables_count": result.tables_count,
+                "total_rows": result.total_rows,
+                "warnings_count": result.warnings_count,
+                "archive": result.archive,
+                "member": result.member,
+            }))
+            os.replace(tmp, out_path)
+        except OSError as exc:
+            tmp.unlink(missing_ok=True)
+            logger.warning("Could not cache conversion result %s: %s", key, exc)
+            return
+        self.evict()
+
+    def evict(self) -> int:
+        """Remove least recently used entries until the cache fits its budget.
+
+        Returns how many entries were removed.
+        """
+        with self._lock:
+            entries = []
+            total = 0
+            for out_path in self.root.glob("*/*.out"):
+                try:
+                    st = out_path.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, out_path))
+                total += st.st_size
+            removed = 0
+            for _, size, out_path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                out_path.unlink(missing_ok=True)
+                out_path.with_suffix(".json").unlink(missing_ok=True)
+                total -= size
+                removed += 1
+        if removed:
+            logger.info("Evicted %d cached conversion results", removed)
+        return removed
+
+    def stats(self) -> dict:
+        entries = 0
+        size = 0
+        for out_path in self.root.glob("*/*.out"):
+            try:
+                size += out_path.stat().st_size
+            except OSError:
+                continue
+            entries += 1
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": entries,
+            "size_bytes": size,
+            "max_bytes": self.max_bytes,
+        }
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
 
 # Map extensions to canonical format names
@@ -15,11 +16,23 @@ EXTENSION_MAP: dict[str, str] = {
     ".db": "sqlite",
     ".sql": "sql",
     ".dbf": "dbf",
+    ".parquet": "parquet",
+    ".arrow": "arrow",
+    ".feather": "arrow",
+    ".ipc": "arrow",
 }
 
-SUPPORTED_SOURCES = {"csv", "excel", "sqlite", "sql", "dbf"}
+SUPPORTED_SOURCES = {"csv", "excel", "sqlite", "sql", "dbf", "parquet", "arrow"}
 
-SUPPORTED_TARGETS = {"csv", "xlsx", "mysql", "postgresql", "sqlite"}
+SUPPORTED_TARGETS = {"csv", "xlsx", "mysql", "postgresql", "sqlite", "parquet", "arrow"}
+
+# How rows are loaded in PostgreSQL dumps: INSERT statements, or COPY
+# blocks in PostgreSQL's text or CSV format
+PG_OUTPUT_MODES = ("insert", "copy", "copy_csv")
+
+# How the output is packaged: a ZIP, or a single gzip/zstd-compressed file
+# when the conversion produced exactly one file
+ARCHIVE_FORMATS = ("zip", "gzip", "zstd")
 
 # Aliases for target format (SEO-friendly names map to canonical)
 TARGET_ALIASES: dict[str, str] = {
@@ -36,9 +49,36 @@ TARGET_ALIASES: dict[str, str] = {
     "postgre": "postgresql",
     "sqlite": "sqlite",
     "sqlite3": "sqlite",
+    "parquet": "parquet",
+    "arrow": "arrow",
+    "feather": "arrow",
+    "ipc": "arrow",
 }
 
-MAX_FREE_SIZE = 10 * 1024 * 1024  # 10 MB
+# Bytes inspected by sniff_format() at the start and at the end of an upload
+SNIFF_BYTES = 64
+
+# Formats recognised by their leading bytes; csv and sql are plain text
+BINARY_FORMATS = {"excel", "sqlite", "dbf", "parquet", "arrow"}
+
+_MAGIC: list[tuple[bytes, str]] = [
+    (b"SQLite format 3\x00", ".sqlite"),
+    (b"PK\x03\x04", ".xlsx"),  # zip container (OOXML)
+    (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1", ".xls"),  # OLE2 compound file
+    (b"PAR1", ".parquet"),  # only with the trailing magic too, see _looks_like_parquet
+    (b"ARROW1", ".arrow"),  # IPC file format
+    (b"\xff\xff\xff\xff", ".arrow"),  # IPC stream format (continuation marker)
+]
+
+# Leading members of OOXML packages, as written by Excel, LibreOffice and openpyxl
+_OOXML_ENTRIES = (b"[Content_Types].xml", b"_rels/", b"docProps/", b"xl/")
+
+# Parquet begins and ends with PAR1; the end one follows the footer length
+_PARQUET_MAGIC = b"PAR1"
+_PARQUET_MIN_SIZE = len(_PARQUET_MAGIC) * 2 + 4
+
+# First byte of dBase III/IV/5, FoxPro and Visual FoxPro tables
+_DBF_VERSIONS = {0x02, 0x03, 0x04, 0x05, 0x30, 0x31, 0x32, 0x43, 0x63, 0x83, 0x8B, 0xCB, 0xF5, 0xFB}
 
 
 def detect_format(filename: str) -> str | None:
@@ -47,22 +87,110 @@ def detect_format(filename: str) -> str | None:
     return EXTENSION_MAP.get(ext)
 
 
+def _looks_like_dbf(head: bytes) -> bool:
+    """DBF has no magic string: check the version byte and header fields."""
+    if len(head) < 32 or head[0] not in _DBF_VERSIONS:
+        return False
+    month, day = head[2], head[3]
+    header_len = int.from_bytes(head[8:10], "little")
+    record_len = int.from_bytes(head[10:12], "little")
+    return month <= 12 and day <= 31 and header_len >= 33 and record_len >= 1
+
+
+def _looks_like_parquet(head: bytes, tail: bytes) -> bool:
+    """Text can start with "PAR1" too: require the trailing magic as well."""
+    # head holds the whole file when it is shorter than SNIFF_BYTES
+    return tail.endswith(_PARQUET_MAGIC) and len(head) >= _PARQUET_MIN_SIZE
+
+
+def _zip_first_entry(head: bytes) -> bytes:
+    """Name of the first member in a zip local file header."""
+    name_len = int.from_bytes(head[26:28], "little")
+    return head[30 : 30 + name_len]
+
+
+def sniff_format(head: bytes, tail: bytes) -> str | None:
+    """Identify a binary format from a file's first and last SNIFF_BYTES bytes.
+
+    Returns the extension that format is read under (".sqlite", ".xlsx",
+    ".xls", ".parquet", ".arrow", ".dbf"), ".zip" for any other zip
+    archive, or None for anything else, including text formats.
+    """
+    for magic, ext in _MAGIC:
+        if head.startswith(magic):
+            if ext == ".xlsx" and not _zip_first_entry(head).startswith(_OOXML_ENTRIES):
+                return ".zip"
+            if ext == ".parquet" and not _looks_like_parquet(head, tail):
+                continue
+            return ext
+    if _looks_like_dbf(head):
+        return ".dbf"
+    return None
+
+
+def check_content(filename: str, head: bytes, tail: bytes) -> tuple[str | None, str | None]:
+    """Reconcile a file's extension with its leading (and trailing) bytes.
+
+    Returns (extension to read the file under, error message). A binary
+    signature wins over the name, so a misnamed SQLite or XLSX file still
+    goes to the right reader. A binary extension without its signature,
+    or text containing NUL bytes, is rejected before any parsing.
+    """
+    declared = Path(filename).suffix.lower()
+    declared_fmt = EXTENSION_MAP.get(declared)
+    sniffed = sniff_format(head, tail)
+    if sniffed == ".zip" and declared == ".xlsx":
+        sniffed = ".xlsx"  # OOXML whose first member is unusual; let the reader decide
+    if sniffed in EXTENSION_MAP:
+        fmt = EXTENSION_MAP[sniffed]
+        # .xls and .xlsx share a format but not a reader
+        if sniffed == declared or (fmt == declared_fmt and fmt != "excel"):
+            return declared, None
+        return sniffed, None
+    if sniffed or declared_fmt in BINARY_FORMATS or b"\x00" in head:
+        return None, f"File content does not match its {declared} extension."
+    return declared, None
+
+
 def resolve_target(target: str) -> str | None:
     """Resolve a target format string (including aliases) to canonical name."""
     return TARGET_ALIASES.get(target.lower())
 
 
+# Dialect markers, looked up in one pass over the upper-cased head of a dump.
+# A marker mapped to None only keeps a shorter one from matching inside it.
+_DIALECT_MARKERS: dict[str, str | None] = {
+    "AUTO_INCREMENT": "mysql",
+    "ENGINE=INNODB": "mysql",
+    "ENGINE=MYISAM": "mysql",
+    "SERIAL": "postgresql",  # also BIGSERIAL, SMALLSERIAL
+    "SERIALIZABLE": None,
+    "SET SEARCH_PATH": "postgresql",
+    "IDENTITY(": "tsql",
+    "NVARCHAR": "tsql",
+    "\nGO\n": "tsql",
+    "\nGO\r\n": "tsql",
+    "AUTOINCREMENT": "sqlite",
+    "SQLITE": "sqlite_name",
+}
+
+# Longest first, so a marker wins over its own prefix
+_DIALECT_RE = re.compile(
+    "|".join(re.escape(m) for m in sorted(_DIALECT_MARKERS, key=len, reverse=True))
+)
+
+# Checked in this order when a dump has markers of several dialects
+_DIALECT_ORDER = ("mysql", "postgresql", "tsql")
+
+
 def detect_sql_dialect(content: str) -> str:
     """Guess SQL dialect from dump content."""
-    upper = content[:5000].upper()
-
-    if "AUTO_INCREMENT" in upper or "ENGINE=INNODB" in upper or "ENGINE=MYISAM" in upper:
-        return "mysql"
-    if "SERIAL" in upper or "BIGSERIAL" in upper or "SET search_path" in upper:
-        return "postgresql"
-    if "IDENTITY(" in upper or "NVARCHAR" in upper or "GO\n" in content[:5000]:
-        return "tsql"
-    if "AUTOINCREMENT" in upper and "SQLITE" not in upper:
+    found = {_DIALECT_MARKERS[m] for m in _DIALECT_RE.findall(content[:5000].upper())}
+
+    for dialect in _DIALECT_ORDER:
+        if dialect in found:
+            return dialect
+    if "sqlite" in found and "sqlite_name" not in found:
         return "sqlite"
 
     # Default to mysql as most common dump format
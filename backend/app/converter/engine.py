@@ -0,0 +1,333 @@
+"""Run a full conversion (read, write, zip) as one self-contained call.
+
+Everything here is picklable and free of FastAPI state so it can run in a
+worker process; see pool.py.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import multiprocessing
+import os
+import shutil
+import time
+import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from .models import DEFAULT_BATCH_SIZE, ConvertedData, ConvertOptions, TableData
+from .readers import READERS
+from .writers import MERGERS, WRITERS
+
+logger = logging.getLogger(__name__)
+
+
+class ConversionError(Exception):
+    """A conversion failure that maps to an HTTP status code."""
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(status_code, detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+@dataclass
+class ConversionResult:
+    archive_path: Path
+    tables_count: int
+    total_rows: int
+    warnings_count: int
+    archive: str = "zip"  # packaging actually used; see package_output()
+    member: str | None = None  # name of the compressed file for gzip/zstd
+
+
+# File suffix and media type per packaging
+ARCHIVES = {
+    "zip": (".zip", "application/zip"),
+    "gzip": (".gz", "application/gzip"),
+    "zstd": (".zst", "application/zstd"),
+}
+
+# Bytes of a file test-compressed to decide whether deflate is worth it
+COMPRESSION_SAMPLE = 256 * 1024
+
+# Chunk size when compressing a single file
+COMPRESS_CHUNK = 8 * 1024 * 1024
+
+
+def _compressible(path: Path) -> bool:
+    """Whether deflate shrinks the start of path by at least 10%.
+
+    Already-compressed outputs (xlsx, Parquet, compressed Arrow) do not,
+    and are stored in the ZIP as they are.
+    """
+    with open(path, "rb") as f:
+        sample = f.read(COMPRESSION_SAMPLE)
+    return bool(sample) and len(zlib.compress(sample, 1)) < len(sample) * 0.9
+
+
+def _write_zip(zip_path: Path, output_files: list[Path], warnings: list[str], level: int) -> None:
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED, compresslevel=level) as zf:
+        # Add converted files
+        for fp in output_files:
+            deflate = level > 0 and _compressible(fp)
+            zf.write(fp, fp.name, zipfile.ZIP_DEFLATED if deflate else zipfile.ZIP_STORED)
+
+        # Add warnings file if any
+        if warnings:
+            zf.writestr("_warnings.txt", "\n".join(warnings))
+
+
+def _write_gzip(path: Path, src: Path, level: int) -> None:
+    with open(src, "rb") as fin, open(path, "wb") as raw:
+        # Keep the output's own name in the gzip header
+        with gzip.GzipFile(src.name, "wb", level, raw) as out:
+            shutil.copyfileobj(fin, out, COMPRESS_CHUNK)
+
+
+def _write_zstd(path: Path, src: Path, level: int) -> None:
+    import pyarrow as pa
+
+    codec = pa.Codec("zstd", compression_level=level)
+    with open(src, "rb") as fin, open(path, "wb") as out:
+        # One frame per chunk; zstd decoders read concatenated frames as one stream
+        while chunk := fin.read(COMPRESS_CHUNK):
+            out.write(codec.compress(chunk, asbytes=True))
+
+
+def package_output(
+    output_files: list[Path], warnings: list[str], work_dir: Path, options: ConvertOptions
+) -> tuple[Path, str, str | None]:
+    """Package the converted files as work_dir/result.<suffix>.
+
+    options.archive "gzip" or "zstd" compresses a single output file on its
+    own; with several files or any warnings to include, a ZIP is built
+    instead. Returns (path, packaging used, compressed file name).
+    """
+    archive = options.archive
+    if archive != "zip" and (len(output_files) != 1 or warnings):
+        archive = "zip"
+    path = work_dir / f"result{ARCHIVES[archive][0]}"
+    if archive == "gzip":
+        _write_gzip(path, output_files[0], options.zip_level)
+    elif archive == "zstd":
+        _write_zstd(path, output_files[0], options.zstd_level)
+    else:
+        _write_zip(path, output_files, warnings, options.zip_level)
+    return path, archive, output_files[0].name if archive != "zip" else None
+
+
+class ProgressReporter:
+    """Track rows read and written per table and publish them as a JSON file.
+
+    The file is replaced atomically and at most every `interval` seconds, so
+    another process can poll it while the conversion runs.
+    """
+
+    def __init__(self, path: Path, interval: float = 0.5):
+        self.path = path
+        self.interval = interval
+        self.tables: dict[str, dict[str, int]] = {}
+        self._last_flush = 0.0
+
+    def track(self, data: ConvertedData) -> None:
+        """Wrap every table's row or frame source so batches are counted as they pass."""
+        for table in data.tables:
+            self.tables[table.name] = {"rows_read": 0, "rows_written": 0}
+            if table.frames is not None:
+                table.frames = self._counting_source(table, table.frames)
+            else:
+                table.source = self._counting_source(table, table.source)
+        self.flush(force=True)
+
+    def _counting_source(self, table: TableData, inner):
+        rows = table.rows
+        counts = self.tables[table.name]
+
+        def source():
+            batches = inner() if inner is not None else (
+                rows[i : i + DEFAULT_BATCH_SIZE] for i in range(0, len(rows), DEFAULT_BATCH_SIZE)
+            )
+            counts["rows_read"] = counts["rows_written"] = 0
+            for batch in batches:
+                counts["rows_read"] += len(batch)
+                self.flush()
+                yield batch
+                # The writer asked for more, so the previous batch is written
+                counts["rows_written"] = counts["rows_read"]
+            self.flush(force=True)
+
+        return source
+
+    def flush(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now - self._last_flush < self.interval:
+            return
+        self._last_flush = now
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"tables": self.tables}))
+        os.replace(tmp, self.path)
+
+
+# State handed to forked table workers; see _write_tables_parallel()
+_fork_state: dict = {}
+
+
+def _write_table_part(index: int, part_dir: Path) -> tuple[list[Path], int, dict | None]:
+    """Write one table into part_dir. Runs in a forked table worker.
+
+    Returns (output files, rows written, progress counts).
+    """
+    data: ConvertedData = _fork_state["data"]
+    progress: ProgressReporter | None = _fork_state["progress"]
+    table = data.tables[index]
+    counts = None
+    if progress:
+        # Publish this table only, next to the parent's progress file. A
+        # worker runs several tables, so start from the state at fork time.
+        counts = _fork_state["progress_tables"][table.name]
+        progress.tables = {table.name: counts}
+        progress.path = _fork_state["progress_path"].with_suffix(f".{index}.json")
+
+    part_dir.mkdir()
+    writer = WRITERS[_fork_state["target"]]
+    files = writer(
+        ConvertedData(tables=[table], source_format=data.source_format),
+        part_dir,
+        _fork_state["options"],
+    )
+    if progress:
+        progress.flush(force=True)
+    return files, table.row_count, counts
+
+
+def _write_tables_parallel(
+    data: ConvertedData,
+    target: str,
+    output_dir: Path,
+    options: ConvertOptions,
+    progress: ProgressReporter | None,
+) -> list[Path]:
+    """Write every table in its own process, then assemble the output in table order.
+
+    Table sources are closures, so table workers are forked and inherit
+    `data` rather than receiving it pickled. run_conversion() itself runs in
+    a single-threaded pool worker, where forking is safe.
+    """
+    parts_dir = output_dir / ".parts"
+    parts_dir.mkdir()
+    _fork_state.update(data=data, target=target, options=options, progress=progress)
+    if progress:
+        _fork_state.update(progress_tables=progress.tables, progress_path=progress.path)
+    executor = ProcessPoolExecutor(
+        max_workers=min(options.table_workers, len(data.tables)),
+        mp_context=multiprocessing.get_context("fork"),
+    )
+    try:
+        futures = [
+            executor.submit(_write_table_part, i, parts_dir / str(i))
+            for i in range(len(data.tables))
+        ]
+        results = [future.result() for future in futures]
+    finally:
+        executor.shutdown(cancel_futures=True)
+        _fork_state.clear()
+
+    for index, (table, (_, row_count, counts)) in enumerate(zip(data.tables, results)):
+        table.row_count = row_count
+        if progress:
+            progress.tables[table.name] = counts
+            progress.path.with_suffix(f".{index}.json").unlink(missing_ok=True)
+
+    parts = [files for files, _, _ in results]
+    merge = MERGERS.get(target)
+    if merge:
+        output_files = merge(parts, output_dir)
+    else:
+        # One file per table; on a name clash the later table wins, as when
+        # tables are written one after another
+        moved: dict[str, Path] = {}
+        for files in parts:
+            for fp in files:
+                dest = output_dir / fp.name
+                os.replace(fp, dest)
+                moved[fp.name] = dest
+        output_files = list(moved.values())
+
+    shutil.rmtree(parts_dir, ignore_errors=True)
+    return output_files
+
+
+def run_conversion(
+    input_path: Path,
+    source_fmt: str,
+    target: str,
+    work_dir: Path,
+    options: ConvertOptions,
+    progress_path: Path | None = None,
+) -> ConversionResult:
+    """Convert input_path to target and package the output in work_dir.
+
+    When progress_path is given, per-table row counts are published there
+    while the conversion runs (see ProgressReporter). With more than one
+    table, options.table_workers > 1 and an input of at least
+    options.parallel_min_bytes, tables are written concurrently.
+    """
+    # Read source
+    reader = READERS.get(source_fmt)
+    if not reader:
+        raise ConversionError(500, f"No reader for format: {source_fmt}")
+
+    try:
+        data: ConvertedData = reader(input_path, batch_size=options.batch_size)
+    except Exception as exc:
+        logger.error("Reader error for %s: %s", source_fmt, exc)
+        raise ConversionError(422, f"Failed to parse {input_path.name}: {exc}")
+
+    if not data.tables:
+        raise ConversionError(422, "No tables found in the uploaded file.")
+
+    progress = ProgressReporter(progress_path) if progress_path else None
+    if progress:
+        progress.track(data)
+
+    # Write to target
+    writer = WRITERS.get(target)
+    if not writer:
+        raise ConversionError(500, f"No writer for format: {target}")
+
+    output_dir = work_dir / "output"
+    output_dir.mkdir()
+
+    parallel = (
+        options.table_workers > 1
+        and len(data.tables) > 1
+        and input_path.stat().st_size >= options.parallel_min_bytes
+        and "fork" in multiprocessing.get_all_start_methods()
+    )
+    try:
+        if parallel:
+            output_files = _write_tables_parallel(data, target, output_dir, options, progress)
+        else:
+            output_files = writer(data, output_dir, options)
+    except Exception as exc:
+        logger.error("Writer error for %s: %s", target, exc)
+        raise ConversionError(422, f"Failed to convert to {target}: {exc}")
+
+    archive_path, archive, member = package_output(output_files, data.warnings, work_dir, options)
+
+    if progress:
+        progress.flush(force=True)
+
+    return ConversionResult(
+        archive_path=archive_path,
+        tables_count=len(data.tables),
+        total_rows=data.total_rows,
+        warnings_count=len(data.warnings),
+        archive=archive,
+        member=member,
+    )
@@ -0,0 +1,175 @@
+"""Disk-backed store for asynchronous conversion jobs.
+
+Each job lives in its own directory under the jobs root:
+
+    <root>/<job_id>/job.json           status and metadata
+    <root>/<job_id>/progress.json      per-table row counts, written by the worker
+    <root>/<job_id>/progress.<n>.json  counts for table n while tables are written in parallel
+    <root>/<job_id>/result.<suffix>    converted output once completed (.zip, .gz or .zst)
+
+Keeping state on disk lets any API worker process answer status and
+download requests. A job gets its expiry time only once it completes or
+fails, so queued and running jobs are not purged from under their worker.
+Jobs a restart cut off are failed at startup (fail_unfinished), and an
+unfinished job older than max_runtime_seconds is purged regardless.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import time
+import uuid
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+
+class JobStore:
+    def __init__(self, root: Path, ttl_seconds: int, max_runtime_seconds: int):
+        self.root = root
+        self.ttl_seconds = ttl_seconds
+        self.max_runtime_seconds = max_runtime_seconds
+
+    def create(self, **meta) -> tuple[str, Path]:
+        """Create a new queued job and return (job_id, job_dir)."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        job_id = uuid.uuid4().hex
+        job_dir = self.root / job_id
+        job_dir.mkdir()
+        now = time.time()
+        self._write(job_dir, {
+            "id": job_id,
+            "status": JOB_QUEUED,
+            "created_at": now,
+            "expires_at": None,
+            **meta,
+        })
+        return job_id, job_dir
+
+    def job_dir(self, job_id: str) -> Path | None:
+        """Return the directory of an existing job, or None for unknown ids."""
+        # Ids are uuid4 hex; anything else must not reach the filesystem
+        if len(job_id) != 32 or not all(c in "0123456789abcdef" for c in job_id):
+            return None
+        job_dir = self.root / job_id
+        return job_dir if (job_dir / "job.json").exists() else None
+
+    def get(self, job_id: str) -> dict | None:
+        """Return job metadata merged with the latest progress, or None.
+
+        A queued job is reported as running once its worker has started
+        publishing progress.
+        """
+        job_dir = self.job_dir(job_id)
+        if job_dir is None:
+            return None
+        try:
+            job = json.loads((job_dir / "job.json").read_text())
+        except (OSError, ValueError):
+            return None
+        if self._expired(job, time.time()):
+            return None
+        try:
+            job["progress"] = json.loads((job_dir / "progress.json").read_text())
+        except (OSError, ValueError):
+            job["progress"] = {"tables": {}}
+        # Tables written in parallel report through progress.<n>.json
+        for part in sorted(job_dir.glob("progress.*.json")):
+            try:
+                job["progress"]["tables"].update(json.loads(part.read_text())["tables"])
+            except (OSError, ValueError, KeyError):
+                continue
+        if job["status"] == JOB_QUEUED and job["progress"]["tables"]:
+            job["status"] = JOB_RUNNING
+        return job
+
+    def update(self, job_id: str, **changes) -> None:
+        job_dir = self.root / job_id
+        job = json.loads((job_dir / "job.json").read_text())
+        job.update(changes)
+        self._write(job_dir, job)
+
+    def finish(self, job_id: str, **outcome) -> None:
+        """Record a job's terminal outcome and start its TTL."""
+        finished = time.time()
+        self.update(
+            job_id, finished_at=finished, expires_at=finished + self.ttl_seconds, **outcome
+        )
+
+    def fail_unfinished(self, error: str) -> int:
+        """Mark every queued or running job as failed. Returns how many were marked.
+
+        Jobs run inside the API process, so any still unfinished when it
+        starts were cut off by a restart and will never complete. Their
+        uploads and partial output are removed; job.json is kept so polls
+        see the failure until the TTL runs out.
+        """
+        if not self.root.exists():
+            return 0
+        failed = 0
+        for job_dir in self.root.iterdir():
+            try:
+                job = json.loads((job_dir / "job.json").read_text())
+            except (OSError, ValueError):
+                continue
+            if job.get("status") not in (JOB_QUEUED, JOB_RUNNING):
+                continue
+            for path in job_dir.iterdir():
+                if path.name == "job.json":
+                    continue
+                if path.is_dir():
+                    shutil.rmtree(path, ignore_errors=True)
+                else:
+                    path.unlink(missing_ok=True)
+            self.finish(job_dir.name, status=JOB_FAILED, error=error)
+            failed += 1
+        if failed:
+            logger.warning("Marked %d interrupted conversion jobs as failed", failed)
+        return failed
+
+    def purge_expired(self) -> int:
+        """Delete finished job directories past their TTL. Returns how many were removed.
+
+        Queued and running jobs have no expiry yet and are only removed once
+        they are older than max_runtime_seconds.
+        """
+        if not self.root.exists():
+            return 0
+        removed = 0
+        now = time.time()
+        for job_dir in self.root.iterdir():
+            try:
+                expired = self._expired(json.loads((job_dir / "job.json").read_text()), now)
+            except (OSError, ValueError, KeyError):
+                # Half-created or corrupt job: fall back to the directory age
+                try:
+                    expired = job_dir.stat().st_mtime + self.ttl_seconds < now
+                except OSError:
+                    continue
+            if expired:
+                shutil.rmtree(job_dir, ignore_errors=True)
+                removed += 1
+        if removed:
+            logger.info("Purged %d expired conversion jobs", removed)
+        return removed
+
+    def _expired(self, job: dict, now: float) -> bool:
+        if job["status"] not in (JOB_COMPLETED, JOB_FAILED):
+            # A job this old is stuck; its worker is not coming back
+            return job["created_at"] + self.max_runtime_seconds < now
+        expires_at = job.get("expires_at")
+        return expires_at is not None and expires_at < now
+
+    @staticmethod
+    def _write(job_dir: Path, job: dict) -> None:
+        tmp = job_dir / "job.json.tmp"
+        tmp.write_text(json.dumps(job))
+        os.replace(tmp, job_dir / "job.json")
@@ -0,0 +1,87 @@
+"""Upload size limits for the converter endpoints."""
+
+from __future__ import annotations
+
+from fastapi import HTTPException
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+
+from app.core.config import get_settings
+from app.core.security import decode_token
+
+settings = get_settings()
+
+# Room for multipart boundaries and part headers around the file itself
+MULTIPART_OVERHEAD = 64 * 1024
+
+
+def upload_limit(signed_in: bool) -> tuple[int, str]:
+    """Return (max_size, limit message) for an anonymous or signed-in upload."""
+    if signed_in:
+        max_size = settings.converter_max_auth_size
+        return max_size, f"Limit is {max_size // 1024 // 1024}MB."
+    max_size = settings.converter_max_free_size
+    return max_size, (
+        f"Free limit is {max_size // 1024 // 1024}MB. "
+        f"Sign in to convert files up to {settings.converter_max_auth_size // 1024 // 1024}MB."
+    )
+
+
+def _bearer_token_valid(headers: Headers) -> bool:
+    scheme, _, token = headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return False
+    payload = decode_token(token.strip())
+    return payload is not None and payload.get("sub") is not None
+
+
+class UploadLimitMiddleware:
+    """Enforce the upload limit on converter request bodies while they stream in.
+
+    FastAPI parses the whole multipart body, spooling the file to disk,
+    before the endpoint or its dependencies run, so the endpoint's own size
+    check comes too late to stop an oversized upload. This middleware
+    rejects a larger declared Content-Length up front and otherwise counts
+    body bytes as they arrive, failing with 413 once the limit is passed.
+
+    The tier is picked from the bearer token's signature alone; the endpoint
+    still applies the exact per-user limit to the file it receives.
+    """
+
+    def __init__(self, app, paths: set[str]):
+        self.app = app
+        self.paths = paths
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "POST"
+            or scope["path"].rstrip("/") not in self.paths
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        max_size, limit_msg = upload_limit(_bearer_token_valid(headers))
+        allowed = max_size + MULTIPART_OVERHEAD
+
+        declared = headers.get("content-length", "")
+        if declared.isdigit() and int(declared) > allowed:
+            response = JSONResponse({"detail": f"File too large. {limit_msg}"}, status_code=413)
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > allowed:
+                    # Raised inside body parsing, which FastAPI passes through
+                    # to its HTTPException handler
+                    raise HTTPException(413, f"File too large. {limit_msg}")
+            return message
+
+        await self.app(scope, limited_receive, send)
@@ -5,19 +5,152 @@ from __future__ import annotations
 import csv
 import io
 import logging
+import mmap
 import re
 import sqlite3
+from datetime import date
+from decimal import Decimal
 from pathlib import Path
+from typing import Iterator
 
+import numpy as np
 import pandas as pd
 
-from .models import ColumnInfo, ConvertedData, TableData
+from . import sql_dump
+from .models import DEFAULT_BATCH_SIZE, ColumnInfo, ConvertedData, TableData
 
 logger = logging.getLogger(__name__)
 
+# Rows sampled from the top of a text source to infer column types
+TYPE_SAMPLE_ROWS = 1000
+
+_INT_RE = re.compile(r"[+-]?(?:0|[1-9]\d*)")
+_REAL_RE = re.compile(r"[+-]?(?:(?:0|[1-9]\d*)(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?")
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_BOOL_VALUES = {"true", "false", "t", "f", "yes", "no", "y", "n"}
+
+_INT32_MAX = 2**31 - 1
+_INT64_MAX = 2**63 - 1
+
+
+def _infer_column_type(values: list[str]) -> str:
+    """Infer INTEGER/BIGINT/REAL/DATE/BOOLEAN/TEXT from sampled string values.
+
+    Empty strings are ignored (they load as NULL). Numbers with leading
+    zeros stay TEXT so codes like ZIPs keep their formatting.
+    """
+    values = [v.strip() for v in values if v and v.strip()]
+    if not values:
+        return "TEXT"
+
+    if all(_INT_RE.fullmatch(v) for v in values):
+        biggest = max(abs(int(v)) for v in values)
+        if biggest <= _INT32_MAX:
+            return "INTEGER"
+        if biggest <= _INT64_MAX:
+            return "BIGINT"
+        return "TEXT"
+    if all(_REAL_RE.fullmatch(v) for v in values):
+        return "REAL"
+    if all(_DATE_RE.fullmatch(v) for v in values):
+        try:
+            for v in values:
+                date.fromisoformat(v)
+            return "DATE"
+        except ValueError:
+            return "TEXT"
+    if all(v.lower() in _BOOL_VALUES for v in values):
+        return "BOOLEAN"
+    return "TEXT"
+
+
+# Per inferred column type, one value such a column can hold
+_TYPE_FIT_RES = {
+    "INTEGER": re.compile(r"\s*[+-]?[0-9]+\s*"),
+    "BIGINT": re.compile(r"\s*[+-]?[0-9]+\s*"),
+    "REAL": re.compile(r"\s*[+-]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?\s*"),
+    "DATE": re.compile(r"\s*[0-9]{4}-[0-9]{2}-[0-9]{2}\s*"),
+    "BOOLEAN": re.compile(r"\s*(?i:" + "|".join(sorted(_BOOL_VALUES)) + r")\s*"),
+}
+
+
+def _value_fits(value: str | None, col_type: str) -> bool:
+    """Whether a column of the given inferred type can hold value (None and blanks fit)."""
+    if not value or value.isspace():
+        return True
+    if not _TYPE_FIT_RES[col_type].fullmatch(value):
+        return False
+    if col_type == "INTEGER":
+        return abs(int(value)) <= _INT32_MAX
+    if col_type == "BIGINT":
+        return abs(int(value)) <= _INT64_MAX
+    if col_type == "DATE":
+        try:
+            date.fromisoformat(value.strip())
+        except ValueError:
+            return False
+    return True
+
+
+def _plain_values_fit(values: list, col_type: str) -> bool:
+    """Fast whole-column version of _value_fits for values in their usual form.
+
+    Runs in C over the column at once. False means the values need checking
+    one by one, not that one of them does not fit.
+    """
+    present = [v for v in values if v]
+    if not present:
+        return True
+    if col_type in ("INTEGER", "BIGINT"):
+        # Digits once leading signs are gone, none left empty, and short enough
+        unsigned = ("\0" + "\0".join(present) + "\0").replace("\0-", "\0").replace("\0+", "\0")
+        digits = unsigned.replace("\0", "")
+        return (
+            "\0\0" not in unsigned
+            and digits.isascii() and digits.isdigit()
+            and max(map(len, present)) <= (9 if col_type == "INTEGER" else 18)
+        )
+    if col_type == "REAL":
+        # pandas parses floats in C, but also takes nan, inf and 1_000: rule those out
+        joined = "".join(present)
+        if not joined.isascii() or any(c in joined for c in "nNiI_"):
+            return False
+        try:
+            pd.Series(present, dtype=object).astype(np.float64)
+        except ValueError:
+            return False
+        return True
+    distinct = set(present)
+    if col_type == "DATE":
+        # All YYYY-MM-DD: 10 characters each, dashes at 4 and 7, digits elsewhere
+        joined = "".join(distinct)
+        if len(joined) != 10 * len(distinct) or joined[4::10] + joined[7::10] != "--" * len(distinct):
+            return False
+        digits = joined.replace("-", "")
+        if not (digits.isascii() and digits.isdigit()):
+            return False
+        try:
+            np.array(list(distinct), dtype="datetime64[D]")  # rejects 2024-02-30
+        except ValueError:
+            return False
+        return True
+    return all(_value_fits(v, col_type) for v in distinct)
+
+
+def _first_misfit(values: list, col_type: str) -> int | None:
+    """Index of the first value a column of col_type cannot hold, or None if all fit."""
+    if _plain_values_fit(values, col_type):
+        return None
+    return next((i for i, v in enumerate(values) if not _value_fits(v, col_type)), None)
+
 
-def read_csv(file_path: Path) -> ConvertedData:
-    """Read a CSV/TSV file into ConvertedData (single table)."""
+def read_csv(file_path: Path, batch_size: int = DEFAULT_BATCH_SIZE) -> ConvertedData:
+    """Read a CSV/TSV file into ConvertedData (single table, streamed in batches).
+
+    Column types are inferred from the first TYPE_SAMPLE_ROWS rows. The first
+    full pass checks the remaining rows against them and adds a warning for
+    each column holding a value its type does not allow.
+    """
     # Detect delimiter
     with open(file_path, "r", encoding="utf-8-sig", errors="replace") as f:
         sample = f.read(4096)
@@ -27,200 +160,680 @@ def read_csv(file_path: Path) -> ConvertedData:
     except csv.Error:
         delimiter = ","
 
-    df = pd.read_csv(file_path, delimiter=delimiter, dtype=str, keep_default_na=False)
-    table_name = file_path.stem.replace(" ", "_").replace("-", "_")
-
-    columns = [ColumnInfo(name=str(c), type="TEXT") for c in df.columns]
-    rows = df.values.tolist()
+    read_opts = dict(delimiter=delimiter, dtype=str, keep_default_na=False)
 
-    return ConvertedData(
-        tables=[TableData(name=table_name, columns=columns, rows=rows)],
+    # Infer column types from a sample at the top of the file
+    sample_df = pd.read_csv(file_path, nrows=TYPE_SAMPLE_ROWS, **read_opts)
+    table_name = file_path.stem.replace(" ", "_").replace("-", "_")
+    columns = [
+        ColumnInfo(name=str(c), type=_infer_column_type(sample_df.iloc[:, i].tolist()))
+        for i, c in enumerate(sample_df.columns)
+    ]
+    del sample_df
+
+    # Empty cells in typed columns must load as NULL, not ''
+    typed = [i for i, col in enumerate(columns) if col.type != "TEXT"]
+    data = ConvertedData(
+        tables=[TableData(name=table_name, columns=columns)],
         source_format="csv",
     )
+    unchecked = set(typed)  # typed columns not yet checked past the sample
+
+    def frames() -> Iterator[pd.DataFrame]:
+        check = set(unchecked)
+        with pd.read_csv(file_path, chunksize=batch_size, **read_opts) as chunks:
+            for df in chunks:
+                for i in typed:
+                    col = df.iloc[:, i]
+                    df.isetitem(i, col.where(col != "", None))
+                    if i in check and df.index[-1] >= TYPE_SAMPLE_ROWS:
+                        misfit = _first_misfit(col.tolist(), columns[i].type)
+                        if misfit is not None:
+                            check.discard(i)
+                            unchecked.discard(i)
+                            data.warnings.append(
+                                f"{table_name}: column {columns[i].name!r} was typed "
+                                f"{columns[i].type} from the first {TYPE_SAMPLE_ROWS} rows, "
+                                f"but row {df.index[misfit] + 1} holds {col.iloc[misfit]!r}; "
+                                "SQL targets may reject it."
+                            )
+                yield df
+        # A full pass has seen every row
+        unchecked.clear()
+
+    data.tables[0].frames = frames
+    return data
+
+
+def read_excel(file_path: Path, batch_size: int = DEFAULT_BATCH_SIZE) -> ConvertedData:
+    """Read an Excel file (XLS/XLSX) into ConvertedData (one table per sheet).
+
+    XLSX sheets are streamed row by row with openpyxl's read-only mode.
+    Legacy XLS files are parsed one sheet at a time when the writer asks
+    for it.
+    """
+    if file_path.suffix.lower() == ".xls":
+        return _read_xls(file_path, batch_size)
+
+    from openpyxl import load_workbook
+
+    wb = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        headers = {ws.title: _xlsx_sheet_header(ws) for ws in wb.worksheets}
+    finally:
+        wb.close()
 
+    tables = []
+    for sheet_name, header in headers.items():
+        if header is None:
+            continue
+        names = _excel_column_names(header)
+        tables.append(TableData(
+            name=re.sub(r"[^a-zA-Z0-9_]", "_", sheet_name).strip("_"),
+            columns=[ColumnInfo(name=n, type="TEXT") for n in names],
+            frames=_xlsx_sheet_frames(file_path, sheet_name, names, batch_size),
+        ))
+
+    return ConvertedData(tables=tables, source_format="excel")
 
-def read_excel(file_path: Path) -> ConvertedData:
-    """Read an Excel file (XLS/XLSX) into ConvertedData (one table per sheet)."""
-    ext = file_path.suffix.lower()
-    engine = "xlrd" if ext == ".xls" else "openpyxl"
 
-    xls = pd.ExcelFile(file_path, engine=engine)
-    tables = []
+def _excel_cell_text(value) -> str:
+    """Render a cell value as text, the way pandas does with dtype=str."""
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
 
-    for sheet_name in xls.sheet_names:
-        df = xls.parse(sheet_name, dtype=str, keep_default_na=False)
-        if df.empty:
+def _is_blank_row(row: tuple) -> bool:
+    return all(v is None or v == "" for v in row)
+
+
+def _xlsx_sheet_header(ws) -> tuple | None:
+    """Return a sheet's header row, or None if the sheet has no data rows."""
+    rows = ws.iter_rows(values_only=True)
+    header = next(rows, None)
+    if header is None or _is_blank_row(header):
+        return None
+    if not any(not _is_blank_row(row) for row in rows):
+        return None
+    # Drop empty trailing header cells
+    width = max(i for i, v in enumerate(header) if v is not None and v != "") + 1
+    return header[:width]
+
+
+def _excel_column_names(header: tuple) -> list[str]:
+    """Name columns like pandas: "Unnamed: i" for blanks, ".1" suffixes for duplicates."""
+    names: list[str] = []
+    seen: dict[str, int] = {}
+    for i, value in enumerate(header):
+        name = _excel_cell_text(value) or f"Unnamed: {i}"
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        seen.setdefault(name, 0)
+        names.append(name)
+    return names
+
+
+def _xlsx_sheet_frames(file_path: Path, sheet_name: str, names: list[str], batch_size: int):
+    def frames() -> Iterator[pd.DataFrame]:
+        from openpyxl import load_workbook
+
+        ncols = len(names)
+        wb = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            batch: list[list] = []
+            blank = 0  # blank rows are kept only if data follows them
+            for row in wb[sheet_name].iter_rows(min_row=2, values_only=True):
+                if _is_blank_row(row):
+                    blank += 1
+                    continue
+                if blank:
+                    batch.extend([""] * ncols for _ in range(blank))
+                    blank = 0
+                values = [_excel_cell_text(v) for v in row[:ncols]]
+                if len(values) < ncols:
+                    values.extend([""] * (ncols - len(values)))
+                batch.append(values)
+                if len(batch) >= batch_size:
+                    yield pd.DataFrame(batch, columns=names, dtype=object)
+                    batch = []
+            if batch:
+                yield pd.DataFrame(batch, columns=names, dtype=object)
+        finally:
+            wb.close()
+
+    return frames
+
+
+def _read_xls(file_path: Path, batch_size: int) -> ConvertedData:
+    with pd.ExcelFile(file_path, engine="xlrd") as xls:
+        sheet_names = list(xls.sheet_names)
+        # Header plus one row: enough to learn the columns and skip empty sheets
+        heads = {
+            name: xls.parse(name, dtype=str, keep_default_na=False, nrows=1)
+            for name in sheet_names
+        }
+
+    tables = []
+    for sheet_name in sheet_names:
+        header = heads[sheet_name]
+        if header.empty:
             continue
         safe_name = re.sub(r"[^a-zA-Z0-9_]", "_", sheet_name).strip("_")
-        columns = [ColumnInfo(name=str(c), type="TEXT") for c in df.columns]
-        rows = df.values.tolist()
-        tables.append(TableData(name=safe_name, columns=columns, rows=rows))
+        columns = [ColumnInfo(name=str(c), type="TEXT") for c in header.columns]
+        tables.append(TableData(
+            name=safe_name,
+            columns=columns,
+            frames=_xls_sheet_frames(file_path, sheet_name, batch_size),
+        ))
 
     return ConvertedData(tables=tables, source_format="excel")
 
 
-def read_sqlite(file_path: Path) -> ConvertedData:
-    """Read a SQLite database file into ConvertedData."""
-    conn = sqlite3.connect(str(file_path))
-    conn.row_factory = sqlite3.Row
+def _xls_sheet_frames(file_path: Path, sheet_name: str, batch_size: int):
+    def frames() -> Iterator[pd.DataFrame]:
+        # XLS sheets are capped at 65,536 rows, so parsing one whole is fine
+        df = pd.read_excel(
+            file_path, sheet_name=sheet_name, engine="xlrd", dtype=str, keep_default_na=False,
+        )
+        for i in range(0, len(df), batch_size):
+            yield df.iloc[i : i + batch_size]
+
+    return frames
+
+
+def _connect_sqlite_readonly(file_path: Path) -> sqlite3.Connection:
+    """Open an uploaded database read-only.
+
+    immutable=1 tells SQLite the file cannot change, so it skips locking and
+    change detection; the upload is never modified while we read it.
+    """
+    uri = file_path.resolve().as_uri() + "?mode=ro&immutable=1"
+    return sqlite3.connect(uri, uri=True)
+
+
+def read_sqlite(file_path: Path, batch_size: int = DEFAULT_BATCH_SIZE) -> ConvertedData:
+    """Read a SQLite database file into ConvertedData.
+
+    Only table metadata is read here; each table's rows are streamed in
+    fetchmany batches of batch_size when a writer asks for them.
+    """
+    conn = _connect_sqlite_readonly(file_path)
     cursor = conn.cursor()
 
-    # Get all user tables
+    # Get all user tables with their original DDL
     cursor.execute(
-        "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
+        "SELECT name, sql FROM sqlite_master "
+        "WHERE type='table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
     )
-    table_names = [row[0] for row in cursor.fetchall()]
+    table_defs = cursor.fetchall()
 
     tables = []
     warnings = []
 
-    for tname in table_names:
+    for tname, ddl in table_defs:
         # Get column info
         cursor.execute(f"PRAGMA table_info(\"{tname}\")")
         col_info = cursor.fetchall()
         columns = [ColumnInfo(name=ci[1], type=ci[2] or "TEXT") for ci in col_info]
 
-        # Get rows
-        cursor.execute(f"SELECT * FROM \"{tname}\"")
-        rows = [list(row) for row in cursor.fetchall()]
-
-        # Get original DDL
-        cursor.execute(f"SELECT sql FROM sqlite_master WHERE type='table' AND name=?", (tname,))
-        ddl_row = cursor.fetchone()
-        ddl = ddl_row[0] if ddl_row else None
-
-        tables.append(TableData(name=tname, columns=columns, rows=rows, ddl=ddl))
+        tables.append(TableData(
+            name=tname,
+            columns=columns,
+            ddl=ddl,
+            frames=_sqlite_table_frames(file_path, tname, [c.name for c in columns], batch_size),
+        ))
 
     conn.close()
     return ConvertedData(tables=tables, source_format="sqlite", warnings=warnings)
 
 
-def read_sql(file_path: Path) -> ConvertedData:
-    """Read a SQL dump file, parse DDL and INSERT statements."""
+def _sqlite_table_frames(file_path: Path, tname: str, names: list[str], batch_size: int):
+    def frames() -> Iterator[pd.DataFrame]:
+        conn = _connect_sqlite_readonly(file_path)
+        try:
+            cursor = conn.execute(f"SELECT * FROM \"{tname}\"")
+            while True:
+                batch = cursor.fetchmany(batch_size)
+                if not batch:
+                    break
+                # Object columns keep SQLite's values as they are (no int -> float
+                # on NULL). Typing lossless columns as int64/float64 per batch cost
+                # 2-3x this constructor and did not pay off in any writer.
+                yield pd.DataFrame(batch, columns=names, dtype=object)
+        finally:
+            conn.close()
+
+    return frames
+
+
+def read_sql(file_path: Path, batch_size: int = DEFAULT_BATCH_SIZE) -> ConvertedData:
+    """Read a SQL dump file, parse DDL and INSERT/COPY data.
+
+    The dump is indexed in one streaming pass; each table's rows are then
+    parsed from its own byte ranges only when a writer asks for them.
+    """
     from .detect import detect_sql_dialect
 
-    content = file_path.read_text(encoding="utf-8", errors="replace")
-    dialect = detect_sql_dialect(content)
+    with open(file_path, "rb") as f:
+        head = f.read(8192).decode("utf-8", errors="replace")
+    dialect = detect_sql_dialect(head)
+    # Only MySQL dumps use backslash escapes inside strings
+    mysql = dialect == "mysql"
+
+    with open(file_path, "rb") as f:
+        dump_tables = sql_dump.index_dump(f, mysql=mysql)
 
-    tables: dict[str, TableData] = {}
     warnings = []
+    if not dump_tables:
+        warnings.append("No CREATE TABLE or INSERT statements found in SQL file.")
+
+    tables = [
+        TableData(
+            name=t.name,
+            columns=t.columns,
+            ddl=t.ddl,
+            source=_sql_table_source(file_path, t, batch_size, mysql),
+        )
+        for t in dump_tables
+    ]
 
-    # Parse CREATE TABLE statements
-    create_pattern = re.compile(
-        r"CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?[`\"\[]?(\w+)[`\"\]]?\s*\((.*?)\)\s*[;)]",
-        re.IGNORECASE | re.DOTALL,
+    return ConvertedData(
+        tables=tables,
+        source_format=f"sql:{dialect}",
+        warnings=warnings,
     )
 
-    for match in create_pattern.finditer(content):
-        tname = match.group(1)
-        body = match.group(2)
 
-        columns = []
-        for line in body.split("\n"):
-            line = line.strip().rstrip(",")
-            if not line:
-                continue
-            # Skip constraints, indexes, keys
-            upper = line.upper().lstrip()
-            if any(upper.startswith(kw) for kw in (
-                "PRIMARY", "KEY", "INDEX", "UNIQUE", "CONSTRAINT", "CHECK", "FOREIGN",
-            )):
-                continue
+def _sql_table_source(file_path: Path, table: sql_dump.DumpTable, batch_size: int, mysql: bool):
+    def source() -> Iterator[list[list]]:
+        with open(file_path, "rb") as f:
+            yield from sql_dump.iter_table_rows(f, table, batch_size, mysql=mysql)
 
-            # Parse column: name type [rest]
-            col_match = re.match(r"[`\"\[]?(\w+)[`\"\]]?\s+(\w[\w(),.]*)", line)
-            if col_match:
-                columns.append(ColumnInfo(name=col_match.group(1), type=col_match.group(2)))
+    return source
 
-        tables[tname] = TableData(
-            name=tname, columns=columns, rows=[], ddl=match.group(0)
-        )
 
-    # Parse INSERT statements
-    insert_pattern = re.compile(
-        r"INSERT\s+INTO\s+[`\"\[]?(\w+)[`\"\]]?\s*(?:\([^)]*\)\s*)?VALUES\s*(.*?);",
-        re.IGNORECASE | re.DOTALL,
+# Multi-byte code pages; any other DBF code page decodes one byte per character
+_DBF_MULTIBYTE = {"utf-8", "cp932", "cp936", "cp949", "cp950"}
+
+_DBF_LOGICAL = {
+    b"T": True, b"t": True, b"Y": True, b"y": True,
+    b"F": False, b"f": False, b"N": False, b"n": False,
+    b"?": None, b" ": None, b"": None,
+}
+
+
+def _dbf_encoding(language_driver: int) -> str:
+    """Code page named by the header's language driver byte (offset 29).
+
+    Files that leave it at 0 or use an unknown ID are read as UTF-8.
+    """
+    from dbfread.codepages import guess_encoding
+
+    if language_driver:
+        try:
+            return guess_encoding(language_driver)
+        except LookupError:
+            pass
+    return "utf-8"
+
+
+def _dbf_record_dtype(dbf) -> tuple[np.dtype, list[str]]:
+    """Structured dtype laying out one record, plus a kind per field.
+
+    Kinds "text", "number", "decimal", "float", "date", "logical", "int",
+    "double", "currency" and "timestamp" are decoded in bulk; "parse" goes
+    through dbfread's field parser.
+    """
+    names, formats, offsets, kinds = ["flag"], ["S1"], [0], []
+    offset = 1
+    for i, f in enumerate(dbf.fields):
+        if f.type in "CV":
+            kind, fmt = "text", f"S{f.length}"
+        elif f.type == "N":
+            kind, fmt = "decimal" if f.decimal_count else "number", f"S{f.length}"
+        elif f.type == "F":
+            kind, fmt = "float", f"S{f.length}"
+        elif f.type == "D" and f.length == 8:
+            kind, fmt = "date", "S8"
+        elif f.type == "L" and f.length == 1:
+            kind, fmt = "logical", "S1"
+        elif f.type in "I+" and f.length == 4:
+            kind, fmt = "int", "<i4"
+        elif f.type == "O" and f.length == 8:
+            kind, fmt = "double", "<f8"
+        elif f.type == "B" and f.length == 8 and dbf.header.dbversion in (0x30, 0x31, 0x32):
+            # Visual FoxPro double; in dBase, B is a memo
+            kind, fmt = "double", "<f8"
+        elif f.type == "Y" and f.length == 8:
+            kind, fmt = "currency", "<i8"
+        elif f.type in "T@" and f.length == 8:
+            kind, fmt = "timestamp", "<u4,<u4"
+        else:
+            kind, fmt = "parse", f"V{f.length}"
+        names.append(f"f{i}")
+        formats.append(fmt)
+        offsets.append(offset)
+        kinds.append(kind)
+        offset += f.length
+    dtype = np.dtype({
+        "names": names, "formats": formats, "offsets": offsets,
+        "itemsize": max(dbf.header.recordlen, offset),
+    })
+    return dtype, kinds
+
+
+def _dbf_text(values: np.ndarray, encoding: str, errors: str) -> list:
+    """Decode a fixed-width character column, trimming trailing blanks and NULs."""
+    width = values.dtype.itemsize
+    if encoding not in _DBF_MULTIBYTE and width:
+        # One byte per character: decode the whole column in one call, then slice
+        text = values.tobytes().decode(encoding, errors)
+        return [text[i : i + width].rstrip("\0 ") for i in range(0, len(text), width)]
+    return [v.rstrip(b"\0 ").decode(encoding, errors) for v in values.tolist()]
+
+
+def _dbf_number(value: bytes):
+    value = value.strip().strip(b"*")
+    try:
+        return int(value)
+    except ValueError:
+        if not value.strip():
+            return None
+        return float(value.replace(b",", b"."))
+
+
+def _dbf_float(value: bytes):
+    value = value.strip().strip(b"*")
+    return float(value) if value else None
+
+
+def _dbf_numbers(values: list[bytes], kind: str) -> list:
+    """Parse a numeric column the way dbfread does, in one pass when the
+    column is clean and per value (blanks, "*" padding, "," decimals) otherwise."""
+    try:
+        if kind == "float":
+            return [float(v) for v in values]
+        if kind == "decimal":
+            # int() would reject these anyway, so go straight to float()
+            return [float(v) if b"." in v else int(v) for v in values]
+        return [int(v) for v in values]
+    except ValueError:
+        parse = _dbf_float if kind == "float" else _dbf_number
+        return [parse(v) for v in values]
+
+
+def _dbf_dates(values: list[bytes], cache: dict) -> list:
+    out = []
+    for v in values:
+        d = cache.get(v, cache)
+        if d is cache:
+            try:
+                d = date(int(v[:4]), int(v[4:6]), int(v[6:8]))
+            except ValueError:
+                if v.strip(b" 0"):
+                    raise ValueError(f"invalid date {v!r}")
+                d = None
+            cache[v] = d
+        out.append(d)
+    return out
+
+
+def _dbf_logicals(values: list[bytes]) -> list:
+    try:
+        return [_DBF_LOGICAL[v] for v in values]
+    except KeyError as exc:
+        raise ValueError(f"Illegal value for logical field: {exc.args[0]!r}")
+
+
+# Julian day number of 0001-01-01, the first proleptic Gregorian ordinal
+_JULIAN_DAY_ORDINAL_1 = 1721426
+
+
+def _dbf_timestamps(values: np.ndarray, parse) -> list:
+    """Decode (Julian day, milliseconds) pairs; day 0 is NULL.
+
+    Values whose day is out of range (blank or corrupt fields) are left to
+    parse, dbfread's per-value parser.
+    """
+    day = values["f0"].astype(np.int64)
+    msec = values["f1"].astype(np.int64)
+    ordinal = day - (_JULIAN_DAY_ORDINAL_1 - 1)
+    valid = (ordinal >= 1) & (ordinal <= date.max.toordinal())
+    stamps = (
+        np.datetime64("0001-01-01", "ms")
+        + (np.where(valid, ordinal, 1) - 1).astype("m8[D]")
+        + msec.astype("m8[ms]")
     )
+    out = stamps.astype("M8[us]").tolist()
+    for i in np.flatnonzero(~valid).tolist():
+        out[i] = None if day[i] == 0 else parse(values[i].tobytes())
+    return out
+
 
-    for match in insert_pattern.finditer(content):
-        tname = match.group(1)
-        values_str = match.group(2)
+def read_dbf(file_path: Path, batch_size: int = DEFAULT_BATCH_SIZE) -> ConvertedData:
+    """Read a DBF (DBase/FoxPro) file into ConvertedData.
 
-        if tname not in tables:
-            tables[tname] = TableData(name=tname, columns=[], rows=[])
+    The code page comes from the header's language driver byte. Records are
+    decoded a batch of columns at a time from a memory-mapped file; memo
+    fields are read from a .fpt/.dbt file next to the table when present.
+    """
+    from dbfread import DBF
+    from dbfread.field_parser import FieldParser
+    from dbfread.memo import FakeMemoFile, open_memofile
+
+    with open(file_path, "rb") as f:
+        f.seek(29)
+        language_driver = f.read(1)
+    encoding = _dbf_encoding(language_driver[0] if language_driver else 0)
+    errors = "replace"
+    dbf = DBF(
+        str(file_path), encoding=encoding, char_decode_errors=errors,
+        ignore_missing_memofile=True,
+    )
 
-        # Parse value tuples
-        tuple_pattern = re.compile(r"\(([^)]*)\)")
-        for tmatch in tuple_pattern.finditer(values_str):
-            raw = tmatch.group(1)
-            # Simple CSV-like parsing of values
-            values = _parse_sql_values(raw)
-            tables[tname].rows.append(values)
+    columns = [ColumnInfo(name=f.name, type=f.type) for f in dbf.fields]
+    names = [f.name for f in dbf.fields]
+    dtype, kinds = _dbf_record_dtype(dbf)
+    header_len = dbf.header.headerlen
 
-    if not tables:
-        warnings.append("No CREATE TABLE or INSERT statements found in SQL file.")
+    warnings = []
+    has_memo = any(
+        f.type in "MGP" or f.type == "B" and kind == "parse"
+        for f, kind in zip(dbf.fields, kinds)
+    )
+    if has_memo and not dbf.memofilename:
+        warnings.append(
+            f"{file_path.name}: memo file (.fpt/.dbt) not found; memo fields are empty."
+        )
+
+    def source() -> Iterator[pd.DataFrame]:
+        memofile = (
+            open_memofile(dbf.memofilename, dbf.header.dbversion)
+            if dbf.memofilename else FakeMemoFile(None)
+        )
+        with open(file_path, "rb") as f, memofile:
+            # Like dbfread, read up to the end-of-file marker rather than
+            # trusting the header's record count
+            size = f.seek(0, 2)
+            count = max(size - header_len, 0) // dtype.itemsize
+            if not count:
+                return
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                yield from frames(mm, count, memofile)
+            finally:
+                try:
+                    mm.close()
+                except BufferError:
+                    pass  # a failed batch still holds a view; unmapped once collected
+
+    def frames(mm, count: int, memofile) -> Iterator[pd.DataFrame]:
+        parser = FieldParser(dbf, memofile)
+        date_cache: dict = {}
+        values = None
+        start = dropped = 0
+        while start < count:
+            records = np.frombuffer(
+                mm, dtype=dtype, count=min(batch_size, count - start),
+                offset=header_len + start * dtype.itemsize,
+            )
+            start += len(records)
+            flags = records["flag"]
+            end = np.flatnonzero(flags == b"\x1a")
+            if len(end):
+                # End-of-file marker before the declared record count
+                records, flags, start = records[: end[0]], flags[: end[0]], count
+            records = records[flags == b" "]  # skip deleted records
+            if not len(records):
+                del records, flags
+                continue
+
+            data = {}
+            for i, (f, kind) in enumerate(zip(dbf.fields, kinds)):
+                values = records[f"f{i}"]
+                if kind == "text":
+                    data[i] = _dbf_text(values, encoding, errors)
+                elif kind in ("int", "double"):
+                    data[i] = values.tolist()
+                elif kind in ("number", "decimal", "float"):
+                    data[i] = _dbf_numbers(values.tolist(), kind)
+                elif kind == "date":
+                    data[i] = _dbf_dates(values.tolist(), date_cache)
+                elif kind == "logical":
+                    data[i] = _dbf_logicals(values.tolist())
+                elif kind == "currency":
+                    # Fixed point with four decimals
+                    data[i] = [Decimal(v) / 10000 for v in values.tolist()]
+                elif kind == "timestamp":
+                    data[i] = _dbf_timestamps(values, lambda raw, f=f: parser.parse(f, raw))
+                else:
+                    data[i] = [parser.parse(f, v.tobytes()) for v in values]
+            n = len(records)
+            # Release the views on the mapping before it can be closed
+            del records, flags, values
+            if hasattr(mm, "madvise"):
+                # Drop the pages already decoded so RSS stays at about one batch
+                done = (header_len + start * dtype.itemsize) // mmap.PAGESIZE * mmap.PAGESIZE
+                if done > dropped:
+                    mm.madvise(mmap.MADV_DONTNEED, dropped, done - dropped)
+                    dropped = done
+
+            # Filling object arrays directly skips pandas' per-element
+            # sequence checks, which are slow for dates and Decimals
+            df = pd.DataFrame({
+                i: np.fromiter(col, dtype=object, count=n) for i, col in data.items()
+            }, dtype=object)
+            df.columns = names
+            yield df
+
+    table_name = file_path.stem.replace(" ", "_").replace("-", "_")
 
     return ConvertedData(
-        tables=list(tables.values()),
-        source_format=f"sql:{dialect}",
+        tables=[TableData(name=table_name, columns=columns, frames=source)],
+        source_format="dbf",
         warnings=warnings,
     )
 
 
-def _parse_sql_values(raw: str) -> list:
-    """Parse a comma-separated SQL values string into a list."""
-    values = []
-    current = ""
-    in_string = False
-    quote_char = None
-
-    for ch in raw:
-        if in_string:
-            if ch == quote_char:
-                in_string = False
-            current += ch
-        elif ch in ("'", '"'):
-            in_string = True
-            quote_char = ch
-            current += ch
-        elif ch == ",":
-            values.append(_clean_sql_value(current.strip()))
-            current = ""
-        else:
-            current += ch
+def _arrow_type_name(arrow_type) -> str:
+    """Map an Arrow data type to a generic column type string."""
+    import pyarrow as pa
+
+    t = pa.types
+    if t.is_boolean(arrow_type):
+        return "BOOLEAN"
+    if t.is_integer(arrow_type):
+        return "BIGINT" if arrow_type.bit_width == 64 else "INTEGER"
+    if t.is_floating(arrow_type):
+        return "DOUBLE" if arrow_type.bit_width == 64 else "REAL"
+    if t.is_decimal(arrow_type):
+        return f"DECIMAL({arrow_type.precision},{arrow_type.scale})"
+    if t.is_date(arrow_type):
+        return "DATE"
+    if t.is_timestamp(arrow_type):
+        return "TIMESTAMP"
+    if t.is_binary(arrow_type) or t.is_large_binary(arrow_type) or t.is_fixed_size_binary(arrow_type):
+        return "BLOB"
+    return "TEXT"
+
+
+def _record_batch_frame(batch) -> pd.DataFrame:
+    """Convert an Arrow RecordBatch to an object-dtype DataFrame of Python values.
+
+    Unlike pandas' own conversion this keeps the declared types: nullable
+    integers stay ints rather than floats, and nulls are None.
+    """
+    df = pd.DataFrame(
+        {i: col.to_pylist() for i, col in enumerate(batch.columns)},
+        index=range(batch.num_rows), dtype=object,
+    )
+    df.columns = batch.schema.names
+    return df
 
-    if current.strip():
-        values.append(_clean_sql_value(current.strip()))
 
-    return values
+def _arrow_columns(schema) -> list[ColumnInfo]:
+    return [ColumnInfo(name=f.name, type=_arrow_type_name(f.type)) for f in schema]
 
 
-def _clean_sql_value(val: str) -> str | None:
-    """Clean a single SQL value."""
-    if val.upper() == "NULL":
-        return None
-    # Strip surrounding quotes
-    if len(val) >= 2 and val[0] == val[-1] and val[0] in ("'", '"'):
-        return val[1:-1].replace("\\'", "'").replace('\\"', '"')
-    return val
+def read_parquet(file_path: Path, batch_size: int = DEFAULT_BATCH_SIZE) -> ConvertedData:
+    """Read a Parquet file into ConvertedData (record batches streamed per row group)."""
+    import pyarrow.parquet as pq
 
+    pf = pq.ParquetFile(file_path)
+    columns = _arrow_columns(pf.schema_arrow)
 
-def read_dbf(file_path: Path) -> ConvertedData:
-    """Read a DBF (DBase/FoxPro) file into ConvertedData."""
-    from dbfread import DBF
+    def frames() -> Iterator[pd.DataFrame]:
+        with pq.ParquetFile(file_path, memory_map=True) as f:
+            for batch in f.iter_batches(batch_size=batch_size):
+                yield _record_batch_frame(batch)
 
-    dbf = DBF(str(file_path), encoding="utf-8", char_decode_errors="replace")
+    pf.close()
+    table_name = file_path.stem.replace(" ", "_").replace("-", "_")
+
+    return ConvertedData(
+        tables=[TableData(name=table_name, columns=columns, frames=frames)],
+        source_format="parquet",
+    )
 
-    columns = [ColumnInfo(name=f.name, type=f.type) for f in dbf.fields]
-    rows = []
-    for record in dbf:
-        rows.append([record.get(f.name) for f in dbf.fields])
+
+def read_arrow(file_path: Path, batch_size: int = DEFAULT_BATCH_SIZE) -> ConvertedData:
+    """Read an Arrow IPC file or stream (Feather v2) into ConvertedData.
+
+    The file is memory-mapped and read one record batch at a time.
+    """
+    import pyarrow as pa
+
+    def open_reader(source):
+        try:
+            return pa.ipc.open_file(source)
+        except pa.ArrowInvalid:
+            # Not the random-access file format: try the streaming format
+            source.seek(0)
+            return pa.ipc.open_stream(source)
+
+    with pa.memory_map(str(file_path)) as mm:
+        columns = _arrow_columns(open_reader(mm).schema)
+
+    def frames() -> Iterator[pd.DataFrame]:
+        with pa.memory_map(str(file_path)) as mm:
+            reader = open_reader(mm)
+            if isinstance(reader, pa.ipc.RecordBatchFileReader):
+                batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+            else:
+                batches = reader
+            for batch in batches:
+                for offset in range(0, batch.num_rows, batch_size):
+                    yield _record_batch_frame(batch.slice(offset, batch_size))
 
     table_name = file_path.stem.replace(" ", "_").replace("-", "_")
 
     return ConvertedData(
-        tables=[TableData(name=table_name, columns=columns, rows=rows)],
-        source_format="dbf",
+        tables=[TableData(name=table_name, columns=columns, frames=frames)],
+        source_format="arrow",
     )
 
 
@@ -231,4 +844,6 @@ READERS = {
     "sqlite": read_sqlite,
     "sql": read_sql,
     "dbf": read_dbf,
+    "parquet": read_parquet,
+    "arrow": read_arrow,
 }
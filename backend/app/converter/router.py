@@ -2,52 +2,147 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
 import shutil
 import tempfile
-import zipfile
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Optional
 
-from fastapi import APIRouter, File, Query, UploadFile, HTTPException
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, File, Query, UploadFile, HTTPException
+from fastapi.responses import FileResponse
+from starlette.background import BackgroundTask
 
+from app.core.config import get_settings
+from app.core.security import get_optional_user
+from app.models import User
+
+from .cache import ResultCache
 from .detect import (
-    MAX_FREE_SIZE,
+    ARCHIVE_FORMATS,
+    EXTENSION_MAP,
+    PG_OUTPUT_MODES,
+    SNIFF_BYTES,
     SUPPORTED_TARGETS,
+    check_content,
     detect_format,
     resolve_target,
 )
-from .models import ConvertedData
+from .engine import ARCHIVES, ConversionError, ConversionResult, run_conversion
+from .jobs import JOB_COMPLETED, JOB_FAILED, JobStore
+from .limits import upload_limit
+from .models import ConvertOptions
+from .pool import ConversionPool, PoolSaturated
 from .readers import READERS
-from .writers import WRITERS
+from .schemas import ConversionJobResponse, ConversionJobResult, TableProgress
 
 logger = logging.getLogger(__name__)
 
+settings = get_settings()
+
 router = APIRouter()
 
+conversion_pool = ConversionPool(
+    max_workers=settings.converter_workers,
+    max_queue=settings.converter_queue_depth,
+)
 
-@router.get("/convert/formats")
-async def list_formats():
-    """Return supported source and target formats."""
-    return {
-        "sources": sorted(READERS.keys()),
-        "targets": sorted(SUPPORTED_TARGETS),
-    }
+job_store = JobStore(
+    root=Path(settings.converter_jobs_dir or Path(tempfile.gettempdir()) / "ltc_convert_jobs"),
+    ttl_seconds=settings.converter_job_ttl,
+    max_runtime_seconds=settings.converter_job_max_runtime,
+)
 
+# Identical conversions are served from disk; a zero budget disables the cache
+result_cache = ResultCache(
+    root=Path(settings.converter_cache_dir or Path(tempfile.gettempdir()) / "ltc_convert_cache"),
+    max_bytes=settings.converter_cache_max_bytes,
+) if settings.converter_cache_max_bytes > 0 else None
+
+# Keep references so running job tasks are not garbage-collected
+_job_tasks: set[asyncio.Task] = set()
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MB
+
+
+async def _save_upload(
+    file: UploadFile, dest: Path, max_size: int, limit_msg: str, digest=None
+) -> int:
+    """Stream an upload to disk in fixed-size chunks, enforcing max_size as it goes.
+
+    When a hashlib object is given as digest, it is fed every chunk.
+    Returns the number of bytes written.
+    """
+    size = 0
+    with open(dest, "wb") as out:
+        while True:
+            chunk = await file.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > max_size:
+                raise HTTPException(413, f"File too large. {limit_msg}")
+            out.write(chunk)
+            if digest is not None:
+                digest.update(chunk)
+    return size
 
-@router.post("/convert")
-async def convert_file(
-    file: UploadFile = File(...),
-    outputFormat: str = Query(..., description="Target format (csv, xlsx, mysql, postgresql, sqlite)"),
-):
-    """Upload a database file and convert it to the target format.
 
-    Returns a ZIP archive with the converted file(s).
+async def _sniff_upload(file: UploadFile) -> tuple[str, str]:
+    """Check an upload's first and last bytes against its extension, before any parsing.
+
+    Returns (source format, file name to save the upload under); the name
+    gets the extension of the detected format when the two disagree.
+    """
+    head = await file.read(SNIFF_BYTES)
+    tail = head
+    if file.size is not None and file.size > SNIFF_BYTES:
+        await file.seek(file.size - SNIFF_BYTES)
+        tail = await file.read(SNIFF_BYTES)
+    await file.seek(0)
+    if not head:
+        raise HTTPException(400, "Empty file.")
+    ext, error = check_content(file.filename, head, tail)
+    if error:
+        raise HTTPException(400, error)
+    name = Path(file.filename).name
+    if ext != Path(name).suffix.lower():
+        logger.info("Upload %s looks like %s; reading it as such", name, ext)
+        name = Path(name).stem + ext
+    return EXTENSION_MAP[ext], name
+
+
+def _pool_busy() -> HTTPException:
+    return HTTPException(
+        503,
+        "Converter is busy, please retry shortly.",
+        headers={"Retry-After": str(settings.converter_retry_after)},
+    )
+
+
+def _check_request(
+    file: UploadFile, output_format: str, pg_output: str, archive: str,
+    current_user: Optional[User],
+) -> tuple[str, str, int, str]:
+    """Validate an upload request.
+
+    Returns (target, source_format, max_size, limit_message).
     """
     # Validate target format
-    target = resolve_target(outputFormat)
+    target = resolve_target(output_format)
     if not target:
-        raise HTTPException(400, f"Unsupported target format: {outputFormat}")
+        raise HTTPException(400, f"Unsupported target format: {output_format}")
+    if pg_output not in PG_OUTPUT_MODES:
+        raise HTTPException(
+            400, f"Unsupported pgOutput: {pg_output}. Supported: {', '.join(PG_OUTPUT_MODES)}"
+        )
+    if archive not in ARCHIVE_FORMATS:
+        raise HTTPException(
+            400, f"Unsupported archive: {archive}. Supported: {', '.join(ARCHIVE_FORMATS)}"
+        )
 
     # Validate filename
     if not file.filename:
@@ -59,90 +154,355 @@ async def convert_file(
         raise HTTPException(
             400,
             f"Unsupported file type: {Path(file.filename).suffix}. "
-            f"Supported: .csv, .tsv, .xls, .xlsx, .sqlite, .db, .sql, .dbf",
+            f"Supported: .csv, .tsv, .xls, .xlsx, .sqlite, .db, .sql, .dbf, "
+            f".parquet, .arrow, .feather",
         )
 
-    # Check file size (read into memory for small files, stream for large)
-    content = await file.read()
-    if len(content) > MAX_FREE_SIZE:
+    # Signed-in users get the higher upload tier
+    max_size, limit_msg = upload_limit(current_user is not None)
+
+    # The multipart parser has spooled the body by now (UploadLimitMiddleware
+    # caps it while streaming); skip copying a file already known to be too big
+    if file.size is not None and file.size > max_size:
         raise HTTPException(
-            413, f"File too large ({len(content) // 1024 // 1024}MB). Free limit is 10MB."
+            413, f"File too large ({file.size // 1024 // 1024}MB). {limit_msg}"
         )
 
-    if len(content) == 0:
-        raise HTTPException(400, "Empty file.")
+    return target, source_fmt, max_size, limit_msg
+
+
+def _convert_options(pg_output: str, archive: str) -> ConvertOptions:
+    return ConvertOptions(
+        batch_size=settings.converter_batch_size,
+        insert_rows=settings.converter_insert_rows,
+        max_statement_bytes=settings.converter_max_statement_bytes,
+        pg_output=pg_output,
+        compression=settings.converter_columnar_compression,
+        row_group_size=settings.converter_row_group_size,
+        table_workers=settings.converter_table_workers,
+        parallel_min_bytes=settings.converter_parallel_min_bytes,
+        archive=archive,
+        zip_level=settings.converter_zip_level,
+        zstd_level=settings.converter_zstd_level,
+    )
+
+
+def _download_name(filename: str, target: str, archive: str, member: str | None) -> str:
+    """people.csv -> people_to_mysql.zip, or people_to_mysql.sql.gz for a single file."""
+    name = f"{Path(filename).stem}_to_{target}"
+    if archive == "zip":
+        return name + ".zip"
+    return name + Path(member).suffix + ARCHIVES[archive][0]
+
+
+def _result_headers(
+    response_name: str, source_fmt: str, target: str,
+    tables_count: int, total_rows: int, warnings_count: int,
+) -> dict[str, str]:
+    return {
+        "Content-Disposition": f'attachment; filename="{response_name}"',
+        "X-Source-Format": source_fmt,
+        "X-Target-Format": target,
+        "X-Tables-Count": str(tables_count),
+        "X-Total-Rows": str(total_rows),
+        "X-Warnings-Count": str(warnings_count),
+    }
+
+
+async def _cached_conversion(
+    cache_key: str | None, input_path: Path, source_fmt: str, target: str,
+    work_dir: Path, options: ConvertOptions, progress_path: Path | None = None,
+) -> tuple[ConversionResult, bool]:
+    """Return a cached result for cache_key, or convert in the pool and cache it.
+
+    Returns (result, cache hit). On a hit, result.archive_path points into the cache.
+    """
+    if cache_key:
+        cached = result_cache.get(cache_key)
+        if cached:
+            return cached, True
+
+    result = await conversion_pool.run(
+        run_conversion, input_path, source_fmt, target, work_dir, options, progress_path
+    )
+    if cache_key:
+        await asyncio.to_thread(result_cache.put, cache_key, result)
+    return result, False
+
+
+@router.on_event("startup")
+def fail_interrupted_jobs():
+    """Fail conversion jobs that a previous server process never finished."""
+    try:
+        job_store.fail_unfinished("Conversion was interrupted by a server restart.")
+    except OSError as exc:
+        logger.warning("Could not check for interrupted conversion jobs: %s", exc)
+
+
+@router.on_event("shutdown")
+def shutdown_pool():
+    conversion_pool.shutdown()
+
+
+@router.get("/convert/formats")
+async def list_formats():
+    """Return supported source and target formats."""
+    return {
+        "sources": sorted(READERS.keys()),
+        "targets": sorted(SUPPORTED_TARGETS),
+        "pg_output_modes": list(PG_OUTPUT_MODES),
+        "archives": list(ARCHIVE_FORMATS),
+    }
+
+
+@router.get("/convert/cache")
+async def cache_stats():
+    """Return result cache hit/miss counters and disk usage for this process."""
+    if result_cache is None:
+        return {"enabled": False}
+    stats = await asyncio.to_thread(result_cache.stats)
+    return {"enabled": True, **stats}
+
+
+@router.post("/convert")
+async def convert_file(
+    file: UploadFile = File(...),
+    outputFormat: str = Query(..., description="Target format (csv, xlsx, mysql, postgresql, sqlite, parquet, arrow)"),
+    pgOutput: str = Query(
+        "insert", description="PostgreSQL row loading: insert, copy (text) or copy_csv"
+    ),
+    archive: str = Query(
+        "zip", description="Packaging: zip, or gzip/zstd to compress a single output file"
+    ),
+    current_user: Optional[User] = Depends(get_optional_user),
+):
+    """Upload a database file and convert it to the target format.
+
+    Returns a ZIP archive with the converted file(s), or with archive=gzip
+    or zstd and a single output file (and no warnings), that file compressed.
+    """
+    target, source_fmt, max_size, limit_msg = _check_request(
+        file, outputFormat, pgOutput, archive, current_user
+    )
+
+    # Don't accept the upload if it could not be scheduled anyway
+    if conversion_pool.saturated:
+        raise _pool_busy()
+
+    source_fmt, input_name = await _sniff_upload(file)
 
     # Work in a temp directory
     tmp_dir = Path(tempfile.mkdtemp(prefix="ltc_convert_"))
     try:
-        # Save uploaded file
-        input_path = tmp_dir / file.filename
-        input_path.write_bytes(content)
-
-        # Read source
-        reader = READERS.get(source_fmt)
-        if not reader:
-            raise HTTPException(500, f"No reader for format: {source_fmt}")
+        # Stream the upload to disk without holding it in memory
+        input_path = tmp_dir / input_name
+        digest = hashlib.sha256()
+        size = await _save_upload(file, input_path, max_size, limit_msg, digest)
+        if size == 0:
+            raise HTTPException(400, "Empty file.")
 
+        # Read, write and package in a worker process, off the event loop,
+        # unless the same input was already converted the same way
+        options = _convert_options(pgOutput, archive)
+        cache_key = (
+            ResultCache.key(digest.hexdigest(), source_fmt, target, options)
+            if result_cache else None
+        )
         try:
-            data: ConvertedData = reader(input_path)
-        except Exception as exc:
-            logger.error("Reader error for %s: %s", source_fmt, exc)
-            raise HTTPException(
-                422, f"Failed to parse {file.filename}: {exc}"
+            result, hit = await _cached_conversion(
+                cache_key, input_path, source_fmt, target, tmp_dir, options
             )
+        except PoolSaturated:
+            raise _pool_busy()
+        except ConversionError as exc:
+            raise HTTPException(exc.status_code, exc.detail)
+        except BrokenProcessPool:
+            raise HTTPException(500, "Conversion worker crashed. Please retry.")
 
-        if not data.tables:
-            raise HTTPException(422, "No tables found in the uploaded file.")
+        # Build a descriptive filename
+        response_name = _download_name(file.filename, target, result.archive, result.member)
 
-        # Write to target
-        writer = WRITERS.get(target)
-        if not writer:
-            raise HTTPException(500, f"No writer for format: {target}")
+        headers = _result_headers(
+            response_name, source_fmt, target,
+            result.tables_count, result.total_rows, result.warnings_count,
+        )
+        if result_cache:
+            headers["X-Cache"] = "HIT" if hit else "MISS"
 
-        output_dir = tmp_dir / "output"
-        output_dir.mkdir()
+        # Stream the result from disk; the temp dir is removed once it is sent
+        return FileResponse(
+            result.archive_path,
+            media_type=ARCHIVES[result.archive][1],
+            headers=headers,
+            background=BackgroundTask(shutil.rmtree, tmp_dir, ignore_errors=True),
+        )
 
-        try:
-            output_files = writer(data, output_dir)
-        except Exception as exc:
-            logger.error("Writer error for %s: %s", target, exc)
-            raise HTTPException(
-                422, f"Failed to convert to {target}: {exc}"
-            )
+    except BaseException:
+        # Clean up temp directory on failure
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
 
-        # Build ZIP
-        zip_path = tmp_dir / "result.zip"
-        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
-            # Add converted files
-            for fp in output_files:
-                zf.write(fp, fp.name)
 
-            # Add warnings file if any
-            if data.warnings:
-                zf.writestr("_warnings.txt", "\n".join(data.warnings))
+# ---------------------------------------------------------------------------
+# Asynchronous jobs: submit, poll progress, download the result
+# ---------------------------------------------------------------------------
 
-        # Stream the ZIP back
-        zip_bytes = zip_path.read_bytes()
+def _timestamp(ts: float | None) -> datetime | None:
+    return datetime.fromtimestamp(ts, tz=timezone.utc) if ts is not None else None
 
-        # Build a descriptive filename
-        stem = Path(file.filename).stem
-        response_name = f"{stem}_to_{target}.zip"
-
-        return StreamingResponse(
-            iter([zip_bytes]),
-            media_type="application/zip",
-            headers={
-                "Content-Disposition": f'attachment; filename="{response_name}"',
-                "Content-Length": str(len(zip_bytes)),
-                "X-Source-Format": source_fmt,
-                "X-Target-Format": target,
-                "X-Tables-Count": str(len(data.tables)),
-                "X-Total-Rows": str(sum(len(t.rows) for t in data.tables)),
-                "X-Warnings-Count": str(len(data.warnings)),
-            },
+
+def _job_response(job: dict) -> ConversionJobResponse:
+    result = None
+    if job["status"] == JOB_COMPLETED:
+        result = ConversionJobResult(
+            **job["result"], download_url=f"/api/convert/jobs/{job['id']}/download"
         )
+    return ConversionJobResponse(
+        id=job["id"],
+        status=job["status"],
+        filename=job["filename"],
+        source_format=job["source_format"],
+        target_format=job["target_format"],
+        created_at=_timestamp(job["created_at"]),
+        finished_at=_timestamp(job.get("finished_at")),
+        expires_at=_timestamp(job.get("expires_at")),
+        error=job.get("error"),
+        tables=[
+            TableProgress(name=name, **counts)
+            for name, counts in job["progress"]["tables"].items()
+        ],
+        result=result,
+    )
 
+
+async def _run_job(
+    job_id: str, job_dir: Path, input_path: Path, source_fmt: str, target: str,
+    options: ConvertOptions, cache_key: str | None = None,
+):
+    """Run a submitted job in the conversion pool and record the outcome."""
+    try:
+        result, hit = await _cached_conversion(
+            cache_key, input_path, source_fmt, target, job_dir, options,
+            job_dir / "progress.json",
+        )
+        if hit:
+            await asyncio.to_thread(
+                shutil.copyfile, result.archive_path,
+                job_dir / f"result{ARCHIVES[result.archive][0]}",
+            )
+        outcome = {
+            "status": JOB_COMPLETED,
+            "result": {
+                "tables_count": result.tables_count,
+                "total_rows": result.total_rows,
+                "warnings_count": result.warnings_count,
+                "archive": result.archive,
+                "member": result.member,
+            },
+        }
+    except ConversionError as exc:
+        outcome = {"status": JOB_FAILED, "error": exc.detail}
+    except PoolSaturated:
+        outcome = {"status": JOB_FAILED, "error": "Converter is busy, please resubmit shortly."}
+    except Exception as exc:
+        logger.error("Conversion job %s crashed: %s", job_id, exc)
+        outcome = {"status": JOB_FAILED, "error": "Conversion failed unexpectedly."}
     finally:
-        # Clean up temp directory
-        shutil.rmtree(tmp_dir, ignore_errors=True)
+        # Only the packaged result is kept for download
+        input_path.unlink(missing_ok=True)
+        shutil.rmtree(job_dir / "output", ignore_errors=True)
+
+    try:
+        job_store.finish(job_id, **outcome)
+    except (OSError, ValueError) as exc:
+        # The job directory was removed while the job ran
+        logger.warning("Could not record the outcome of conversion job %s: %s", job_id, exc)
+
+
+@router.post("/convert/jobs", response_model=ConversionJobResponse, status_code=202)
+async def submit_conversion_job(
+    file: UploadFile = File(...),
+    outputFormat: str = Query(..., description="Target format (csv, xlsx, mysql, postgresql, sqlite, parquet, arrow)"),
+    pgOutput: str = Query(
+        "insert", description="PostgreSQL row loading: insert, copy (text) or copy_csv"
+    ),
+    archive: str = Query(
+        "zip", description="Packaging: zip, or gzip/zstd to compress a single output file"
+    ),
+    current_user: Optional[User] = Depends(get_optional_user),
+):
+    """Upload a file and convert it in the background.
+
+    Returns a job to poll at GET /convert/jobs/{id}; the result is downloaded
+    from /convert/jobs/{id}/download once the job has completed.
+    """
+    target, source_fmt, max_size, limit_msg = _check_request(
+        file, outputFormat, pgOutput, archive, current_user
+    )
+
+    if conversion_pool.saturated:
+        raise _pool_busy()
+
+    source_fmt, input_name = await _sniff_upload(file)
+
+    job_store.purge_expired()
+    job_id, job_dir = job_store.create(
+        filename=file.filename,
+        source_format=source_fmt,
+        target_format=target,
+    )
+    try:
+        input_path = job_dir / input_name
+        digest = hashlib.sha256()
+        size = await _save_upload(file, input_path, max_size, limit_msg, digest)
+        if size == 0:
+            raise HTTPException(400, "Empty file.")
+    except BaseException:
+        shutil.rmtree(job_dir, ignore_errors=True)
+        raise
+
+    options = _convert_options(pgOutput, archive)
+    cache_key = (
+        ResultCache.key(digest.hexdigest(), source_fmt, target, options)
+        if result_cache else None
+    )
+    task = asyncio.create_task(
+        _run_job(job_id, job_dir, input_path, source_fmt, target, options, cache_key)
+    )
+    _job_tasks.add(task)
+    task.add_done_callback(_job_tasks.discard)
+
+    return _job_response(job_store.get(job_id))
+
+
+@router.get("/convert/jobs/{job_id}", response_model=ConversionJobResponse)
+async def get_conversion_job(job_id: str):
+    """Report a job's status and per-table progress."""
+    job = job_store.get(job_id)
+    if not job:
+        raise HTTPException(404, "Conversion job not found or expired.")
+    return _job_response(job)
+
+
+@router.get("/convert/jobs/{job_id}/download")
+async def download_conversion_job(job_id: str):
+    """Download the ZIP (or compressed file) produced by a completed job."""
+    job = job_store.get(job_id)
+    if not job:
+        raise HTTPException(404, "Conversion job not found or expired.")
+    if job["status"] != JOB_COMPLETED:
+        raise HTTPException(409, f"Conversion job is {job['status']}.")
+
+    archive = job["result"].get("archive", "zip")
+    response_name = _download_name(
+        job["filename"], job["target_format"], archive, job["result"].get("member")
+    )
+    return FileResponse(
+        job_store.root / job_id / f"result{ARCHIVES[archive][0]}",
+        media_type=ARCHIVES[archive][1],
+        headers=_result_headers(
+            response_name, job["source_format"], job["target_format"],
+            job["result"]["tables_count"], job["result"]["total_rows"],
+            job["result"]["warnings_count"],
+        ),
+    )
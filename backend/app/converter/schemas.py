@@ -0,0 +1,35 @@
+"""Pydantic schemas for the converter jobs API."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class TableProgress(BaseModel):
+    name: str
+    rows_read: int
+    rows_written: int
+
+
+class ConversionJobResult(BaseModel):
+    tables_count: int
+    total_rows: int
+    warnings_count: int
+    archive: str = "zip"  # zip, gzip or zstd
+    download_url: str
+
+
+class ConversionJobResponse(BaseModel):
+    id: str
+    status: str  # queued, running, completed, failed
+    filename: str
+    source_format: str
+    target_format: str
+    created_at: datetime
+    finished_at: datetime | None = None
+    expires_at: datetime | None = None  # set once the job finishes
+    error: str | None = None
+    tables: list[TableProgress] = []
+    result: ConversionJobResult | None = None
@@ -0,0 +1,533 @@
+"""Incremental parser for SQL dump files (mysqldump, pg_dump and generic dumps).
+
+The dump is read in fixed-size chunks and split into statements by a small
+byte-level scanner that understands quoted strings, identifiers, comments
+and pg_dump's ``COPY ... FROM stdin`` data blocks. Nothing is decoded or
+parsed beyond what is needed:
+
+- index_dump() makes one pass over the file, parsing CREATE TABLE
+  statements and recording the byte ranges holding each table's INSERT or
+  COPY data;
+- iter_table_rows() re-reads only those ranges and tokenizes VALUES tuples
+  into rows, so a table's rows can be streamed in batches.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import BinaryIO, Iterator
+
+from .models import ColumnInfo
+
+CHUNK_SIZE = 1 << 20  # 1 MB
+
+STATEMENT = "statement"
+COPY_DATA = "copy"
+INSERT_DATA = "insert"
+
+# Everything a statement body can contain before its terminating ';':
+# plain runs, quoted strings/identifiers and comments. Matching whole
+# tokens in one regex keeps the scan loop in C.
+_BODY_MYSQL = re.compile(
+    rb"""(?:
+        [^;'"`\#/\-]+
+      | '[^'\\]*(?:\\.[^'\\]*)*'
+      | "[^"\\]*(?:\\.[^"\\]*)*"
+      | `[^`]*`
+      | --[^\n]*\n
+      | \#[^\n]*\n
+      | /\*.*?\*/
+      | -(?!-)
+      | /(?!\*)
+    )*""",
+    re.VERBOSE | re.DOTALL,
+)
+_BODY_STD = re.compile(
+    rb"""(?:
+        [^;'"`/\-]+
+      | '[^']*'
+      | "[^"]*"
+      | `[^`]*`
+      | --[^\n]*\n
+      | /\*.*?\*/
+      | -(?!-)
+      | /(?!\*)
+    )*""",
+    re.VERBOSE | re.DOTALL,
+)
+_SEMI = ord(";")
+
+# Identifier, optionally schema-qualified; group 1 is the (quoted) table name
+_NAME = r"""(?:(?:`[^`]+`|"[^"]+"|\[[^\]]+\]|\w+)\s*\.\s*)?(`[^`]+`|"[^"]+"|\[[^\]]+\]|\w+)"""
+
+_LEADING_JUNK = re.compile(r"(?:\s+|--[^\n]*(?:\n|$)|#[^\n]*(?:\n|$)|/\*.*?\*/)*", re.DOTALL)
+_CREATE_HEAD = re.compile(
+    r"CREATE\s+(?:(?:GLOBAL|LOCAL|TEMPORARY|TEMP|UNLOGGED)\s+)*TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?"
+    + _NAME + r"\s*\(",
+    re.IGNORECASE,
+)
+_INSERT_HEAD = re.compile(
+    r"(?:INSERT|REPLACE)\s+(?:(?:LOW_PRIORITY|DELAYED|HIGH_PRIORITY|IGNORE)\s+)*(?:INTO\s+)?"
+    + _NAME + r"\s*(\([^)]*\))?\s*VALUES\b",
+    re.IGNORECASE,
+)
+_COPY_STMT = re.compile(r"COPY\s+" + _NAME + r"\s*(\([^)]*\))?\s+FROM\s+stdin", re.IGNORECASE)
+
+_CONSTRAINT_KEYWORDS = (
+    "PRIMARY", "KEY", "INDEX", "UNIQUE", "CONSTRAINT", "CHECK", "FOREIGN",
+    "FULLTEXT", "SPATIAL", "EXCLUDE",
+)
+_COLUMN_DEF = re.compile(r"""(?:`([^`]+)`|"([^"]+)"|\[([^\]]+)\]|(\w+))\s+(\w[\w(),.]*)""")
+_DDL_TOKEN = re.compile(r"""'(?:[^'\\]|\\.)*'|"[^"]*"|`[^`]*`|[(),]""", re.DOTALL)
+
+# VALUES tokenizer, used with findall. Each token swallows the comma before
+# it; groups are 1 single-quoted (quotes kept), 2 double-quoted, 3 NULL,
+# 4 bare literal, 5 parenthesis. Optional prefixes are charset introducers
+# (_utf8mb4'...') and hex/bit/national literals (X'..', B'..', N'..').
+_PREFIX = r"(?:_\w+\s*|[xXbBnN])?"
+_SQ_MYSQL = r"'[^'\\]*(?:(?:\\.|'')[^'\\]*)*'"
+_DQ_MYSQL = r'"[^"\\]*(?:(?:\\.|"")[^"\\]*)*"'
+_SQ_STD = r"'[^']*(?:''[^']*)*'"
+_DQ_STD = r'"[^"]*(?:""[^"]*)*"'
+_NULL = r"[Nn][Uu][Ll][Ll]"
+_VALUE_TOKEN_MYSQL = re.compile(
+    r"\s*,?\s*(?:" + _PREFIX + "(" + _SQ_MYSQL + ")|" + _PREFIX + "(" + _DQ_MYSQL + ")"
+    r"|(" + _NULL + r")\b|([^\s,();'\"]+)|([()]))",
+    re.DOTALL,
+)
+_VALUE_TOKEN_STD = re.compile(
+    r"\s*,?\s*(?:" + _PREFIX + "(" + _SQ_STD + ")|" + _PREFIX + "(" + _DQ_STD + ")"
+    r"|(" + _NULL + r")\b|([^\s,();'\"]+)|([()]))",
+    re.DOTALL,
+)
+
+# Flat tokenizer for the common case of tuples of plain literals: the
+# findall result is a list of strings with '(' and ')' as row markers. A
+# prefix is matched as a bare word glued to the string that follows it.
+_FLAT_TOKEN_MYSQL = re.compile(
+    _SQ_MYSQL + "|" + _DQ_MYSQL + r"""|[^\s,()'"]+(?:\s*(?:""" + _SQ_MYSQL + "|" + _DQ_MYSQL
+    + r"))?|[()]",
+    re.DOTALL,
+)
+_FLAT_TOKEN_STD = re.compile(
+    _SQ_STD + "|" + _DQ_STD + r"""|[^\s,()'"]+(?:\s*(?:""" + _SQ_STD + "|" + _DQ_STD
+    + r"))?|[()]",
+    re.DOTALL,
+)
+_QUOTES = frozenset("'\"")
+_NULLS = frozenset(("NULL", "null", "Null"))
+
+_MYSQL_ESCAPES = {"0": "\0", "b": "\b", "n": "\n", "r": "\r", "t": "\t", "Z": "\x1a"}
+# Backslash escapes plus the doubled form of the delimiting quote only:
+# inside '...' a "" is two literal double quotes, and vice versa
+_MYSQL_ESCAPE_RE = {
+    "'": re.compile(r"\\(.)|''", re.DOTALL),
+    '"': re.compile(r'\\(.)|""', re.DOTALL),
+}
+_COPY_ESCAPES = {"b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t", "v": "\v"}
+_COPY_ESCAPE_RE = re.compile(r"\\(.)", re.DOTALL)
+
+
+@dataclass
+class DumpTable:
+    name: str
+    columns: list[ColumnInfo] = field(default_factory=list)
+    ddl: str | None = None
+    # (start, end, kind) byte ranges holding this table's data
+    ranges: list[tuple[int, int, str]] = field(default_factory=list)
+
+
+def iter_statements(
+    f: BinaryIO,
+    start: int = 0,
+    end: int | None = None,
+    mysql: bool = True,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[tuple[str, int, int, bytes | None]]:
+    """Split the byte range [start, end) of a dump into statements.
+
+    Yields (STATEMENT, start, end, body) for each ';'-terminated statement
+    (the range includes the ';', body does not) and (COPY_DATA, start, end, None) for the data
+    block following a ``COPY ... FROM stdin`` statement. With mysql=True,
+    backslash escapes inside quotes and '#' comments are recognised.
+    """
+    body_re = _BODY_MYSQL if mysql else _BODY_STD
+    f.seek(start)
+    remaining = None if end is None else end - start
+
+    buf = bytearray()
+    base = start  # file offset of buf[0]
+    stmt = 0  # start of the current statement in buf
+    pos = 0  # scan position in buf, always on a token boundary
+    eof = False
+
+    def fill() -> None:
+        nonlocal base, stmt, pos, eof, remaining
+        if stmt:
+            del buf[:stmt]
+            base += stmt
+            pos -= stmt
+            stmt = 0
+        size = chunk_size if remaining is None else min(chunk_size, remaining)
+        chunk = f.read(size) if size > 0 else b""
+        if not chunk:
+            eof = True
+            return
+        if remaining is not None:
+            remaining -= len(chunk)
+        buf.extend(chunk)
+
+    while True:
+        j = body_re.match(buf, pos).end()
+
+        if j < len(buf) and buf[j] == _SEMI:
+            body = bytes(buf[stmt:j])
+            yield STATEMENT, base + stmt, base + j + 1, body
+            pos = stmt = j + 1
+            if not _is_copy_from_stdin(body):
+                continue
+
+            # COPY data starts on the next line and ends at a "\." line
+            nl = buf.find(b"\n", pos)
+            while nl < 0 and not eof:
+                fill()
+                nl = buf.find(b"\n", pos)
+            if nl < 0:
+                break
+            data_start = base + nl + 1
+            pos = stmt = nl
+            term = buf.find(b"\n\\.", pos)
+            while term < 0 and not eof:
+                # Keep only a short tail so the data never piles up in memory
+                pos = stmt = max(len(buf) - 2, pos)
+                fill()
+                term = buf.find(b"\n\\.", pos)
+            if term < 0:
+                yield COPY_DATA, data_start, base + len(buf), None
+                pos = stmt = len(buf)
+                break
+            yield COPY_DATA, data_start, base + term + 1, None
+            pos = stmt = term + 3
+            continue
+
+        if eof:
+            # Unterminated statement (or quote/comment) at the end of input
+            break
+
+        # Out of data, possibly inside a quote or comment: resume from the
+        # last token boundary. A trailing '-' or '/' may start '--' or '/*'.
+        if j == len(buf) and j > pos and buf[j - 1] in b"-/":
+            j -= 1
+        pos = j
+        fill()
+
+    tail = bytes(buf[stmt:])
+    if tail.strip():
+        yield STATEMENT, base + stmt, base + len(buf), tail
+
+
+def _is_copy_from_stdin(body: bytes) -> bool:
+    if body.rstrip()[-5:].lower() != b"stdin":
+        return False
+    text = _strip_leading_junk(body[:4096].decode("utf-8", errors="replace"))
+    return _COPY_STMT.match(text) is not None
+
+
+def _strip_leading_junk(text: str) -> str:
+    return text[_LEADING_JUNK.match(text).end():]
+
+
+def _unquote(name: str) -> str:
+    if name[0] in "`\"[":
+        return name[1:-1]
+    return name
+
+
+def _split_columns(column_list: str | None) -> list[str]:
+    if not column_list:
+        return []
+    return [_unquote(c.strip()) for c in column_list.strip("()").split(",") if c.strip()]
+
+
+def _parse_create_table(text: str) -> tuple[str, list[ColumnInfo]] | None:
+    """Parse a CREATE TABLE statement into (table name, columns)."""
+    m = _CREATE_HEAD.match(text)
+    if not m:
+        return None
+    name = _unquote(m.group(1))
+
+    # Split the body at top-level commas, skipping quoted text
+    items = []
+    depth = 1
+    item_start = m.end()
+    for tok in _DDL_TOKEN.finditer(text, m.end()):
+        t = tok.group()
+        if t == "(":
+            depth += 1
+        elif t == ")":
+            depth -= 1
+            if depth == 0:
+                items.append(text[item_start:tok.start()])
+                break
+        elif t == "," and depth == 1:
+            items.append(text[item_start:tok.start()])
+            item_start = tok.end()
+
+    columns = []
+    for item in items:
+        item = item.strip()
+        if not item or item.upper().startswith(_CONSTRAINT_KEYWORDS):
+            continue
+        col = _COLUMN_DEF.match(item)
+        if col:
+            col_name = next(g for g in col.groups()[:4] if g is not None)
+            columns.append(ColumnInfo(name=col_name, type=col.group(5)))
+    return name, columns
+
+
+def index_dump(
+    f: BinaryIO, mysql: bool = True, chunk_size: int = CHUNK_SIZE
+) -> list[DumpTable]:
+    """Scan the dump once; return its tables in order of first appearance.
+
+    Consecutive INSERTs into the same table are merged into a single byte
+    range, so the index stays small even for one-row-per-INSERT dumps.
+    """
+    tables: dict[str, DumpTable] = {}
+    last_data_table: str | None = None
+    pending_copy: str | None = None
+
+    for kind, start, end, body in iter_statements(f, mysql=mysql, chunk_size=chunk_size):
+        if kind == COPY_DATA:
+            if pending_copy:
+                tables[pending_copy].ranges.append((start, end, COPY_DATA))
+                last_data_table = None
+            pending_copy = None
+            continue
+
+        head = _strip_leading_junk(body[:4096].decode("utf-8", errors="replace"))
+        keyword = head[:7].upper()
+
+        if keyword.startswith("INSERT") or keyword.startswith("REPLACE"):
+            m = _INSERT_HEAD.match(head)
+            if not m:
+                continue
+            name = _unquote(m.group(1))
+            table = tables.get(name)
+            if table is None:
+                table = tables[name] = DumpTable(name=name)
+            if not table.columns:
+                table.columns = [ColumnInfo(name=c) for c in _split_columns(m.group(2))]
+            if last_data_table == name and table.ranges and table.ranges[-1][2] == INSERT_DATA:
+                table.ranges[-1] = (table.ranges[-1][0], end, INSERT_DATA)
+            else:
+                table.ranges.append((start, end, INSERT_DATA))
+            last_data_table = name
+
+        elif keyword.startswith("CREATE"):
+            text = _strip_leading_junk(body.decode("utf-8", errors="replace"))
+            parsed = _parse_create_table(text)
+            if not parsed:
+                continue
+            name, columns = parsed
+            table = tables.get(name)
+            if table is None:
+                table = tables[name] = DumpTable(name=name)
+            table.columns = columns
+            table.ddl = text + ";"
+
+        elif keyword.startswith("COPY"):
+            m = _COPY_STMT.match(head)
+            if not m:
+                continue
+            name = _unquote(m.group(1))
+            table = tables.get(name)
+            if table is None:
+                table = tables[name] = DumpTable(name=name)
+            if not table.columns:
+                table.columns = [ColumnInfo(name=c) for c in _split_columns(m.group(2))]
+            pending_copy = name
+
+    return list(tables.values())
+
+
+def _unescape_mysql(s: str, quote: str = "'") -> str:
+    """Unescape the body of a MySQL string literal delimited by quote."""
+    doubled = quote * 2
+    if "\\" not in s:
+        return s.replace(doubled, quote) if doubled in s else s
+    if "\\\\" not in s and doubled not in s:
+        # Escaped quotes are by far the most common escapes in mysqldump output
+        s = s.replace("\\'", "'").replace('\\"', '"')
+        if "\\" not in s:
+            return s
+    return _MYSQL_ESCAPE_RE[quote].sub(_mysql_escape, s)
+
+
+def _mysql_escape(m: re.Match) -> str:
+    ch = m.group(1)
+    if ch is None:
+        return m.group()[0]  # doubled quote
+    return _MYSQL_ESCAPES.get(ch, ch)
+
+
+def _string_value(token: str, mysql: bool) -> str:
+    """Unquote a string token from the flat tokenizer, dropping any prefix."""
+    quote = token[-1]
+    v = token[1:-1] if token[0] == quote else token[token.index(quote) + 1:-1]
+    if mysql:
+        return _unescape_mysql(v, quote) if "\\" in v or quote * 2 in v else v
+    return v.replace(quote * 2, quote) if quote * 2 in v else v
+
+
+def parse_flat_values(text: str, pos: int = 0, mysql: bool = True) -> list[list] | None:
+    """Fast path of parse_values() for tuples holding only plain literals.
+
+    Tokenizes the whole VALUES list with a single findall and slices it into
+    rows. Returns None when the list has nested expressions, ragged tuples
+    or trailing clauses, which parse_values() handles instead.
+    """
+    tokens = (_FLAT_TOKEN_MYSQL if mysql else _FLAT_TOKEN_STD).findall(text, pos)
+    try:
+        width = tokens.index(")") + 1
+    except ValueError:
+        return None
+    n_rows = len(tokens) // width
+    # Exactly one '(' and one ')' per row, at fixed positions
+    if (
+        len(tokens) != n_rows * width
+        or tokens.count("(") != n_rows
+        or tokens.count(")") != n_rows
+        or tokens[0::width] != ["("] * n_rows
+    ):
+        return None
+    values = [
+        _string_value(v, mysql) if v[-1] in _QUOTES else (None if v in _NULLS else v)
+        for v in tokens
+    ]
+    return [values[i + 1:i + width - 1] for i in range(0, len(values), width)]
+
+
+def parse_values(text: str, pos: int = 0, mysql: bool = True) -> Iterator[list]:
+    """Tokenize the tuples of an INSERT ... VALUES list starting at pos.
+
+    Strings are unescaped, NULL becomes None and other literals are kept as
+    their source text. Nested expressions such as NOW() or POINT(1, 2) are
+    kept as a single value.
+    """
+    token_re = _VALUE_TOKEN_MYSQL if mysql else _VALUE_TOKEN_STD
+    row: list | None = None
+    nested: list[str] = []  # tokens of a parenthesised expression inside a value
+    depth = 0
+    last_bare = False
+
+    for sq, dq, null, bare, paren in token_re.findall(text, pos):
+        if depth:
+            if paren == "(":
+                depth += 1
+                nested.append("(")
+            elif paren == ")":
+                depth -= 1
+                nested.append(")")
+                if depth == 0:
+                    # Glue the expression onto its function name, if any
+                    expr = ",".join(nested).replace("(,", "(").replace(",)", ")")
+                    if last_bare:
+                        row[-1] += expr
+                    else:
+                        row.append(expr)
+            else:
+                nested.append(sq or dq or null or bare)
+            continue
+
+        if sq:
+            if row is None:
+                break
+            v = sq[1:-1]
+            row.append(_unescape_mysql(v, "'") if mysql else v.replace("''", "'"))
+            last_bare = False
+        elif bare:
+            if row is None:
+                # Anything but a tuple ends the VALUES list (ON DUPLICATE KEY ...)
+                break
+            row.append(bare)
+            last_bare = True
+        elif paren == "(":
+            if row is None:
+                row = []
+            else:
+                depth = 1
+                nested = ["("]
+        elif paren == ")":
+            if row is not None:
+                yield row
+                row = None
+        elif null:
+            if row is None:
+                break
+            row.append(None)
+            last_bare = False
+        elif dq:
+            if row is None:
+                break
+            v = dq[1:-1]
+            row.append(_unescape_mysql(v, '"') if mysql else v.replace('""', '"'))
+            last_bare = False
+
+
+def _parse_copy_line(line: str) -> list:
+    values = []
+    for v in line.split("\t"):
+        if v == "\\N":
+            values.append(None)
+        elif "\\" in v:
+            values.append(_COPY_ESCAPE_RE.sub(lambda m: _COPY_ESCAPES.get(m.group(1), m.group(1)), v))
+        else:
+            values.append(v)
+    return values
+
+
+def iter_table_rows(
+    f: BinaryIO,
+    table: DumpTable,
+    batch_size: int,
+    mysql: bool = True,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[list[list]]:
+    """Yield a table's rows in batches by re-reading only its indexed ranges."""
+    batch: list[list] = []
+
+    for start, end, kind in table.ranges:
+        if kind == COPY_DATA:
+            f.seek(start)
+            offset = start
+            while offset < end:
+                raw = f.readline()
+                if not raw:
+                    break
+                offset += len(raw)
+                batch.append(_parse_copy_line(raw.decode("utf-8", errors="replace").rstrip("\r\n")))
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+            continue
+
+        for stmt_kind, _, _, body in iter_statements(f, start, end, mysql=mysql, chunk_size=chunk_size):
+            if stmt_kind != STATEMENT:
+                continue
+            text = _strip_leading_junk(body.decode("utf-8", errors="replace"))
+            m = _INSERT_HEAD.match(text)
+            if not m or _unquote(m.group(1)) != table.name:
+                continue
+            rows = parse_flat_values(text, m.end(), mysql=mysql)
+            if rows is None:
+                rows = parse_values(text, m.end(), mysql=mysql)
+            for row in rows:
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+
+    if batch:
+        yield batch
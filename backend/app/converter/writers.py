@@ -3,51 +3,148 @@
 from __future__ import annotations
 
 import csv
+import datetime
 import io
 import logging
+import re
+import shutil
 import sqlite3
 import tempfile
+from decimal import Decimal
 from pathlib import Path
+from typing import BinaryIO, Iterator
 
 import pandas as pd
 
-from .models import ConvertedData, TableData
+from .models import ConvertedData, ConvertOptions, TableData, rows_to_frame
 
 logger = logging.getLogger(__name__)
 
+WRITE_BUFFER_SIZE = 1024 * 1024  # 1 MB
 
-def _table_to_dataframe(table: TableData) -> pd.DataFrame:
-    """Convert a TableData to a pandas DataFrame."""
-    col_names = [c.name for c in table.columns] if table.columns else None
-    if col_names and table.rows:
-        # Ensure row length matches column count
-        rows = [r[:len(col_names)] for r in table.rows]
-        return pd.DataFrame(rows, columns=col_names)
-    elif table.rows:
-        return pd.DataFrame(table.rows)
-    elif col_names:
-        return pd.DataFrame(columns=col_names)
-    return pd.DataFrame()
 
+def _column_names(table: TableData) -> list[str] | None:
+    return [c.name for c in table.columns] if table.columns else None
 
-def write_csv(data: ConvertedData, output_dir: Path) -> list[Path]:
-    """Write each table as a separate CSV file."""
+
+def _column_values(col: pd.Series) -> list:
+    """A DataFrame column as a list of values, with missing values as None.
+
+    Object columns are taken as they are; typed columns have NaN/NA replaced.
+    """
+    if col.dtype == object or col.dtype.kind in "iub":
+        # Integer and boolean columns cannot hold NaN
+        return col.tolist()
+    return col.astype(object).where(col.notna(), None).tolist()
+
+
+def _frame_columns(df: pd.DataFrame, ncols: int | None = None) -> list[list]:
+    """The columns of a DataFrame batch as value lists (see _column_values).
+
+    With ncols, extra columns are dropped and missing ones filled with None.
+    """
+    columns = [_column_values(col) for _, col in df.items()]
+    if ncols is not None:
+        columns = columns[:ncols] + [[None] * len(df)] * (ncols - len(columns))
+    return columns
+
+
+# Types whose string form is the string itself or a number
+_PLAIN_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def _needs_escaping(values: list, chars: str) -> bool:
+    """Whether any value of a column may contain one of chars.
+
+    Checked once on the column's joined strings, which is far cheaper than
+    escaping value by value when, as usual, nothing needs it. Numbers never
+    need escaping; values of other types are assumed to.
+    """
+    types = set(map(type, values))
+    if not _PLAIN_TYPES.issuperset(types):
+        return True
+    if str not in types:
+        return False
+    if types <= {str, type(None)}:
+        joined = "".join(filter(None, values))
+    else:
+        joined = "".join([v for v in values if type(v) is str])
+    return any(c in joined for c in chars)
+
+
+def _native_values(values: list, native_types: frozenset) -> list:
+    """Replace values whose type is not in native_types by their string form."""
+    if native_types.issuperset(map(type, values)):
+        return values
+    return [v if type(v) in native_types else str(v) for v in values]
+
+
+def write_csv(
+    data: ConvertedData, output_dir: Path, options: ConvertOptions | None = None
+) -> list[Path]:
+    """Write each table as a separate CSV file, one batch at a time."""
     files = []
     for table in data.tables:
-        df = _table_to_dataframe(table)
         fpath = output_dir / f"{table.name}.csv"
-        df.to_csv(fpath, index=False, quoting=csv.QUOTE_NONNUMERIC)
+        with open(fpath, "w", encoding="utf-8", newline="") as f:
+            header = True
+            for df in table.iter_frames():
+                df.to_csv(f, index=False, header=header, quoting=csv.QUOTE_NONNUMERIC)
+                header = False
+            if header:
+                rows_to_frame([], _column_names(table)).to_csv(
+                    f, index=False, quoting=csv.QUOTE_NONNUMERIC
+                )
         files.append(fpath)
     return files
 
 
-def write_xlsx(data: ConvertedData, output_dir: Path) -> list[Path]:
-    """Write each table as a separate XLSX file."""
+# Excel's per-sheet row limit, header row included
+XLSX_MAX_ROWS = 1_048_576
+
+# Value types openpyxl writes as-is; anything else is written as its string form
+_XLSX_NATIVE_TYPES = frozenset((
+    str, int, float, bool, type(None), Decimal, datetime.date, datetime.datetime, datetime.time,
+))
+
+
+def write_xlsx(
+    data: ConvertedData, output_dir: Path, options: ConvertOptions | None = None
+) -> list[Path]:
+    """Write each table as a separate XLSX file.
+
+    Rows are appended one at a time with openpyxl's write-only mode, so the
+    workbook is never built in memory. Values are made writable a column at
+    a time. A table longer than one sheet allows continues on Sheet2,
+    Sheet3, ...
+    """
+    from openpyxl import Workbook
+
     files = []
     for table in data.tables:
-        df = _table_to_dataframe(table)
         fpath = output_dir / f"{table.name}.xlsx"
-        df.to_excel(fpath, index=False, engine="openpyxl")
+        wb = Workbook(write_only=True)
+        header = _column_names(table)
+        ws = None
+        sheet_rows = XLSX_MAX_ROWS
+        for df in table.iter_frames(dtype=object):
+            if header is None:
+                header = list(range(df.shape[1]))
+            columns = [_native_values(c, _XLSX_NATIVE_TYPES) for c in _frame_columns(df)]
+            for row in zip(*columns):
+                if sheet_rows >= XLSX_MAX_ROWS:
+                    ws = wb.create_sheet(f"Sheet{len(wb.worksheets) + 1}")
+                    ws.append(header)
+                    sheet_rows = 1
+                ws.append(row)
+                sheet_rows += 1
+        if ws is None:
+            ws = wb.create_sheet("Sheet1")
+            if header:
+                ws.append(header)
+        elif len(wb.worksheets) > 1:
+            logger.info("Split %s over %d sheets", table.name, len(wb.worksheets))
+        wb.save(fpath)
         files.append(fpath)
     return files
 
@@ -114,12 +211,46 @@ def _map_type_to_pg(col_type: str) -> str:
     return "TEXT"
 
 
-def _escape_sql_value(val) -> str:
-    """Escape a value for SQL INSERT."""
+def _sql_literal(val) -> str:
     if val is None:
         return "NULL"
-    s = str(val)
-    return "'" + s.replace("\\", "\\\\").replace("'", "''") + "'"
+    return "'" + str(val).replace("\\", "\\\\").replace("'", "''") + "'"
+
+
+def _sql_literals(values: list, typed: dict | None = None) -> list[str]:
+    """Escape a column of values for SQL INSERT, one literal per value.
+
+    typed maps value types that must not be written as quoted strings (such
+    as bytes) to a function returning their literal.
+    """
+    if typed and not typed.keys().isdisjoint(map(type, values)):
+        return [typed[type(v)](v) if type(v) in typed else _sql_literal(v) for v in values]
+    if not _needs_escaping(values, "\\'"):
+        return ["NULL" if v is None else f"'{v}'" for v in values]
+    return list(map(_sql_literal, values))
+
+
+# Literals for the value types MySQL and PostgreSQL cannot take as quoted text
+_MYSQL_TYPED_LITERALS = {
+    bool: lambda v: "1" if v else "0",  # BOOLEAN is TINYINT(1)
+    bytes: lambda v: "X'" + v.hex() + "'",
+}
+_PG_TYPED_LITERALS = {
+    bytes: lambda v: "'\\x" + v.hex() + "'::bytea",
+}
+
+
+_MYSQL_BOOL_VALUES = {
+    "true": "1", "t": "1", "yes": "1", "y": "1",
+    "false": "0", "f": "0", "no": "0", "n": "0",
+}
+
+
+def _to_mysql_bool(val):
+    """MySQL booleans are TINYINT(1), so textual true/false must become 1/0."""
+    if isinstance(val, str):
+        return _MYSQL_BOOL_VALUES.get(val.strip().lower(), val)
+    return val
 
 
 def _quote_id_mysql(name: str) -> str:
@@ -130,110 +261,512 @@ def _quote_id_pg(name: str) -> str:
     return f'"{name}"'
 
 
-def write_mysql(data: ConvertedData, output_dir: Path) -> list[Path]:
-    """Write all tables as a single MySQL dump file."""
-    lines = ["-- Converted by LegacyToCloud.com", "SET NAMES utf8mb4;", ""]
-
-    for table in data.tables:
-        tname = _quote_id_mysql(table.name)
-
-        # CREATE TABLE
-        col_defs = []
-        for col in table.columns:
-            mysql_type = _map_type_to_mysql(col.type)
-            col_defs.append(f"  {_quote_id_mysql(col.name)} {mysql_type}")
-        if col_defs:
-            lines.append(f"CREATE TABLE IF NOT EXISTS {tname} (")
-            lines.append(",\n".join(col_defs))
-            lines.append(");")
-            lines.append("")
-
-        # INSERT statements (batched by 100 rows)
-        if table.rows:
-            for i in range(0, len(table.rows), 100):
-                batch = table.rows[i : i + 100]
-                col_list = ", ".join(_quote_id_mysql(c.name) for c in table.columns) if table.columns else ""
-                lines.append(f"INSERT INTO {tname} ({col_list}) VALUES")
-                value_lines = []
-                for row in batch:
-                    vals = ", ".join(_escape_sql_value(v) for v in row)
-                    value_lines.append(f"({vals})")
-                lines.append(",\n".join(value_lines) + ";")
-                lines.append("")
-
+_MYSQL_HEADER = b"-- Converted by LegacyToCloud.com\nSET NAMES utf8mb4;\n\n"
+_PG_HEADER = b"-- Converted by LegacyToCloud.com\nSET client_encoding = 'UTF8';\n\n"
+
+
+def _write_inserts(
+    f: BinaryIO, head: str, tuples: Iterator[str], options: ConvertOptions
+) -> None:
+    """Write value tuples as multi-row INSERT statements starting with head.
+
+    A statement is closed after options.insert_rows rows, or earlier when
+    the next row would push it past options.max_statement_bytes. A single
+    row larger than the cap still gets a statement of its own.
+    """
+    head_bytes = f"{head} VALUES\n".encode("utf-8")
+    max_bytes = options.max_statement_bytes
+    n = 0
+    size = 0
+    for values in tuples:
+        line = values.encode("utf-8")
+        if n and (
+            n >= options.insert_rows or (max_bytes and size + 2 + len(line) + 1 > max_bytes)
+        ):
+            f.write(b";\n\n")
+            n = 0
+        if n:
+            f.write(b",\n")
+            size += 2
+        else:
+            f.write(head_bytes)
+            size = len(head_bytes)
+        f.write(line)
+        size += len(line)
+        n += 1
+    if n:
+        f.write(b";\n\n")
+
+
+def _write_create_table(f: BinaryIO, tname: str, col_defs: list[str]) -> None:
+    if col_defs:
+        body = ",\n".join(col_defs)
+        f.write(f"CREATE TABLE IF NOT EXISTS {tname} (\n{body}\n);\n\n".encode("utf-8"))
+
+
+def _sql_tuples(
+    frames: Iterator[pd.DataFrame], typed: dict, bool_cols: tuple[int, ...] = ()
+) -> Iterator[str]:
+    """Yield one "(v1, v2, ...)" INSERT tuple per row, escaping a column at a time.
+
+    typed is passed on to _sql_literals. Textual booleans in the bool_cols
+    columns are written as 1/0 (see _to_mysql_bool).
+    """
+    for df in frames:
+        columns = _frame_columns(df)
+        for j in bool_cols:
+            if j < len(columns):
+                columns[j] = [_to_mysql_bool(v) for v in columns[j]]
+        columns = [_sql_literals(values, typed) for values in columns]
+        for values in zip(*columns):
+            yield "(" + ", ".join(values) + ")"
+
+
+def write_mysql(
+    data: ConvertedData, output_dir: Path, options: ConvertOptions | None = None
+) -> list[Path]:
+    """Write all tables as a single MySQL dump file, streamed to disk."""
+    options = options or ConvertOptions()
     fpath = output_dir / "dump.sql"
-    fpath.write_text("\n".join(lines), encoding="utf-8")
+    with open(fpath, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(_MYSQL_HEADER)
+
+        for table in data.tables:
+            tname = _quote_id_mysql(table.name)
+
+            # CREATE TABLE
+            _write_create_table(f, tname, [
+                f"  {_quote_id_mysql(col.name)} {_map_type_to_mysql(col.type)}"
+                for col in table.columns
+            ])
+
+            # INSERT statements
+            col_list = ", ".join(_quote_id_mysql(c.name) for c in table.columns) if table.columns else ""
+            bool_cols = tuple(
+                i for i, c in enumerate(table.columns) if _map_type_to_mysql(c.type) == "TINYINT(1)"
+            )
+            _write_inserts(
+                f, f"INSERT INTO {tname} ({col_list})",
+                _sql_tuples(table.iter_frames(dtype=object), _MYSQL_TYPED_LITERALS, bool_cols),
+                options,
+            )
+
     return [fpath]
 
 
-def write_postgresql(data: ConvertedData, output_dir: Path) -> list[Path]:
-    """Write all tables as a single PostgreSQL dump file."""
-    lines = ["-- Converted by LegacyToCloud.com", "SET client_encoding = 'UTF8';", ""]
+# COPY text format: backslash escapes for the delimiter, newlines and backslash
+_COPY_TEXT_ESCAPES = str.maketrans({"\\": "\\\\", "\n": "\\n", "\r": "\\r", "\t": "\\t"})
 
-    for table in data.tables:
-        tname = _quote_id_pg(table.name)
-
-        # CREATE TABLE
-        col_defs = []
-        for col in table.columns:
-            pg_type = _map_type_to_pg(col.type)
-            col_defs.append(f"  {_quote_id_pg(col.name)} {pg_type}")
-        if col_defs:
-            lines.append(f"CREATE TABLE IF NOT EXISTS {tname} (")
-            lines.append(",\n".join(col_defs))
-            lines.append(");")
-            lines.append("")
-
-        # INSERT statements (batched by 100 rows)
-        if table.rows:
-            for i in range(0, len(table.rows), 100):
-                batch = table.rows[i : i + 100]
-                col_list = ", ".join(_quote_id_pg(c.name) for c in table.columns) if table.columns else ""
-                lines.append(f"INSERT INTO {tname} ({col_list}) VALUES")
-                value_lines = []
-                for row in batch:
-                    vals = ", ".join(_escape_sql_value(v) for v in row)
-                    value_lines.append(f"({vals})")
-                lines.append(",\n".join(value_lines) + ";")
-                lines.append("")
 
+def _copy_text_value(val) -> str:
+    if val is None:
+        return "\\N"
+    if isinstance(val, bytes):
+        return "\\\\x" + val.hex()  # bytea hex input, backslash escaped
+    return str(val).translate(_COPY_TEXT_ESCAPES)
+
+
+def _copy_csv_value(val) -> str:
+    # Unquoted empty means NULL, so every other value is quoted
+    if val is None:
+        return ""
+    if isinstance(val, bytes):
+        return '"\\x' + val.hex() + '"'
+    return '"' + str(val).replace('"', '""') + '"'
+
+
+def _copy_text_values(values: list) -> list[str]:
+    if not _needs_escaping(values, "\\\n\r\t"):
+        return ["\\N" if v is None else str(v) for v in values]
+    return list(map(_copy_text_value, values))
+
+
+def _copy_csv_values(values: list) -> list[str]:
+    if not _needs_escaping(values, '"'):
+        return ["" if v is None else f'"{v}"' for v in values]
+    return list(map(_copy_csv_value, values))
+
+
+def _write_copy(
+    f: BinaryIO, tname: str, col_list: str, frames: Iterator[pd.DataFrame], csv_format: bool
+) -> None:
+    """Write DataFrame batches as a COPY ... FROM stdin block in text or CSV format.
+
+    Values are converted a column at a time and each batch is written at once.
+    """
+    target = f"{tname} ({col_list})" if col_list else tname
+    if csv_format:
+        f.write(f"COPY {target} FROM stdin WITH (FORMAT csv);\n".encode("utf-8"))
+        sep, to_text = ",", _copy_csv_values
+    else:
+        f.write(f"COPY {target} FROM stdin;\n".encode("utf-8"))
+        sep, to_text = "\t", _copy_text_values
+    for df in frames:
+        columns = [to_text(values) for values in _frame_columns(df)]
+        f.write("".join(sep.join(values) + "\n" for values in zip(*columns)).encode("utf-8"))
+    f.write(b"\\.\n\n")
+
+
+def write_postgresql(
+    data: ConvertedData, output_dir: Path, options: ConvertOptions | None = None
+) -> list[Path]:
+    """Write all tables as a single PostgreSQL dump file, streamed to disk.
+
+    Rows are loaded with INSERT statements or, depending on
+    options.pg_output, with COPY blocks in text or CSV format.
+    """
+    options = options or ConvertOptions()
     fpath = output_dir / "dump.sql"
-    fpath.write_text("\n".join(lines), encoding="utf-8")
+    with open(fpath, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(_PG_HEADER)
+
+        for table in data.tables:
+            tname = _quote_id_pg(table.name)
+
+            # CREATE TABLE
+            _write_create_table(f, tname, [
+                f"  {_quote_id_pg(col.name)} {_map_type_to_pg(col.type)}"
+                for col in table.columns
+            ])
+
+            # Data
+            col_list = ", ".join(_quote_id_pg(c.name) for c in table.columns) if table.columns else ""
+            frames = table.iter_frames(dtype=object)
+            if options.pg_output == "insert":
+                _write_inserts(
+                    f, f"INSERT INTO {tname} ({col_list})",
+                    _sql_tuples(frames, _PG_TYPED_LITERALS), options,
+                )
+            else:
+                _write_copy(f, tname, col_list, frames, csv_format=options.pg_output == "copy_csv")
+
     return [fpath]
 
 
-def write_sqlite(data: ConvertedData, output_dir: Path) -> list[Path]:
-    """Write all tables into a single SQLite database file."""
+def _map_type_to_sqlite(col_type: str) -> str:
+    """Map a generic/source column type to a SQLite declared type."""
+    t = col_type.upper().strip()
+    mapping = {
+        "INTEGER": "INTEGER",
+        "BIGINT": "INTEGER",
+        "SMALLINT": "INTEGER",
+        "TINYINT": "INTEGER",
+        "MEDIUMINT": "INTEGER",
+        "INT": "INTEGER",
+        "SERIAL": "INTEGER",
+        "REAL": "REAL",
+        "FLOAT": "REAL",
+        "DOUBLE": "REAL",
+        "NUMERIC": "NUMERIC",
+        "DECIMAL": "NUMERIC",
+        "BOOLEAN": "BOOLEAN",
+        "BOOL": "BOOLEAN",
+        "DATETIME": "DATETIME",
+        "TIMESTAMP": "DATETIME",
+        "DATE": "DATE",
+        "BLOB": "BLOB",
+        "LONGBLOB": "BLOB",
+        "BYTEA": "BLOB",
+    }
+    for key, val in mapping.items():
+        if t.startswith(key):
+            return val
+    return "TEXT"
+
+
+# Value types sqlite3 binds as-is; anything else is stored as its string form
+_SQLITE_NATIVE_TYPES = frozenset((str, int, float, bool, bytes, type(None)))
+
+# Bulk-load settings: the output file is new, so a crash mid-write only
+# loses the file itself and journaling/fsync can be turned off.
+_SQLITE_LOAD_PRAGMAS = (
+    "PRAGMA journal_mode = OFF",
+    "PRAGMA synchronous = OFF",
+    "PRAGMA locking_mode = EXCLUSIVE",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -65536",  # 64 MB
+)
+
+
+def write_sqlite(
+    data: ConvertedData, output_dir: Path, options: ConvertOptions | None = None
+) -> list[Path]:
+    """Write all tables into a single SQLite database file.
+
+    Rows are bulk-inserted with executemany in a single transaction, fed
+    from each batch's columns after they are made bindable a column at a time.
+    """
     fpath = output_dir / "database.sqlite"
     conn = sqlite3.connect(str(fpath))
-    cursor = conn.cursor()
+    try:
+        for pragma in _SQLITE_LOAD_PRAGMAS:
+            conn.execute(pragma)
+
+        for table in data.tables:
+            first = None if table.columns else table.first_row()
+
+            # Create table
+            if table.columns:
+                col_defs = ", ".join(
+                    f'"{c.name}" {_map_type_to_sqlite(c.type)}' for c in table.columns
+                )
+                conn.execute(f'CREATE TABLE IF NOT EXISTS "{table.name}" ({col_defs})')
+            elif first:
+                # No column info, generate generic names
+                col_defs = ", ".join(f'"col_{i}" TEXT' for i in range(len(first)))
+                conn.execute(f'CREATE TABLE IF NOT EXISTS "{table.name}" ({col_defs})')
+            else:
+                continue
+
+            # Insert rows
+            ncols = len(table.columns) if table.columns else len(first)
+            placeholders = ", ".join(["?"] * ncols)
+            sql = f'INSERT INTO "{table.name}" VALUES ({placeholders})'
+            for df in table.iter_frames(dtype=object):
+                columns = [
+                    _native_values(c, _SQLITE_NATIVE_TYPES) for c in _frame_columns(df, ncols)
+                ]
+                conn.executemany(sql, zip(*columns))
+
+        conn.commit()
+    finally:
+        conn.close()
+    return [fpath]
+
+
+def _map_type_to_arrow(col_type: str):
+    """Map a generic/source column type to an Arrow data type."""
+    import pyarrow as pa
+
+    t = col_type.upper().strip()
+    decimal = re.match(r"(?:DECIMAL|NUMERIC)\s*\(\s*(\d+)\s*(?:,\s*(\d+)\s*)?\)", t)
+    if decimal and 0 < int(decimal.group(1)) <= 38:
+        return pa.decimal128(int(decimal.group(1)), int(decimal.group(2) or 0))
+    mapping = {
+        "INTEGER": pa.int64(),
+        "BIGINT": pa.int64(),
+        "SMALLINT": pa.int64(),
+        "TINYINT": pa.int64(),
+        "MEDIUMINT": pa.int64(),
+        "INT": pa.int64(),
+        "SERIAL": pa.int64(),
+        "REAL": pa.float64(),
+        "FLOAT": pa.float64(),
+        "DOUBLE": pa.float64(),
+        "NUMERIC": pa.decimal128(18, 6),
+        "DECIMAL": pa.decimal128(18, 6),
+        "BOOLEAN": pa.bool_(),
+        "BOOL": pa.bool_(),
+        "DATETIME": pa.timestamp("us"),
+        "TIMESTAMP": pa.timestamp("us"),
+        "DATE": pa.date32(),
+        "BLOB": pa.binary(),
+        "LONGBLOB": pa.binary(),
+        "BYTEA": pa.binary(),
+    }
+    for key, val in mapping.items():
+        if t.startswith(key):
+            return val
+    return pa.string()
+
+
+class _ColumnTypeMismatch(Exception):
+    def __init__(self, index: int):
+        super().__init__(index)
+        self.index = index
+
+
+def _arrow_record_batch(df: pd.DataFrame, schema):
+    """Build a RecordBatch of the given schema from a DataFrame batch.
+
+    Columns that do not convert directly (e.g. numbers held as strings) are
+    cast from their string form; raises _ColumnTypeMismatch if that fails.
+    """
+    import pyarrow as pa
+
+    arrays = []
+    for i, fld in enumerate(schema):
+        values = df.iloc[:, i] if i < df.shape[1] else pd.Series([None] * len(df), dtype=object)
+        try:
+            arrays.append(pa.array(values, type=fld.type))
+            continue
+        except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+            pass
+        try:
+            strings = pa.array(values, type=pa.string())
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            strings = pa.array(
+                [v if v is None or isinstance(v, str) else str(v) for v in values],
+                type=pa.string(),
+            )
+        try:
+            arrays.append(strings.cast(fld.type))
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            raise _ColumnTypeMismatch(i)
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def _write_arrow_table(table: TableData, fpath: Path, open_writer) -> bool:
+    """Stream a table into an Arrow-based file. Returns False if it has no columns.
+
+    open_writer(fpath, schema) must return a context manager with a
+    write_batch(record_batch) method.
+
+    The schema follows the declared column types. A column whose values do
+    not fit its type is written as strings instead, which re-reads the table.
+    """
+    import pyarrow as pa
+
+    if table.columns:
+        names = [c.name for c in table.columns]
+        types = [_map_type_to_arrow(c.type) for c in table.columns]
+    else:
+        first = table.first_row()
+        if not first:
+            return False
+        names = [f"col_{i}" for i in range(len(first))]
+        types = [pa.string()] * len(first)
+
+    while True:
+        schema = pa.schema([pa.field(str(n), t) for n, t in zip(names, types)])
+        try:
+            with open_writer(fpath, schema) as writer:
+                for df in table.iter_frames():
+                    writer.write_batch(_arrow_record_batch(df, schema))
+            return True
+        except _ColumnTypeMismatch as exc:
+            logger.info(
+                "Column %s of %s does not fit %s, writing it as text",
+                names[exc.index], table.name, types[exc.index],
+            )
+            types[exc.index] = pa.string()
+
+
+def write_parquet(
+    data: ConvertedData, output_dir: Path, options: ConvertOptions | None = None
+) -> list[Path]:
+    """Write each table as a separate Parquet file with typed columns.
+
+    Batches are buffered up to options.row_group_size rows, so each row
+    group is written once and memory stays bounded.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    options = options or ConvertOptions()
+    compression = options.compression if options.compression != "none" else None
+
+    class RowGroupWriter:
+        def __init__(self, fpath: Path, schema):
+            self.writer = pq.ParquetWriter(fpath, schema, compression=compression)
+            self.pending: list = []
+            self.pending_rows = 0
+
+        def write_batch(self, batch) -> None:
+            self.pending.append(batch)
+            self.pending_rows += batch.num_rows
+            if self.pending_rows >= options.row_group_size:
+                self.flush()
+
+        def flush(self) -> None:
+            if self.pending:
+                self.writer.write_table(
+                    pa.Table.from_batches(self.pending), row_group_size=options.row_group_size
+                )
+                self.pending, self.pending_rows = [], 0
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, *exc):
+            if exc_type is None:
+                self.flush()
+            self.writer.close()
 
+    files = []
     for table in data.tables:
-        # Create table
-        if table.columns:
-            col_defs = ", ".join(f'"{c.name}" TEXT' for c in table.columns)
-            cursor.execute(f'CREATE TABLE IF NOT EXISTS "{table.name}" ({col_defs})')
-        elif table.rows and table.rows[0]:
-            # No column info, generate generic names
-            col_defs = ", ".join(f'"col_{i}" TEXT' for i in range(len(table.rows[0])))
-            cursor.execute(f'CREATE TABLE IF NOT EXISTS "{table.name}" ({col_defs})')
-
-        # Insert rows
-        if table.rows:
-            ncols = len(table.columns) if table.columns else len(table.rows[0])
-            placeholders = ", ".join(["?"] * ncols)
-            for row in table.rows:
-                # Pad or truncate row to match column count
-                padded = list(row[:ncols]) + [None] * max(0, ncols - len(row))
-                # Convert all values to strings (SQLite is flexible but keep it safe)
-                safe = [str(v) if v is not None else None for v in padded]
-                cursor.execute(f'INSERT INTO "{table.name}" VALUES ({placeholders})', safe)
-
-    conn.commit()
-    conn.close()
+        fpath = output_dir / f"{table.name}.parquet"
+        if _write_arrow_table(table, fpath, RowGroupWriter):
+            files.append(fpath)
+    return files
+
+
+def write_arrow(
+    data: ConvertedData, output_dir: Path, options: ConvertOptions | None = None
+) -> list[Path]:
+    """Write each table as a separate Arrow IPC file (Feather v2), one record batch at a time."""
+    import pyarrow as pa
+
+    options = options or ConvertOptions()
+    # The IPC format only supports LZ4 frame and Zstandard buffer compression
+    compression = options.compression if options.compression in ("lz4", "zstd") else None
+    ipc_options = pa.ipc.IpcWriteOptions(compression=compression)
+
+    def open_writer(fpath: Path, schema):
+        return pa.ipc.new_file(str(fpath), schema, options=ipc_options)
+
+    files = []
+    for table in data.tables:
+        fpath = output_dir / f"{table.name}.arrow"
+        if _write_arrow_table(table, fpath, open_writer):
+            files.append(fpath)
+    return files
+
+
+def _merge_dump_parts(header: bytes):
+    """Build a merger that concatenates per-table dumps under a single header."""
+
+    def merge(parts: list[list[Path]], output_dir: Path) -> list[Path]:
+        fpath = output_dir / "dump.sql"
+        with open(fpath, "wb", buffering=WRITE_BUFFER_SIZE) as out:
+            out.write(header)
+            for files in parts:
+                for part in files:
+                    with open(part, "rb") as f:
+                        f.seek(len(header))
+                        shutil.copyfileobj(f, out, WRITE_BUFFER_SIZE)
+        return [fpath]
+
+    return merge
+
+
+def _merge_sqlite_parts(parts: list[list[Path]], output_dir: Path) -> list[Path]:
+    """Copy the tables of per-table SQLite files into one database."""
+    fpath = output_dir / "database.sqlite"
+    conn = sqlite3.connect(str(fpath), isolation_level=None)
+    try:
+        for pragma in _SQLITE_LOAD_PRAGMAS:
+            conn.execute(pragma)
+        for files in parts:
+            for part in files:
+                conn.execute("ATTACH DATABASE ? AS part", (str(part),))
+                conn.execute("BEGIN")
+                for name, sql in conn.execute(
+                    "SELECT name, sql FROM part.sqlite_master WHERE type = 'table'"
+                ).fetchall():
+                    exists = conn.execute(
+                        "SELECT 1 FROM main.sqlite_master WHERE type = 'table' AND name = ?",
+                        (name,),
+                    ).fetchone()
+                    if not exists:
+                        conn.execute(sql)
+                    conn.execute(f'INSERT INTO main."{name}" SELECT * FROM part."{name}"')
+                conn.execute("COMMIT")
+                conn.execute("DETACH DATABASE part")
+    finally:
+        conn.close()
     return [fpath]
 
 
+# Targets that put every table into one shared file, with how to merge
+# the files written for single tables. Other targets write a file per table.
+MERGERS = {
+    "mysql": _merge_dump_parts(_MYSQL_HEADER),
+    "postgresql": _merge_dump_parts(_PG_HEADER),
+    "sqlite": _merge_sqlite_parts,
+}
+
+
 # Registry of writers
 WRITERS = {
     "csv": write_csv,
@@ -241,4 +774,6 @@ WRITERS = {
     "mysql": write_mysql,
     "postgresql": write_postgresql,
     "sqlite": write_sqlite,
+    "parquet": write_parquet,
+    "arrow": write_arrow,
 }
@@ -46,6 +46,36 @@ class Settings(BaseSettings):
     news_image_dir: str = "/usr/local/www/legacytocloud.com/www/uploads/news"
     news_site_slug: str = "legacytocloud.com"
 
+    # Schema Analysis
+    analysis_workers: int = 4  # threads running source database analyses
+    analysis_per_host: int = 2  # concurrent analyses against one database server
+
+    # Source database connections kept open per saved connection
+    source_pool_size: int = 2  # idle connections kept per connection, 0 disables pooling
+    source_pool_idle_timeout: int = 300  # seconds before an idle connection is closed
+    source_pool_max_lifetime: int = 1800  # seconds before a connection is replaced
+
+    # File Converter
+    converter_batch_size: int = 10_000
+    converter_insert_rows: int = 100  # rows per INSERT in SQL dump output
+    converter_max_statement_bytes: int = 1024 * 1024  # per INSERT, 0 disables
+    converter_columnar_compression: str = "zstd"  # Parquet/Arrow codec, "none" disables
+    converter_row_group_size: int = 128 * 1024  # Parquet rows per row group
+    converter_zip_level: int = 1  # deflate level for ZIP/gzip output, 0 stores only
+    converter_zstd_level: int = 3  # for single-file zstd output
+    converter_max_free_size: int = 10 * 1024 * 1024  # anonymous uploads
+    converter_max_auth_size: int = 2 * 1024 * 1024 * 1024  # signed-in uploads
+    converter_workers: int = 2  # worker processes for conversions
+    converter_queue_depth: int = 4  # conversions allowed to wait for a worker
+    converter_table_workers: int = 1  # per conversion, for large multi-table inputs
+    converter_parallel_min_bytes: int = 64 * 1024 * 1024  # input size before tables go parallel
+    converter_retry_after: int = 30  # seconds, sent with 503 when saturated
+    converter_jobs_dir: str = ""  # defaults to <system temp>/ltc_convert_jobs
+    converter_job_ttl: int = 3600  # seconds a finished job's result is kept
+    converter_job_max_runtime: int = 6 * 3600  # seconds before an unfinished job is purged
+    converter_cache_dir: str = ""  # defaults to <system temp>/ltc_convert_cache
+    converter_cache_max_bytes: int = 1024 * 1024 * 1024  # result cache budget; 0 disables
+
     class Config:
         env_file = ".env"
         extra = "ignore"
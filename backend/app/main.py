@@ -9,6 +9,8 @@ from app.pipeline.router import router as pipeline_router
 from app.pipeline.news_router import router as news_router
 from app.rag.chat_router import router as chat_router
 from app.converter.router import router as converter_router
+from app.converter.limits import UploadLimitMiddleware
+from app.services.connection_pool import source_pool
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +25,10 @@ app = FastAPI(
     openapi_url="/api/openapi.json"
 )
 
+# Cap converter uploads while they stream in, before FastAPI spools them.
+# Added before CORS so CORS wraps it and its early 413 keeps the CORS headers.
+app.add_middleware(UploadLimitMiddleware, paths={"/api/convert", "/api/convert/jobs"})
+
 # CORS
 app.add_middleware(
     CORSMiddleware,
@@ -90,6 +96,23 @@ async def startup_seed():
         logger.warning("Auto-seed skipped: %s", exc)
 
 
+@app.on_event("startup")
+async def fail_interrupted_analyses():
+    """Fail schema analyses that a previous server process never finished."""
+    try:
+        count = await analysis.fail_interrupted_analyses()
+        if count:
+            logger.warning("Marked %d interrupted schema analyses as failed", count)
+    except Exception as exc:
+        logger.warning("Could not check for interrupted analyses: %s", exc)
+
+
+@app.on_event("shutdown")
+async def close_source_connections():
+    """Close pooled connections to source databases."""
+    source_pool.close_all()
+
+
 @app.get("/")
 async def root():
     return {
@@ -28,6 +28,9 @@ class SchemaAnalysis(Base):
     total_rows = Column(Integer, default=0)
     schema_data = Column(JSON, nullable=True)  # Full schema details
     risks = Column(JSON, nullable=True)  # Identified risks
+    # Hash of the connection settings analyzed; kept out of schema_data,
+    # which is returned to clients
+    settings_hash = Column(String(64), nullable=True)
 
     # Error handling
     error_message = Column(Text, nullable=True)
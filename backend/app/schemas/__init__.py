@@ -6,7 +6,7 @@ from app.schemas.connection import (
 )
 from app.schemas.analysis import (
     AnalysisRequest, AnalysisResponse, AnalysisDetailResponse,
-    QuickAnalysisRequest, QuickAnalysisResponse
+    QuickAnalysisRequest, QuickAnalysisResponse, BatchAnalysisRequest
 )
 
 __all__ = [
@@ -29,4 +29,5 @@ __all__ = [
     "AnalysisDetailResponse",
     "QuickAnalysisRequest",
     "QuickAnalysisResponse",
+    "BatchAnalysisRequest",
 ]
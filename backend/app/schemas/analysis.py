@@ -8,6 +8,11 @@ class AnalysisRequest(BaseModel):
     connection_id: str
 
 
+class BatchAnalysisRequest(BaseModel):
+    """Connections to analyze; defaults to the project's own connections."""
+    connection_ids: Optional[list[str]] = None
+
+
 class AnalysisResponse(BaseModel):
     id: str
     project_id: str
@@ -0,0 +1,209 @@
+"""Pool of open source-database connections, keyed by saved connection."""
+import hashlib
+import hmac
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Optional
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+def pool_key(
+    connection_id: Optional[str],
+    host: str,
+    port: int,
+    database: str,
+    username: str,
+    password: str,
+    ssl: bool = False
+) -> Optional[tuple]:
+    """Pool key for a saved connection, None for ad-hoc (unsaved) ones.
+
+    The key includes a hash of the connection settings, so a pooled connection
+    is never handed out once its record points elsewhere.
+    """
+    if not connection_id:
+        return None
+    return (connection_id, settings_hash(host, port, database, username, password, ssl))
+
+
+def settings_hash(
+    host: str,
+    port: int,
+    database: str,
+    username: str,
+    password: str,
+    ssl: bool = False
+) -> str:
+    """Hash of the settings that decide which server and database a connection reaches.
+
+    Keyed with the app secret, since it covers the password and is stored
+    alongside analysis results.
+    """
+    return hmac.new(
+        get_settings().secret_key.encode(),
+        "\0".join((host, str(port), database, username, password, str(ssl))).encode(),
+        hashlib.sha256
+    ).hexdigest()
+
+
+class _Entry:
+    __slots__ = ("conn", "created", "last_used")
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.created = time.monotonic()
+        self.last_used = self.created
+
+
+class SourceConnectionPool:
+    """Keeps a few idle pymysql/psycopg2/pymssql connections per saved connection.
+
+    Connections are health-checked before reuse, closed once idle for
+    idle_timeout seconds or older than max_lifetime seconds, and at most
+    max_idle are kept per connection record. Thread-safe, since analyses
+    and tests run on worker threads.
+    """
+
+    def __init__(self, max_idle: int, idle_timeout: float, max_lifetime: float):
+        self.max_idle = max_idle
+        self.idle_timeout = idle_timeout
+        self.max_lifetime = max_lifetime
+        self._idle: dict[tuple, list[_Entry]] = {}
+        # Bumped by evict() so connections checked out before it are not returned
+        self._generation: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self, key: Optional[tuple], connect: Callable):
+        """Check out a connection for key, opening one with connect() if needed.
+
+        With key None the connection is simply opened and closed. A connection
+        whose block raised is closed rather than returned to the pool.
+        """
+        if key is None or self.max_idle <= 0:
+            conn = connect()
+            try:
+                yield conn
+            finally:
+                _close(conn)
+            return
+
+        with self._lock:
+            generation = self._generation.get(key[0], 0)
+        entry = self._checkout(key)
+        if entry is None:
+            entry = _Entry(connect())
+        try:
+            yield entry.conn
+        except BaseException:
+            _close(entry.conn)
+            raise
+        self._checkin(key, entry, generation)
+
+    def evict(self, connection_id: str) -> None:
+        """Close the idle connections of a connection record, e.g. after it changed."""
+        with self._lock:
+            self._generation[connection_id] = self._generation.get(connection_id, 0) + 1
+            stale = [k for k in self._idle if k[0] == connection_id]
+            entries = [e for k in stale for e in self._idle.pop(k)]
+        for entry in entries:
+            _close(entry.conn)
+
+    def close_all(self) -> None:
+        with self._lock:
+            entries = [e for idle in self._idle.values() for e in idle]
+            self._idle.clear()
+        for entry in entries:
+            _close(entry.conn)
+
+    def _checkout(self, key: tuple) -> Optional[_Entry]:
+        while True:
+            with self._lock:
+                expired = self._purge()
+                idle = self._idle.get(key)
+                entry = idle.pop() if idle else None
+            for stale in expired:
+                _close(stale.conn)
+            if entry is None:
+                return None
+            if _ping(entry.conn):
+                return entry
+            logger.info("Dropping dead pooled connection for %s", key[0])
+            _close(entry.conn)
+
+    def _checkin(self, key: tuple, entry: _Entry, generation: int) -> None:
+        now = time.monotonic()
+        keep = False
+        if now - entry.created < self.max_lifetime and _reset(entry.conn):
+            entry.last_used = now
+            with self._lock:
+                if (
+                    self._generation.get(key[0], 0) == generation
+                    and len(self._idle.get(key, ())) < self.max_idle
+                ):
+                    self._idle.setdefault(key, []).append(entry)
+                    keep = True
+        if not keep:
+            _close(entry.conn)
+
+    def _purge(self) -> list[_Entry]:
+        """Drop idle entries past their idle timeout or lifetime (lock held)."""
+        now = time.monotonic()
+        expired = []
+        for key in list(self._idle):
+            alive = []
+            for entry in self._idle[key]:
+                if (
+                    now - entry.last_used > self.idle_timeout
+                    or now - entry.created > self.max_lifetime
+                ):
+                    expired.append(entry)
+                else:
+                    alive.append(entry)
+            if alive:
+                self._idle[key] = alive
+            else:
+                del self._idle[key]
+        return expired
+
+
+def _ping(conn) -> bool:
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1")
+        cursor.fetchall()
+        cursor.close()
+        conn.rollback()
+        return True
+    except Exception:
+        return False
+
+
+def _reset(conn) -> bool:
+    """End the open transaction so the next user sees a fresh catalog snapshot."""
+    try:
+        conn.rollback()
+        return True
+    except Exception:
+        return False
+
+
+def _close(conn) -> None:
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+
+_settings = get_settings()
+
+source_pool = SourceConnectionPool(
+    max_idle=_settings.source_pool_size,
+    idle_timeout=_settings.source_pool_idle_timeout,
+    max_lifetime=_settings.source_pool_max_lifetime,
+)
@@ -4,6 +4,7 @@ import psycopg2
 import pymssql
 from typing import Optional
 from app.models.connection import DatabaseType
+from app.services.connection_pool import source_pool, pool_key
 
 
 class DatabaseConnector:
@@ -16,31 +17,33 @@ class DatabaseConnector:
         database: str,
         username: str,
         password: str,
-        ssl: bool = False
+        ssl: bool = False,
+        connection_id: Optional[str] = None
     ) -> dict:
         """Test MySQL connection."""
         try:
             ssl_config = {"ssl": {"ssl_mode": "require"}} if ssl else {}
-            conn = pymysql.connect(
-                host=host,
-                port=port,
-                user=username,
-                password=password,
-                database=database,
-                connect_timeout=10,
-                **ssl_config
-            )
-
-            # Get server info
-            cursor = conn.cursor()
-            cursor.execute("SELECT VERSION()")
-            version = cursor.fetchone()[0]
-
-            cursor.execute("SELECT DATABASE()")
-            db_name = cursor.fetchone()[0]
-
-            cursor.close()
-            conn.close()
+            with source_pool.connection(
+                pool_key(connection_id, host, port, database, username, password, ssl),
+                lambda: pymysql.connect(
+                    host=host,
+                    port=port,
+                    user=username,
+                    password=password,
+                    database=database,
+                    connect_timeout=10,
+                    **ssl_config
+                )
+            ) as conn:
+                # Get server info
+                cursor = conn.cursor()
+                cursor.execute("SELECT VERSION()")
+                version = cursor.fetchone()[0]
+
+                cursor.execute("SELECT DATABASE()")
+                db_name = cursor.fetchone()[0]
+
+                cursor.close()
 
             return {
                 "success": True,
@@ -71,31 +74,33 @@ class DatabaseConnector:
         database: str,
         username: str,
         password: str,
-        ssl: bool = False
+        ssl: bool = False,
+        connection_id: Optional[str] = None
     ) -> dict:
         """Test PostgreSQL connection."""
         try:
             sslmode = "require" if ssl else "prefer"
-            conn = psycopg2.connect(
-                host=host,
-                port=port,
-                user=username,
-                password=password,
-                dbname=database,
-                sslmode=sslmode,
-                connect_timeout=10
-            )
-
-            # Get server info
-            cursor = conn.cursor()
-            cursor.execute("SELECT version()")
-            version = cursor.fetchone()[0]
-
-            cursor.execute("SELECT current_database()")
-            db_name = cursor.fetchone()[0]
-
-            cursor.close()
-            conn.close()
+            with source_pool.connection(
+                pool_key(connection_id, host, port, database, username, password, ssl),
+                lambda: psycopg2.connect(
+                    host=host,
+                    port=port,
+                    user=username,
+                    password=password,
+                    dbname=database,
+                    sslmode=sslmode,
+                    connect_timeout=10
+                )
+            ) as conn:
+                # Get server info
+                cursor = conn.cursor()
+                cursor.execute("SELECT version()")
+                version = cursor.fetchone()[0]
+
+                cursor.execute("SELECT current_database()")
+                db_name = cursor.fetchone()[0]
+
+                cursor.close()
 
             return {
                 "success": True,
@@ -126,29 +131,31 @@ class DatabaseConnector:
         database: str,
         username: str,
         password: str,
-        ssl: bool = False
+        ssl: bool = False,
+        connection_id: Optional[str] = None
     ) -> dict:
         """Test MSSQL connection."""
         try:
-            conn = pymssql.connect(
-                server=host,
-                port=port,
-                user=username,
-                password=password,
-                database=database,
-                login_timeout=10
-            )
-
-            # Get server info
-            cursor = conn.cursor()
-            cursor.execute("SELECT @@VERSION")
-            version = cursor.fetchone()[0]
-
-            cursor.execute("SELECT DB_NAME()")
-            db_name = cursor.fetchone()[0]
-
-            cursor.close()
-            conn.close()
+            with source_pool.connection(
+                pool_key(connection_id, host, port, database, username, password, ssl),
+                lambda: pymssql.connect(
+                    server=host,
+                    port=port,
+                    user=username,
+                    password=password,
+                    database=database,
+                    login_timeout=10
+                )
+            ) as conn:
+                # Get server info
+                cursor = conn.cursor()
+                cursor.execute("SELECT @@VERSION")
+                version = cursor.fetchone()[0]
+
+                cursor.execute("SELECT DB_NAME()")
+                db_name = cursor.fetchone()[0]
+
+                cursor.close()
 
             return {
                 "success": True,
@@ -205,15 +212,20 @@ class DatabaseConnector:
         ssl: bool = False,
         warehouse: Optional[str] = None,
         schema_name: Optional[str] = None,
-        role: Optional[str] = None
+        role: Optional[str] = None,
+        connection_id: Optional[str] = None
     ) -> dict:
-        """Test database connection based on type."""
+        """Test database connection based on type.
+
+        Pass connection_id for a saved connection to reuse its pooled
+        connections instead of opening a new one.
+        """
         if db_type == DatabaseType.MSSQL:
-            return cls.test_mssql(host, port, database, username, password, ssl)
+            return cls.test_mssql(host, port, database, username, password, ssl, connection_id)
         elif db_type == DatabaseType.MYSQL:
-            return cls.test_mysql(host, port, database, username, password, ssl)
+            return cls.test_mysql(host, port, database, username, password, ssl, connection_id)
         elif db_type == DatabaseType.POSTGRES:
-            return cls.test_postgres(host, port, database, username, password, ssl)
+            return cls.test_postgres(host, port, database, username, password, ssl, connection_id)
         elif db_type == DatabaseType.SNOWFLAKE:
             return cls.test_snowflake(
                 host, port, database, username, password,
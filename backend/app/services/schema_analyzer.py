@@ -4,10 +4,144 @@ import psycopg2
 import pymssql
 from typing import Optional
 from app.models.connection import DatabaseType
+from app.services.connection_pool import source_pool, pool_key
+
+# Source databases SchemaAnalyzer.analyze can introspect
+SUPPORTED_DB_TYPES = (DatabaseType.MSSQL, DatabaseType.MYSQL, DatabaseType.POSTGRES)
+
+MYSQL_RISKY_TYPES = ['enum', 'set', 'bit', 'year', 'geometry', 'json']
+MSSQL_RISKY_TYPES = ['xml', 'geography', 'geometry', 'hierarchyid', 'sql_variant', 'image', 'text', 'ntext']
+
+
+def _group_by_table(rows: list, key) -> dict[str, list]:
+    """Group catalog rows by table name, keeping their query order."""
+    grouped: dict[str, list] = {}
+    for row in rows:
+        grouped.setdefault(row[key], []).append(row)
+    return grouped
+
+
+def _tables_to_fetch(fingerprints: dict[str, str], previous: Optional[list]) -> Optional[set]:
+    """Names of tables whose details must be re-read, None for the whole schema.
+
+    A table is re-read when it is new or its fingerprint differs from the one
+    stored with the previous analysis. Once most tables changed, one
+    schema-wide query is cheaper than a long IN list.
+    """
+    if not previous:
+        return None
+    stored = {t["name"]: t.get("fingerprint") for t in previous}
+    changed = {name for name, fp in fingerprints.items() if stored.get(name) != fp}
+    if len(changed) * 2 > len(fingerprints):
+        return None
+    return changed
+
+
+def _table_filter(column: str, names: Optional[set]) -> tuple[str, tuple]:
+    """SQL condition and params limiting a catalog query to names (None = all)."""
+    if names is None:
+        return "", ()
+    return f" AND {column} IN ({', '.join(['%s'] * len(names))})", tuple(names)
+
+
+def _reuse_details(table: dict, previous: dict) -> None:
+    """Copy column, key and index details of an unchanged table."""
+    for key in ("columns", "indexes", "primary_key", "has_primary_key"):
+        if key in previous:
+            table[key] = previous[key]
+
+
+def _table_risks(table: dict, no_pk_message: str, large_message: str) -> list:
+    """No primary key and large table risks of one table."""
+    risks = []
+    table_name = table["name"]
+    row_count = table["row_count"]
+
+    # Risk: no primary key
+    if not table["has_primary_key"]:
+        risks.append({
+            "table": table_name,
+            "column": None,
+            "type": "no_primary_key",
+            "severity": "error",
+            "message": no_pk_message.format(table=table_name)
+        })
+
+    # Risk: very large table
+    if row_count and row_count > 1000000:
+        risks.append({
+            "table": table_name,
+            "column": None,
+            "type": "large_table",
+            "severity": "info",
+            "message": large_message.format(table=table_name, rows=row_count)
+        })
+    return risks
+
+
+def _mysql_risks(table: dict) -> list:
+    risks = []
+    for col in table["columns"]:
+        # Detect risky types
+        if col['data_type'].lower() in MYSQL_RISKY_TYPES:
+            risks.append({
+                "table": table["name"],
+                "column": col['name'],
+                "type": "risky_type",
+                "severity": "warning",
+                "message": f"Type '{col['data_type']}' may need special handling during migration"
+            })
+
+        # Detect mixed encodings
+        if col['collation'] and 'latin' in col['collation'].lower():
+            risks.append({
+                "table": table["name"],
+                "column": col['name'],
+                "type": "encoding",
+                "severity": "warning",
+                "message": f"Non-UTF8 collation '{col['collation']}' detected"
+            })
+    return risks + _table_risks(
+        table,
+        "Table '{table}' has no primary key - required for incremental sync",
+        "Table '{table}' has {rows:,} rows - consider chunked migration"
+    )
+
+
+def _postgres_risks(table: dict) -> list:
+    return _table_risks(
+        table,
+        "Table '{table}' has no primary key",
+        "Table '{table}' has ~{rows:,} rows"
+    )
+
+
+def _mssql_risks(table: dict) -> list:
+    risks = []
+    for col in table["columns"]:
+        # Detect risky MSSQL types for Snowflake migration
+        if col['data_type'].lower() in MSSQL_RISKY_TYPES:
+            risks.append({
+                "table": table["name"],
+                "column": col['name'],
+                "type": "risky_type",
+                "severity": "warning",
+                "message": f"Type '{col['data_type']}' requires special handling for Snowflake migration"
+            })
+    return risks + _table_risks(
+        table,
+        "Table '{table}' has no primary key - required for incremental sync",
+        "Table '{table}' has {rows:,} rows - consider chunked migration"
+    )
 
 
 class SchemaAnalyzer:
-    """Analyzes database schemas and extracts metadata."""
+    """Analyzes database schemas and extracts metadata.
+
+    Every table carries a fingerprint of its catalog entries. Given the tables
+    of a previous analysis, only tables whose fingerprint changed have their
+    columns and indexes read again; the others keep their stored details.
+    """
 
     @staticmethod
     def analyze_mysql(
@@ -16,167 +150,172 @@ class SchemaAnalyzer:
         database: str,
         username: str,
         password: str,
-        ssl: bool = False
+        ssl: bool = False,
+        previous: Optional[list] = None,
+        connection_id: Optional[str] = None
     ) -> dict:
         """Analyze MySQL database schema."""
         try:
             ssl_config = {"ssl": {"ssl_mode": "require"}} if ssl else {}
-            conn = pymysql.connect(
-                host=host,
-                port=port,
-                user=username,
-                password=password,
-                database=database,
-                connect_timeout=30,
-                **ssl_config
-            )
-            cursor = conn.cursor(pymysql.cursors.DictCursor)
-
-            # Get all tables
-            cursor.execute("""
-                SELECT
-                    TABLE_NAME,
-                    TABLE_TYPE,
-                    ENGINE,
-                    TABLE_ROWS,
-                    TABLE_COLLATION,
-                    TABLE_COMMENT
-                FROM information_schema.TABLES
-                WHERE TABLE_SCHEMA = %s
-                ORDER BY TABLE_NAME
-            """, (database,))
-            tables_raw = cursor.fetchall()
-
-            tables = []
-            risks = []
-            total_rows = 0
-
-            for table_info in tables_raw:
-                table_name = table_info['TABLE_NAME']
-                row_count = table_info['TABLE_ROWS'] or 0
-                total_rows += row_count
-
-                # Get columns for this table
-                cursor.execute("""
-                    SELECT
-                        COLUMN_NAME,
-                        DATA_TYPE,
-                        COLUMN_TYPE,
-                        IS_NULLABLE,
-                        COLUMN_DEFAULT,
-                        COLUMN_KEY,
-                        EXTRA,
-                        CHARACTER_SET_NAME,
-                        COLLATION_NAME,
-                        COLUMN_COMMENT
-                    FROM information_schema.COLUMNS
-                    WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
-                    ORDER BY ORDINAL_POSITION
-                """, (database, table_name))
-                columns_raw = cursor.fetchall()
-
-                columns = []
-                has_primary_key = False
-
-                for col in columns_raw:
-                    column = {
-                        "name": col['COLUMN_NAME'],
-                        "data_type": col['DATA_TYPE'],
-                        "full_type": col['COLUMN_TYPE'],
-                        "nullable": col['IS_NULLABLE'] == 'YES',
-                        "default": col['COLUMN_DEFAULT'],
-                        "key": col['COLUMN_KEY'],
-                        "extra": col['EXTRA'],
-                        "charset": col['CHARACTER_SET_NAME'],
-                        "collation": col['COLLATION_NAME'],
-                        "comment": col['COLUMN_COMMENT']
-                    }
-                    columns.append(column)
-
-                    if col['COLUMN_KEY'] == 'PRI':
-                        has_primary_key = True
-
-                    # Detect risky types
-                    risky_types = ['enum', 'set', 'bit', 'year', 'geometry', 'json']
-                    if col['DATA_TYPE'].lower() in risky_types:
-                        risks.append({
-                            "table": table_name,
-                            "column": col['COLUMN_NAME'],
-                            "type": "risky_type",
-                            "severity": "warning",
-                            "message": f"Type '{col['DATA_TYPE']}' may need special handling during migration"
-                        })
-
-                    # Detect mixed encodings
-                    if col['COLLATION_NAME'] and 'latin' in col['COLLATION_NAME'].lower():
-                        risks.append({
-                            "table": table_name,
-                            "column": col['COLUMN_NAME'],
-                            "type": "encoding",
-                            "severity": "warning",
-                            "message": f"Non-UTF8 collation '{col['COLLATION_NAME']}' detected"
-                        })
-
-                # Get indexes
+            with source_pool.connection(
+                pool_key(connection_id, host, port, database, username, password, ssl),
+                lambda: pymysql.connect(
+                    host=host,
+                    port=port,
+                    user=username,
+                    password=password,
+                    database=database,
+                    connect_timeout=30,
+                    **ssl_config
+                )
+            ) as conn:
+                cursor = conn.cursor(pymysql.cursors.DictCursor)
+
+                # Get all tables, fingerprinted by creation time and checksums
+                # of their column and index definitions
                 cursor.execute("""
                     SELECT
-                        INDEX_NAME,
-                        NON_UNIQUE,
-                        COLUMN_NAME,
-                        SEQ_IN_INDEX
-                    FROM information_schema.STATISTICS
-                    WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s
-                    ORDER BY INDEX_NAME, SEQ_IN_INDEX
-                """, (database, table_name))
-                indexes_raw = cursor.fetchall()
-
-                # Group by index name
-                indexes = {}
-                for idx in indexes_raw:
-                    idx_name = idx['INDEX_NAME']
-                    if idx_name not in indexes:
-                        indexes[idx_name] = {
-                            "name": idx_name,
-                            "unique": idx['NON_UNIQUE'] == 0,
-                            "columns": []
-                        }
-                    indexes[idx_name]['columns'].append(idx['COLUMN_NAME'])
-
-                table = {
-                    "name": table_name,
-                    "type": table_info['TABLE_TYPE'],
-                    "engine": table_info['ENGINE'],
-                    "row_count": row_count,
-                    "collation": table_info['TABLE_COLLATION'],
-                    "comment": table_info['TABLE_COMMENT'],
-                    "columns": columns,
-                    "indexes": list(indexes.values()),
-                    "has_primary_key": has_primary_key
+                        t.TABLE_NAME,
+                        t.TABLE_TYPE,
+                        t.ENGINE,
+                        t.TABLE_ROWS,
+                        t.TABLE_COLLATION,
+                        t.TABLE_COMMENT,
+                        t.CREATE_TIME,
+                        c.COLUMNS_CHECKSUM,
+                        s.INDEXES_CHECKSUM
+                    FROM information_schema.TABLES t
+                    LEFT JOIN (
+                        SELECT
+                            TABLE_NAME,
+                            SUM(CRC32(CONCAT_WS('|', ORDINAL_POSITION, COLUMN_NAME, COLUMN_TYPE,
+                                IS_NULLABLE, COLUMN_DEFAULT, COLUMN_KEY, EXTRA, COLLATION_NAME,
+                                COLUMN_COMMENT))) as COLUMNS_CHECKSUM
+                        FROM information_schema.COLUMNS
+                        WHERE TABLE_SCHEMA = %s
+                        GROUP BY TABLE_NAME
+                    ) c ON c.TABLE_NAME = t.TABLE_NAME
+                    LEFT JOIN (
+                        SELECT
+                            TABLE_NAME,
+                            SUM(CRC32(CONCAT_WS('|', INDEX_NAME, NON_UNIQUE, SEQ_IN_INDEX,
+                                COLUMN_NAME))) as INDEXES_CHECKSUM
+                        FROM information_schema.STATISTICS
+                        WHERE TABLE_SCHEMA = %s
+                        GROUP BY TABLE_NAME
+                    ) s ON s.TABLE_NAME = t.TABLE_NAME
+                    WHERE t.TABLE_SCHEMA = %s
+                    ORDER BY t.TABLE_NAME
+                """, (database, database, database))
+                tables_raw = cursor.fetchall()
+
+                fingerprints = {
+                    t['TABLE_NAME']: f"{t['CREATE_TIME']}|{t['COLUMNS_CHECKSUM']}|{t['INDEXES_CHECKSUM']}"
+                    for t in tables_raw
                 }
-                tables.append(table)
-
-                # Risk: no primary key
-                if not has_primary_key:
-                    risks.append({
-                        "table": table_name,
-                        "column": None,
-                        "type": "no_primary_key",
-                        "severity": "error",
-                        "message": f"Table '{table_name}' has no primary key - required for incremental sync"
-                    })
-
-                # Risk: very large table
-                if row_count and row_count > 1000000:
-                    risks.append({
-                        "table": table_name,
-                        "column": None,
-                        "type": "large_table",
-                        "severity": "info",
-                        "message": f"Table '{table_name}' has {row_count:,} rows - consider chunked migration"
-                    })
-
-            cursor.close()
-            conn.close()
+                fetch = _tables_to_fetch(fingerprints, previous)
+
+                # Columns and indexes of the tables to (re-)read, grouped by table below
+                columns_by_table = {}
+                indexes_by_table = {}
+                if fetch is None or fetch:
+                    condition, names = _table_filter("TABLE_NAME", fetch)
+                    cursor.execute(f"""
+                        SELECT
+                            TABLE_NAME,
+                            COLUMN_NAME,
+                            DATA_TYPE,
+                            COLUMN_TYPE,
+                            IS_NULLABLE,
+                            COLUMN_DEFAULT,
+                            COLUMN_KEY,
+                            EXTRA,
+                            CHARACTER_SET_NAME,
+                            COLLATION_NAME,
+                            COLUMN_COMMENT
+                        FROM information_schema.COLUMNS
+                        WHERE TABLE_SCHEMA = %s{condition}
+                        ORDER BY TABLE_NAME, ORDINAL_POSITION
+                    """, (database,) + names)
+                    columns_by_table = _group_by_table(cursor.fetchall(), 'TABLE_NAME')
+
+                    cursor.execute(f"""
+                        SELECT
+                            TABLE_NAME,
+                            INDEX_NAME,
+                            NON_UNIQUE,
+                            COLUMN_NAME,
+                            SEQ_IN_INDEX
+                        FROM information_schema.STATISTICS
+                        WHERE TABLE_SCHEMA = %s{condition}
+                        ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX
+                    """, (database,) + names)
+                    indexes_by_table = _group_by_table(cursor.fetchall(), 'TABLE_NAME')
+
+                previous_tables = {t["name"]: t for t in previous or []}
+                tables = []
+                risks = []
+                total_rows = 0
+
+                for table_info in tables_raw:
+                    table_name = table_info['TABLE_NAME']
+                    row_count = table_info['TABLE_ROWS'] or 0
+                    total_rows += row_count
+
+                    table = {
+                        "name": table_name,
+                        "type": table_info['TABLE_TYPE'],
+                        "engine": table_info['ENGINE'],
+                        "row_count": row_count,
+                        "collation": table_info['TABLE_COLLATION'],
+                        "comment": table_info['TABLE_COMMENT'],
+                        "fingerprint": fingerprints[table_name]
+                    }
+
+                    if fetch is not None and table_name not in fetch:
+                        _reuse_details(table, previous_tables[table_name])
+                    else:
+                        columns = []
+                        has_primary_key = False
+
+                        for col in columns_by_table.get(table_name, []):
+                            column = {
+                                "name": col['COLUMN_NAME'],
+                                "data_type": col['DATA_TYPE'],
+                                "full_type": col['COLUMN_TYPE'],
+                                "nullable": col['IS_NULLABLE'] == 'YES',
+                                "default": col['COLUMN_DEFAULT'],
+                                "key": col['COLUMN_KEY'],
+                                "extra": col['EXTRA'],
+                                "charset": col['CHARACTER_SET_NAME'],
+                                "collation": col['COLLATION_NAME'],
+                                "comment": col['COLUMN_COMMENT']
+                            }
+                            columns.append(column)
+
+                            if col['COLUMN_KEY'] == 'PRI':
+                                has_primary_key = True
+
+                        # Group by index name
+                        indexes = {}
+                        for idx in indexes_by_table.get(table_name, []):
+                            idx_name = idx['INDEX_NAME']
+                            if idx_name not in indexes:
+                                indexes[idx_name] = {
+                                    "name": idx_name,
+                                    "unique": idx['NON_UNIQUE'] == 0,
+                                    "columns": []
+                                }
+                            indexes[idx_name]['columns'].append(idx['COLUMN_NAME'])
+
+                        table["columns"] = columns
+                        table["indexes"] = list(indexes.values())
+                        table["has_primary_key"] = has_primary_key
+
+                    tables.append(table)
+                    risks.extend(_mysql_risks(table))
+
+                cursor.close()
 
             return {
                 "success": True,
@@ -215,149 +354,165 @@ class SchemaAnalyzer:
         username: str,
         password: str,
         ssl: bool = False,
-        schema: str = "public"
+        schema: str = "public",
+        previous: Optional[list] = None,
+        connection_id: Optional[str] = None
     ) -> dict:
         """Analyze PostgreSQL database schema."""
         try:
             sslmode = "require" if ssl else "prefer"
-            conn = psycopg2.connect(
-                host=host,
-                port=port,
-                user=username,
-                password=password,
-                dbname=database,
-                sslmode=sslmode,
-                connect_timeout=30
-            )
-            cursor = conn.cursor()
-
-            # Get all tables
-            cursor.execute("""
-                SELECT
-                    t.table_name,
-                    t.table_type,
-                    pg_catalog.obj_description(c.oid, 'pg_class') as comment,
-                    (SELECT reltuples::bigint FROM pg_class WHERE relname = t.table_name) as row_estimate
-                FROM information_schema.tables t
-                LEFT JOIN pg_class c ON c.relname = t.table_name
-                WHERE t.table_schema = %s
-                  AND t.table_type IN ('BASE TABLE', 'VIEW')
-                ORDER BY t.table_name
-            """, (schema,))
-            tables_raw = cursor.fetchall()
-
-            tables = []
-            risks = []
-            total_rows = 0
-
-            for table_info in tables_raw:
-                table_name = table_info[0]
-                row_count = int(table_info[3]) if table_info[3] else 0
-                total_rows += row_count
-
-                # Get columns
+            with source_pool.connection(
+                pool_key(connection_id, host, port, database, username, password, ssl),
+                lambda: psycopg2.connect(
+                    host=host,
+                    port=port,
+                    user=username,
+                    password=password,
+                    dbname=database,
+                    sslmode=sslmode,
+                    connect_timeout=30
+                )
+            ) as conn:
+                cursor = conn.cursor()
+
+                # Get all tables, fingerprinted by relfilenode (changes when a table
+                # is rewritten) and a checksum of its column and index definitions
                 cursor.execute("""
                     SELECT
-                        c.column_name,
-                        c.data_type,
-                        c.udt_name,
-                        c.is_nullable,
-                        c.column_default,
-                        c.character_maximum_length,
-                        c.numeric_precision,
-                        c.numeric_scale,
-                        pg_catalog.col_description(
-                            (SELECT oid FROM pg_class WHERE relname = c.table_name), c.ordinal_position
-                        ) as comment
-                    FROM information_schema.columns c
-                    WHERE c.table_schema = %s AND c.table_name = %s
-                    ORDER BY c.ordinal_position
-                """, (schema, table_name))
-                columns_raw = cursor.fetchall()
-
-                columns = []
-                for col in columns_raw:
-                    column = {
-                        "name": col[0],
-                        "data_type": col[1],
-                        "udt_name": col[2],
-                        "nullable": col[3] == 'YES',
-                        "default": col[4],
-                        "max_length": col[5],
-                        "precision": col[6],
-                        "scale": col[7],
-                        "comment": col[8]
+                        t.table_name,
+                        t.table_type,
+                        pg_catalog.obj_description(c.oid, 'pg_class') as comment,
+                        c.reltuples::bigint as row_estimate,
+                        md5(concat_ws('|',
+                            c.relfilenode,
+                            (SELECT string_agg(concat_ws(':', a.attnum, a.attname,
+                                        format_type(a.atttypid, a.atttypmod), a.attnotnull,
+                                        pg_get_expr(d.adbin, d.adrelid),
+                                        col_description(c.oid, a.attnum)), ',' ORDER BY a.attnum)
+                             FROM pg_attribute a
+                             LEFT JOIN pg_attrdef d ON d.adrelid = a.attrelid AND d.adnum = a.attnum
+                             WHERE a.attrelid = c.oid AND a.attnum > 0 AND NOT a.attisdropped),
+                            (SELECT string_agg(concat_ws(':', i.relname, ix.indisunique,
+                                        ix.indisprimary, ix.indkey), ',' ORDER BY i.relname)
+                             FROM pg_index ix
+                             JOIN pg_class i ON i.oid = ix.indexrelid
+                             WHERE ix.indrelid = c.oid)
+                        )) as fingerprint
+                    FROM information_schema.tables t
+                    LEFT JOIN pg_namespace n ON n.nspname = t.table_schema
+                    LEFT JOIN pg_class c ON c.relnamespace = n.oid AND c.relname = t.table_name
+                    WHERE t.table_schema = %s
+                      AND t.table_type IN ('BASE TABLE', 'VIEW')
+                    ORDER BY t.table_name
+                """, (schema,))
+                tables_raw = cursor.fetchall()
+
+                fingerprints = {t[0]: t[4] for t in tables_raw}
+                fetch = _tables_to_fetch(fingerprints, previous)
+
+                # Columns, primary keys and indexes of the tables to (re-)read,
+                # grouped by table below
+                columns_by_table = {}
+                indexes_by_table = {}
+                if fetch is None or fetch:
+                    condition, names = _table_filter("c.table_name", fetch)
+                    cursor.execute(f"""
+                        SELECT
+                            c.table_name,
+                            c.column_name,
+                            c.data_type,
+                            c.udt_name,
+                            c.is_nullable,
+                            c.column_default,
+                            c.character_maximum_length,
+                            c.numeric_precision,
+                            c.numeric_scale,
+                            pg_catalog.col_description(pc.oid, c.ordinal_position) as comment
+                        FROM information_schema.columns c
+                        JOIN pg_namespace n ON n.nspname = c.table_schema
+                        JOIN pg_class pc ON pc.relnamespace = n.oid AND pc.relname = c.table_name
+                        WHERE c.table_schema = %s{condition}
+                        ORDER BY c.table_name, c.ordinal_position
+                    """, (schema,) + names)
+                    columns_by_table = _group_by_table(cursor.fetchall(), 0)
+
+                    # Primary keys and indexes in one pass, split by indisprimary
+                    condition, names = _table_filter("t.relname", fetch)
+                    cursor.execute(f"""
+                        SELECT
+                            t.relname as table_name,
+                            i.relname as index_name,
+                            ix.indisunique,
+                            ix.indisprimary,
+                            array_agg(a.attname ORDER BY array_position(ix.indkey, a.attnum))
+                        FROM pg_class t
+                        JOIN pg_namespace n ON n.oid = t.relnamespace
+                        JOIN pg_index ix ON t.oid = ix.indrelid
+                        JOIN pg_class i ON i.oid = ix.indexrelid
+                        JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = ANY(ix.indkey)
+                        WHERE n.nspname = %s{condition}
+                        GROUP BY t.relname, i.relname, ix.indisunique, ix.indisprimary
+                        ORDER BY t.relname, i.relname
+                    """, (schema,) + names)
+                    indexes_by_table = _group_by_table(cursor.fetchall(), 0)
+
+                previous_tables = {t["name"]: t for t in previous or []}
+                tables = []
+                risks = []
+                total_rows = 0
+
+                for table_info in tables_raw:
+                    table_name = table_info[0]
+                    row_count = int(table_info[3]) if table_info[3] else 0
+                    total_rows += row_count
+
+                    table = {
+                        "name": table_name,
+                        "type": table_info[1],
+                        "row_count": row_count,
+                        "comment": table_info[2],
+                        "fingerprint": fingerprints[table_name]
                     }
-                    columns.append(column)
 
-                # Get primary key
-                cursor.execute("""
-                    SELECT a.attname
-                    FROM pg_index i
-                    JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)
-                    JOIN pg_class c ON c.oid = i.indrelid
-                    WHERE c.relname = %s AND i.indisprimary
-                """, (table_name,))
-                pk_columns = [row[0] for row in cursor.fetchall()]
-                has_primary_key = len(pk_columns) > 0
-
-                # Get indexes
-                cursor.execute("""
-                    SELECT
-                        i.relname as index_name,
-                        ix.indisunique,
-                        array_agg(a.attname ORDER BY array_position(ix.indkey, a.attnum))
-                    FROM pg_class t
-                    JOIN pg_index ix ON t.oid = ix.indrelid
-                    JOIN pg_class i ON i.oid = ix.indexrelid
-                    JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = ANY(ix.indkey)
-                    WHERE t.relname = %s AND NOT ix.indisprimary
-                    GROUP BY i.relname, ix.indisunique
-                """, (table_name,))
-                indexes_raw = cursor.fetchall()
-
-                indexes = []
-                for idx in indexes_raw:
-                    indexes.append({
-                        "name": idx[0],
-                        "unique": idx[1],
-                        "columns": idx[2]
-                    })
-
-                table = {
-                    "name": table_name,
-                    "type": table_info[1],
-                    "row_count": row_count,
-                    "comment": table_info[2],
-                    "columns": columns,
-                    "indexes": indexes,
-                    "primary_key": pk_columns,
-                    "has_primary_key": has_primary_key
-                }
-                tables.append(table)
-
-                # Risk: no primary key
-                if not has_primary_key:
-                    risks.append({
-                        "table": table_name,
-                        "column": None,
-                        "type": "no_primary_key",
-                        "severity": "error",
-                        "message": f"Table '{table_name}' has no primary key"
-                    })
-
-                # Risk: large table
-                if row_count and row_count > 1000000:
-                    risks.append({
-                        "table": table_name,
-                        "column": None,
-                        "type": "large_table",
-                        "severity": "info",
-                        "message": f"Table '{table_name}' has ~{row_count:,} rows"
-                    })
-
-            cursor.close()
-            conn.close()
+                    if fetch is not None and table_name not in fetch:
+                        _reuse_details(table, previous_tables[table_name])
+                    else:
+                        columns = []
+                        for col in columns_by_table.get(table_name, []):
+                            column = {
+                                "name": col[1],
+                                "data_type": col[2],
+                                "udt_name": col[3],
+                                "nullable": col[4] == 'YES',
+                                "default": col[5],
+                                "max_length": col[6],
+                                "precision": col[7],
+                                "scale": col[8],
+                                "comment": col[9]
+                            }
+                            columns.append(column)
+
+                        pk_columns = []
+                        indexes = []
+                        for idx in indexes_by_table.get(table_name, []):
+                            if idx[3]:
+                                pk_columns = idx[4]
+                            else:
+                                indexes.append({
+                                    "name": idx[1],
+                                    "unique": idx[2],
+                                    "columns": idx[4]
+                                })
+
+                        table["columns"] = columns
+                        table["indexes"] = indexes
+                        table["primary_key"] = pk_columns
+                        table["has_primary_key"] = len(pk_columns) > 0
+
+                    tables.append(table)
+                    risks.extend(_postgres_risks(table))
+
+                cursor.close()
 
             return {
                 "success": True,
@@ -397,166 +552,169 @@ class SchemaAnalyzer:
         username: str,
         password: str,
         ssl: bool = False,
-        schema: str = "dbo"
+        schema: str = "dbo",
+        previous: Optional[list] = None,
+        connection_id: Optional[str] = None
     ) -> dict:
         """Analyze MSSQL database schema."""
         try:
-            conn = pymssql.connect(
-                server=host,
-                port=port,
-                user=username,
-                password=password,
-                database=database,
-                login_timeout=30
-            )
-            cursor = conn.cursor(as_dict=True)
-
-            # Get all tables
-            cursor.execute("""
-                SELECT
-                    t.TABLE_NAME,
-                    t.TABLE_TYPE,
-                    (SELECT SUM(p.rows) FROM sys.partitions p
-                     JOIN sys.tables tb ON p.object_id = tb.object_id
-                     WHERE tb.name = t.TABLE_NAME AND p.index_id < 2) as row_count,
-                    ep.value as comment
-                FROM INFORMATION_SCHEMA.TABLES t
-                LEFT JOIN sys.extended_properties ep
-                    ON ep.major_id = OBJECT_ID(t.TABLE_SCHEMA + '.' + t.TABLE_NAME)
-                    AND ep.minor_id = 0
-                    AND ep.name = 'MS_Description'
-                WHERE t.TABLE_SCHEMA = %s
-                ORDER BY t.TABLE_NAME
-            """, (schema,))
-            tables_raw = cursor.fetchall()
-
-            tables = []
-            risks = []
-            total_rows = 0
-
-            for table_info in tables_raw:
-                table_name = table_info['TABLE_NAME']
-                row_count = table_info['row_count'] or 0
-                total_rows += row_count
-
-                # Get columns
+            with source_pool.connection(
+                pool_key(connection_id, host, port, database, username, password, ssl),
+                lambda: pymssql.connect(
+                    server=host,
+                    port=port,
+                    user=username,
+                    password=password,
+                    database=database,
+                    login_timeout=30
+                )
+            ) as conn:
+                cursor = conn.cursor(as_dict=True)
+
+                # Get all tables, fingerprinted by modify_date (bumped by ALTER and
+                # index changes) and a checksum of the column descriptions
                 cursor.execute("""
                     SELECT
-                        c.COLUMN_NAME,
-                        c.DATA_TYPE,
-                        c.IS_NULLABLE,
-                        c.COLUMN_DEFAULT,
-                        c.CHARACTER_MAXIMUM_LENGTH,
-                        c.NUMERIC_PRECISION,
-                        c.NUMERIC_SCALE,
-                        c.COLLATION_NAME,
-                        ep.value as comment
-                    FROM INFORMATION_SCHEMA.COLUMNS c
+                        t.TABLE_NAME,
+                        t.TABLE_TYPE,
+                        p.row_count,
+                        ep.value as comment,
+                        o.modify_date,
+                        (SELECT CHECKSUM_AGG(CHECKSUM(cep.minor_id, CAST(cep.value AS nvarchar(4000))))
+                         FROM sys.extended_properties cep
+                         WHERE cep.major_id = o.object_id
+                           AND cep.minor_id > 0
+                           AND cep.name = 'MS_Description') as comments_checksum
+                    FROM INFORMATION_SCHEMA.TABLES t
+                    LEFT JOIN sys.objects o
+                        ON o.object_id = OBJECT_ID(QUOTENAME(t.TABLE_SCHEMA) + '.' + QUOTENAME(t.TABLE_NAME))
+                    LEFT JOIN (
+                        SELECT object_id, SUM(rows) as row_count
+                        FROM sys.partitions
+                        WHERE index_id < 2
+                        GROUP BY object_id
+                    ) p ON p.object_id = o.object_id
                     LEFT JOIN sys.extended_properties ep
-                        ON ep.major_id = OBJECT_ID(c.TABLE_SCHEMA + '.' + c.TABLE_NAME)
-                        AND ep.minor_id = c.ORDINAL_POSITION
+                        ON ep.major_id = o.object_id
+                        AND ep.minor_id = 0
                         AND ep.name = 'MS_Description'
-                    WHERE c.TABLE_SCHEMA = %s AND c.TABLE_NAME = %s
-                    ORDER BY c.ORDINAL_POSITION
-                """, (schema, table_name))
-                columns_raw = cursor.fetchall()
-
-                columns = []
-                for col in columns_raw:
-                    column = {
-                        "name": col['COLUMN_NAME'],
-                        "data_type": col['DATA_TYPE'],
-                        "nullable": col['IS_NULLABLE'] == 'YES',
-                        "default": col['COLUMN_DEFAULT'],
-                        "max_length": col['CHARACTER_MAXIMUM_LENGTH'],
-                        "precision": col['NUMERIC_PRECISION'],
-                        "scale": col['NUMERIC_SCALE'],
-                        "collation": col['COLLATION_NAME'],
-                        "comment": col['comment']
-                    }
-                    columns.append(column)
-
-                    # Detect risky MSSQL types for Snowflake migration
-                    risky_types = ['xml', 'geography', 'geometry', 'hierarchyid', 'sql_variant', 'image', 'text', 'ntext']
-                    if col['DATA_TYPE'].lower() in risky_types:
-                        risks.append({
-                            "table": table_name,
-                            "column": col['COLUMN_NAME'],
-                            "type": "risky_type",
-                            "severity": "warning",
-                            "message": f"Type '{col['DATA_TYPE']}' requires special handling for Snowflake migration"
-                        })
-
-                # Get primary key
-                cursor.execute("""
-                    SELECT COLUMN_NAME
-                    FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE
-                    WHERE OBJECTPROPERTY(OBJECT_ID(CONSTRAINT_SCHEMA + '.' + CONSTRAINT_NAME), 'IsPrimaryKey') = 1
-                      AND TABLE_SCHEMA = %s AND TABLE_NAME = %s
-                    ORDER BY ORDINAL_POSITION
-                """, (schema, table_name))
-                pk_columns = [row['COLUMN_NAME'] for row in cursor.fetchall()]
-                has_primary_key = len(pk_columns) > 0
-
-                # Get indexes
-                cursor.execute("""
-                    SELECT
-                        i.name as index_name,
-                        i.is_unique,
-                        STRING_AGG(c.name, ',') WITHIN GROUP (ORDER BY ic.key_ordinal) as columns
-                    FROM sys.indexes i
-                    JOIN sys.index_columns ic ON i.object_id = ic.object_id AND i.index_id = ic.index_id
-                    JOIN sys.columns c ON ic.object_id = c.object_id AND ic.column_id = c.column_id
-                    JOIN sys.tables t ON i.object_id = t.object_id
-                    JOIN sys.schemas s ON t.schema_id = s.schema_id
-                    WHERE s.name = %s AND t.name = %s AND i.is_primary_key = 0 AND i.type > 0
-                    GROUP BY i.name, i.is_unique
-                """, (schema, table_name))
-                indexes_raw = cursor.fetchall()
-
-                indexes = []
-                for idx in indexes_raw:
-                    if idx['index_name']:
-                        indexes.append({
-                            "name": idx['index_name'],
-                            "unique": idx['is_unique'],
-                            "columns": idx['columns'].split(',') if idx['columns'] else []
-                        })
-
-                table = {
-                    "name": table_name,
-                    "type": table_info['TABLE_TYPE'],
-                    "row_count": row_count,
-                    "comment": table_info['comment'],
-                    "columns": columns,
-                    "indexes": indexes,
-                    "primary_key": pk_columns,
-                    "has_primary_key": has_primary_key
+                    WHERE t.TABLE_SCHEMA = %s
+                    ORDER BY t.TABLE_NAME
+                """, (schema,))
+                tables_raw = cursor.fetchall()
+
+                fingerprints = {
+                    t['TABLE_NAME']: f"{t['modify_date']}|{t['comments_checksum']}"
+                    for t in tables_raw
                 }
-                tables.append(table)
-
-                # Risk: no primary key
-                if not has_primary_key:
-                    risks.append({
-                        "table": table_name,
-                        "column": None,
-                        "type": "no_primary_key",
-                        "severity": "error",
-                        "message": f"Table '{table_name}' has no primary key - required for incremental sync"
-                    })
-
-                # Risk: large table
-                if row_count and row_count > 1000000:
-                    risks.append({
-                        "table": table_name,
-                        "column": None,
-                        "type": "large_table",
-                        "severity": "info",
-                        "message": f"Table '{table_name}' has {row_count:,} rows - consider chunked migration"
-                    })
-
-            cursor.close()
-            conn.close()
+                fetch = _tables_to_fetch(fingerprints, previous)
+
+                # Columns, primary keys and indexes of the tables to (re-)read,
+                # grouped by table below
+                columns_by_table = {}
+                indexes_by_table = {}
+                if fetch is None or fetch:
+                    condition, names = _table_filter("c.TABLE_NAME", fetch)
+                    cursor.execute(f"""
+                        SELECT
+                            c.TABLE_NAME,
+                            c.COLUMN_NAME,
+                            c.DATA_TYPE,
+                            c.IS_NULLABLE,
+                            c.COLUMN_DEFAULT,
+                            c.CHARACTER_MAXIMUM_LENGTH,
+                            c.NUMERIC_PRECISION,
+                            c.NUMERIC_SCALE,
+                            c.COLLATION_NAME,
+                            ep.value as comment
+                        FROM INFORMATION_SCHEMA.COLUMNS c
+                        LEFT JOIN sys.extended_properties ep
+                            ON ep.major_id = OBJECT_ID(QUOTENAME(c.TABLE_SCHEMA) + '.' + QUOTENAME(c.TABLE_NAME))
+                            AND ep.minor_id = c.ORDINAL_POSITION
+                            AND ep.name = 'MS_Description'
+                        WHERE c.TABLE_SCHEMA = %s{condition}
+                        ORDER BY c.TABLE_NAME, c.ORDINAL_POSITION
+                    """, (schema,) + names)
+                    columns_by_table = _group_by_table(cursor.fetchall(), 'TABLE_NAME')
+
+                    # Primary keys and indexes in one pass, split by is_primary_key
+                    condition, names = _table_filter("t.name", fetch)
+                    cursor.execute(f"""
+                        SELECT
+                            t.name as table_name,
+                            i.name as index_name,
+                            i.is_unique,
+                            i.is_primary_key,
+                            STRING_AGG(c.name, ',') WITHIN GROUP (ORDER BY ic.key_ordinal) as columns
+                        FROM sys.indexes i
+                        JOIN sys.index_columns ic ON i.object_id = ic.object_id AND i.index_id = ic.index_id
+                        JOIN sys.columns c ON ic.object_id = c.object_id AND ic.column_id = c.column_id
+                        JOIN sys.tables t ON i.object_id = t.object_id
+                        JOIN sys.schemas s ON t.schema_id = s.schema_id
+                        WHERE s.name = %s AND i.type > 0{condition}
+                        GROUP BY t.name, i.name, i.is_unique, i.is_primary_key
+                        ORDER BY t.name, i.name
+                    """, (schema,) + names)
+                    indexes_by_table = _group_by_table(cursor.fetchall(), 'table_name')
+
+                previous_tables = {t["name"]: t for t in previous or []}
+                tables = []
+                risks = []
+                total_rows = 0
+
+                for table_info in tables_raw:
+                    table_name = table_info['TABLE_NAME']
+                    row_count = table_info['row_count'] or 0
+                    total_rows += row_count
+
+                    table = {
+                        "name": table_name,
+                        "type": table_info['TABLE_TYPE'],
+                        "row_count": row_count,
+                        "comment": table_info['comment'],
+                        "fingerprint": fingerprints[table_name]
+                    }
+
+                    if fetch is not None and table_name not in fetch:
+                        _reuse_details(table, previous_tables[table_name])
+                    else:
+                        columns = []
+                        for col in columns_by_table.get(table_name, []):
+                            column = {
+                                "name": col['COLUMN_NAME'],
+                                "data_type": col['DATA_TYPE'],
+                                "nullable": col['IS_NULLABLE'] == 'YES',
+                                "default": col['COLUMN_DEFAULT'],
+                                "max_length": col['CHARACTER_MAXIMUM_LENGTH'],
+                                "precision": col['NUMERIC_PRECISION'],
+                                "scale": col['NUMERIC_SCALE'],
+                                "collation": col['COLLATION_NAME'],
+                                "comment": col['comment']
+                            }
+                            columns.append(column)
+
+                        pk_columns = []
+                        indexes = []
+                        for idx in indexes_by_table.get(table_name, []):
+                            idx_columns = idx['columns'].split(',') if idx['columns'] else []
+                            if idx['is_primary_key']:
+                                pk_columns = idx_columns
+                            elif idx['index_name']:
+                                indexes.append({
+                                    "name": idx['index_name'],
+                                    "unique": idx['is_unique'],
+                                    "columns": idx_columns
+                                })
+
+                        table["columns"] = columns
+                        table["indexes"] = indexes
+                        table["primary_key"] = pk_columns
+                        table["has_primary_key"] = len(pk_columns) > 0
+
+                    tables.append(table)
+                    risks.extend(_mssql_risks(table))
+
+                cursor.close()
 
             return {
                 "success": True,
@@ -598,15 +756,30 @@ class SchemaAnalyzer:
         username: str,
         password: str,
         ssl: bool = False,
-        schema: str = "public"
+        schema: str = "public",
+        previous: Optional[list] = None,
+        connection_id: Optional[str] = None
     ) -> dict:
-        """Analyze database schema based on type."""
+        """Analyze database schema based on type.
+
+        previous is the tables list of an earlier analysis of the same schema;
+        tables it holds unchanged are not introspected again. connection_id
+        of a saved connection lets the analysis reuse its pooled connections.
+        """
         if db_type == DatabaseType.MSSQL:
-            return cls.analyze_mssql(host, port, database, username, password, ssl, schema or "dbo")
+            return cls.analyze_mssql(
+                host, port, database, username, password, ssl, schema or "dbo", previous,
+                connection_id
+            )
         elif db_type == DatabaseType.MYSQL:
-            return cls.analyze_mysql(host, port, database, username, password, ssl)
+            return cls.analyze_mysql(
+                host, port, database, username, password, ssl, previous, connection_id
+            )
         elif db_type == DatabaseType.POSTGRES:
-            return cls.analyze_postgres(host, port, database, username, password, ssl, schema)
+            return cls.analyze_postgres(
+                host, port, database, username, password, ssl, schema, previous,
+                connection_id
+            )
         else:
             return {
                 "success": False,
@@ -0,0 +1,399 @@
+"""Benchmark the file converter on synthetic inputs.
+
+Usage (from backend directory):
+    venv/bin/python -m scripts.bench_converter
+    venv/bin/python -m scripts.bench_converter --rows 1000000 --out bench.json
+    venv/bin/python -m scripts.bench_converter --sources sql,dbf --targets sqlite
+    venv/bin/python -m scripts.bench_converter --compare bench.json
+
+Generates one input per source format in READERS, then runs every
+source -> target pair through run_conversion() (read, write and ZIP) in a
+fresh process. Wall time, rows/s, input MB/s and peak RSS of the largest
+single process per pair are written to a JSON report; --compare prints the
+change against an earlier report. Conversion options come from the
+CONVERTER_* settings, as in the API; --pg-output and --archive stand in for
+the API's pgOutput and archive query parameters.
+"""
+
+import argparse
+import csv
+import dataclasses
+import datetime
+import json
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import shutil
+import sqlite3
+import struct
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+# Ensure backend is on the path
+backend_dir = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from dotenv import load_dotenv
+load_dotenv(backend_dir.parent / ".env")
+
+from app.converter.detect import ARCHIVE_FORMATS, PG_OUTPUT_MODES, SUPPORTED_TARGETS
+from app.converter.engine import ConversionError, run_conversion
+from app.converter.models import ConvertOptions
+from app.converter.readers import READERS
+from app.core.config import get_settings
+
+COLUMNS = ["id", "name", "amount", "created", "active", "note"]
+
+# File extension of the generated input per source format
+INPUT_SUFFIXES = {
+    "csv": ".csv",
+    "excel": ".xlsx",
+    "sqlite": ".sqlite",
+    "sql": ".sql",
+    "dbf": ".dbf",
+    "parquet": ".parquet",
+    "arrow": ".arrow",
+}
+
+WORDS = ["alpha", "beta", "gamma", "delta", "O'Brien", "naïve", "a,b", 'say "hi"', "x;y"]
+
+
+# ---------------------------------------------------------------------------
+# Synthetic inputs
+# ---------------------------------------------------------------------------
+
+def synthetic_rows(n: int, seed: int = 0):
+    """Yield n rows of (id, name, amount, created, active, note); note is NULL 1 in 10."""
+    rnd = random.Random(seed)
+    start = datetime.date(2000, 1, 1)
+    for i in range(1, n + 1):
+        yield (
+            i,
+            f"{rnd.choice(WORDS)} {i}",
+            round(rnd.uniform(-10_000, 10_000), 2),
+            start + datetime.timedelta(days=i % 9000),
+            i % 3 == 0,
+            None if i % 10 == 0 else " ".join(rnd.choice(WORDS) for _ in range(rnd.randint(1, 8))),
+        )
+
+
+def gen_csv(path: Path, n: int, tables: int) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(COLUMNS)
+        for r in synthetic_rows(n):
+            w.writerow(["" if v is None else v for v in r])
+
+
+def gen_excel(path: Path, n: int, tables: int) -> None:
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    for t in range(tables):
+        ws = wb.create_sheet(f"table{t + 1}")
+        ws.append(COLUMNS)
+        for r in synthetic_rows(n, seed=t):
+            ws.append(r)
+    wb.save(path)
+
+
+def gen_sqlite(path: Path, n: int, tables: int) -> None:
+    con = sqlite3.connect(path)
+    for t in range(tables):
+        con.execute(
+            f"CREATE TABLE table{t + 1} (id INTEGER PRIMARY KEY, name TEXT, amount REAL, "
+            f"created DATE, active BOOLEAN, note TEXT)"
+        )
+        con.executemany(
+            f"INSERT INTO table{t + 1} VALUES (?, ?, ?, ?, ?, ?)",
+            ((i, name, amount, created.isoformat(), int(active), note)
+             for i, name, amount, created, active, note in synthetic_rows(n, seed=t)),
+        )
+    con.commit()
+    con.close()
+
+
+def _sql_literal(v) -> str:
+    if v is None:
+        return "NULL"
+    if isinstance(v, bool):
+        return "1" if v else "0"
+    if isinstance(v, (int, float)):
+        return str(v)
+    return "'" + str(v).replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+def gen_sql(path: Path, n: int, tables: int) -> None:
+    """A mysqldump-style dump with extended INSERTs of 1000 rows."""
+    with open(path, "w", encoding="utf-8") as f:
+        for t in range(tables):
+            name = f"table{t + 1}"
+            f.write(
+                f"CREATE TABLE `{name}` (\n  `id` int NOT NULL,\n  `name` varchar(100),\n"
+                f"  `amount` decimal(12,2),\n  `created` date,\n  `active` tinyint(1),\n"
+                f"  `note` text,\n  PRIMARY KEY (`id`)\n) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;\n"
+            )
+            batch = []
+            for r in synthetic_rows(n, seed=t):
+                batch.append("(" + ",".join(_sql_literal(v) for v in r) + ")")
+                if len(batch) == 1000:
+                    f.write(f"INSERT INTO `{name}` VALUES {','.join(batch)};\n")
+                    batch = []
+            if batch:
+                f.write(f"INSERT INTO `{name}` VALUES {','.join(batch)};\n")
+
+
+def gen_dbf(path: Path, n: int, tables: int) -> None:
+    """A dBase III table, code page 1252 (language driver 0x03)."""
+    fields = [
+        ("ID", "N", 10, 0), ("NAME", "C", 40, 0), ("AMOUNT", "N", 12, 2),
+        ("CREATED", "D", 8, 0), ("ACTIVE", "L", 1, 0), ("NOTE", "C", 120, 0),
+    ]
+    record_len = 1 + sum(f[2] for f in fields)
+    header_len = 32 + 32 * len(fields) + 1
+    with open(path, "wb") as f:
+        today = datetime.date.today()
+        f.write(struct.pack(
+            "<BBBBIHH17xB2x", 0x03, today.year - 1900, today.month, today.day,
+            n, header_len, record_len, 0x03,
+        ))
+        for name, ftype, length, decimals in fields:
+            f.write(struct.pack("<11sc4xBB14x", name.encode(), ftype.encode(), length, decimals))
+        f.write(b"\r")
+        for i, name, amount, created, active, note in synthetic_rows(n):
+            f.write(
+                b" "
+                + str(i).rjust(10).encode()
+                + name.encode("cp1252")[:40].ljust(40)
+                + f"{amount:.2f}".rjust(12).encode()
+                + created.strftime("%Y%m%d").encode()
+                + (b"T" if active else b"F")
+                + (note or "").encode("cp1252")[:120].ljust(120)
+            )
+        f.write(b"\x1a")
+
+
+def _arrow_batches(n: int, size: int = 100_000):
+    """Yield the synthetic rows as Arrow record batches of up to size rows."""
+    import pyarrow as pa
+
+    batch = []
+    for r in synthetic_rows(n):
+        batch.append(dict(zip(COLUMNS, r)))
+        if len(batch) == size:
+            yield pa.RecordBatch.from_pylist(batch)
+            batch = []
+    if batch or not n:
+        yield pa.RecordBatch.from_pylist(batch)
+
+
+def gen_parquet(path: Path, n: int, tables: int) -> None:
+    import pyarrow.parquet as pq
+
+    writer = None
+    for batch in _arrow_batches(n):
+        writer = writer or pq.ParquetWriter(path, batch.schema)
+        writer.write_batch(batch)
+    writer.close()
+
+
+def gen_arrow(path: Path, n: int, tables: int) -> None:
+    import pyarrow as pa
+
+    with pa.OSFile(str(path), "wb") as sink:
+        writer = None
+        for batch in _arrow_batches(n):
+            writer = writer or pa.ipc.new_file(sink, batch.schema)
+            writer.write_batch(batch)
+        writer.close()
+
+
+GENERATORS = {
+    "csv": gen_csv,
+    "excel": gen_excel,
+    "sqlite": gen_sqlite,
+    "sql": gen_sql,
+    "dbf": gen_dbf,
+    "parquet": gen_parquet,
+    "arrow": gen_arrow,
+}
+
+
+# ---------------------------------------------------------------------------
+# Running pairs
+# ---------------------------------------------------------------------------
+
+def _peak_rss_mb() -> float:
+    """Peak RSS of the largest single process, in MB.
+
+    That is the conversion process or its largest table worker, whichever
+    is bigger; while tables are written in parallel, the combined footprint
+    of the workers can be higher.
+    """
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def _run_pair(input_path: Path, source: str, target: str, options: ConvertOptions) -> dict:
+    """Convert once in this (fresh) process and measure it."""
+    work_dir = Path(tempfile.mkdtemp(prefix="ltc_bench_"))
+    try:
+        start = time.perf_counter()
+        result = run_conversion(input_path, source, target, work_dir, options)
+        wall = time.perf_counter() - start
+        return {
+            "rows": result.total_rows,
+            "tables": result.tables_count,
+            "output_bytes": result.archive_path.stat().st_size,
+            "wall_s": round(wall, 3),
+            "peak_rss_mb": round(_peak_rss_mb(), 1),
+        }
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def run_pair(input_path: Path, source: str, target: str, options: ConvertOptions) -> dict:
+    """Run one pair in a new spawned process so peak RSS is its own."""
+    record = {"source": source, "target": target, "input_bytes": input_path.stat().st_size}
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        try:
+            record.update(pool.submit(_run_pair, input_path, source, target, options).result())
+        except ConversionError as exc:
+            record["error"] = exc.detail
+            return record
+        except Exception as exc:
+            record["error"] = f"{type(exc).__name__}: {exc}"
+            return record
+    wall = max(record["wall_s"], 1e-9)
+    record["rows_per_s"] = round(record["rows"] / wall)
+    record["mb_per_s"] = round(record["input_bytes"] / 1024 / 1024 / wall, 2)
+    return record
+
+
+def convert_options(table_workers: int | None, pg_output: str, archive: str) -> ConvertOptions:
+    """Options as the API builds them, with table_workers optionally overridden."""
+    settings = get_settings()
+    return ConvertOptions(
+        batch_size=settings.converter_batch_size,
+        insert_rows=settings.converter_insert_rows,
+        max_statement_bytes=settings.converter_max_statement_bytes,
+        pg_output=pg_output,
+        compression=settings.converter_columnar_compression,
+        row_group_size=settings.converter_row_group_size,
+        table_workers=settings.converter_table_workers if table_workers is None else table_workers,
+        parallel_min_bytes=settings.converter_parallel_min_bytes if table_workers is None else 0,
+        archive=archive,
+        zip_level=settings.converter_zip_level,
+        zstd_level=settings.converter_zstd_level,
+    )
+
+
+def compare(report: dict, baseline: dict) -> None:
+    """Print wall time and peak RSS of each pair against the baseline report."""
+    before = {(r["source"], r["target"]): r for r in baseline["results"]}
+    if (report["rows"], report["tables"]) != (baseline["rows"], baseline["tables"]):
+        print(
+            f"\nwarning: baseline used {baseline['rows']} rows x {baseline['tables']} tables, "
+            f"this run {report['rows']} x {report['tables']}; wall times are not comparable"
+        )
+    print(f"\n{'pair':<24} {'wall s':>16} {'change':>8} {'peak MB/process':>16}")
+    for r in report["results"]:
+        b = before.get((r["source"], r["target"]))
+        if not b or "error" in r or "error" in b:
+            continue
+        change = (r["wall_s"] - b["wall_s"]) / max(b["wall_s"], 1e-9) * 100
+        print(
+            f"{r['source'] + ' -> ' + r['target']:<24} "
+            f"{b['wall_s']:>7.2f} -> {r['wall_s']:<6.2f} {change:>+7.1f}% "
+            f"{b['peak_rss_mb']:>7.0f} -> {r['peak_rss_mb']:<6.0f}"
+        )
+
+
+def main(args) -> int:
+    sources = args.sources.split(",") if args.sources else sorted(READERS)
+    targets = args.targets.split(",") if args.targets else sorted(SUPPORTED_TARGETS)
+    unknown = [s for s in sources if s not in GENERATORS] + [t for t in targets if t not in SUPPORTED_TARGETS]
+    if unknown:
+        print(f"Unknown source/target: {', '.join(unknown)}", file=sys.stderr)
+        return 1
+
+    work_dir = Path(args.work_dir or tempfile.mkdtemp(prefix="ltc_bench_inputs_"))
+    work_dir.mkdir(parents=True, exist_ok=True)
+    options = convert_options(args.table_workers, args.pg_output, args.archive)
+
+    inputs = {}
+    for source in sources:
+        # Sized names, so a kept --work-dir never serves inputs of another size
+        path = work_dir / f"bench_{args.rows}x{args.tables}{INPUT_SUFFIXES[source]}"
+        if not path.exists() or args.regenerate:
+            path.unlink(missing_ok=True)
+            start = time.perf_counter()
+            GENERATORS[source](path, args.rows, args.tables)
+            print(f"generated {path.name} ({path.stat().st_size / 1024 / 1024:.1f} MB) "
+                  f"in {time.perf_counter() - start:.1f}s")
+        inputs[source] = path
+
+    results = []
+    for source in sources:
+        for target in targets:
+            record = run_pair(inputs[source], source, target, options)
+            results.append(record)
+            if "error" in record:
+                print(f"{source:>8} -> {target:<10} FAILED: {record['error']}")
+            else:
+                print(
+                    f"{source:>8} -> {target:<10} {record['wall_s']:>8.2f}s "
+                    f"{record['rows_per_s']:>10} rows/s {record['mb_per_s']:>8.2f} MB/s "
+                    f"{record['peak_rss_mb']:>7.0f} MB peak/process"
+                )
+
+    report = {
+        "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "host": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "rows": args.rows,
+        "tables": args.tables,
+        "options": dataclasses.asdict(options),
+        "results": results,
+    }
+    Path(args.out).write_text(json.dumps(report, indent=2))
+    print(f"\nreport written to {args.out}")
+
+    if args.compare:
+        compare(report, json.loads(Path(args.compare).read_text()))
+
+    if not args.work_dir:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 1 if any("error" in r for r in results) else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the file converter")
+    parser.add_argument("--rows", type=int, default=100_000, help="Rows per generated table")
+    parser.add_argument("--tables", type=int, default=1, help="Tables in SQLite, SQL and XLSX inputs")
+    parser.add_argument("--sources", help="Comma-separated source formats (default: all readers)")
+    parser.add_argument("--targets", help="Comma-separated target formats (default: all targets)")
+    parser.add_argument("--table-workers", type=int, default=None, help="Override CONVERTER_TABLE_WORKERS and write tables in parallel regardless of input size")
+    parser.add_argument("--pg-output", default="insert", choices=PG_OUTPUT_MODES,
+                        help="PostgreSQL row loading, as the API's pgOutput")
+    parser.add_argument("--archive", default="zip", choices=ARCHIVE_FORMATS,
+                        help="Output packaging, as the API's archive")
+    parser.add_argument("--work-dir", help="Keep generated inputs here and reuse them across runs")
+    parser.add_argument("--regenerate", action="store_true", help="Regenerate inputs in --work-dir")
+    parser.add_argument("--out", default="converter_bench.json", help="JSON report path")
+    parser.add_argument("--compare", help="Earlier JSON report to compare against")
+    args = parser.parse_args()
+
+    sys.exit(main(args))
@@ -0,0 +1,28 @@
+"""Tests for upload format detection."""
+import io
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from app.converter.detect import SNIFF_BYTES, check_content
+
+
+def _ends(content: bytes) -> tuple[bytes, bytes]:
+    return content[:SNIFF_BYTES], content[-SNIFF_BYTES:]
+
+
+def test_parquet_is_recognised_by_both_magics():
+    buf = io.BytesIO()
+    pq.write_table(pa.table({"a": [1, 2]}), buf)
+    assert check_content("data.bin", *_ends(buf.getvalue())) == (".parquet", None)
+
+
+def test_text_starting_with_par1_is_not_parquet():
+    content = b"PAR1,PAR2\n1,2\n" * 10
+    assert check_content("pairs.csv", *_ends(content)) == (".csv", None)
+    ext, error = check_content("pairs.parquet", *_ends(content))
+    assert ext is None and "does not match" in error
+
+
+def test_too_short_for_parquet():
+    assert check_content("x.csv", *_ends(b"PAR1PAR1")) == (".csv", None)
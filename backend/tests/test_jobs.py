@@ -0,0 +1,42 @@
+"""Tests for the conversion job store."""
+import json
+import time
+
+from app.converter.jobs import JOB_FAILED, JOB_RUNNING, JobStore
+
+
+def _store(tmp_path, max_runtime=3600):
+    return JobStore(tmp_path / "jobs", ttl_seconds=60, max_runtime_seconds=max_runtime)
+
+
+def test_fail_unfinished_fails_jobs_and_removes_uploads(tmp_path):
+    store = _store(tmp_path)
+    running_id, running_dir = store.create(filename="big.csv")
+    store.update(running_id, status=JOB_RUNNING)
+    (running_dir / "big.csv").write_bytes(b"a,b\n1,2\n")
+    (running_dir / "output").mkdir()
+    done_id, _ = store.create(filename="small.csv")
+    store.finish(done_id, status="completed")
+
+    assert store.fail_unfinished("interrupted") == 1
+
+    job = store.get(running_id)
+    assert job["status"] == JOB_FAILED
+    assert job["error"] == "interrupted"
+    assert job["expires_at"] is not None
+    assert [p.name for p in running_dir.iterdir()] == ["job.json"]
+    assert store.get(done_id)["status"] == "completed"
+
+
+def test_purge_removes_unfinished_jobs_past_max_runtime(tmp_path):
+    store = _store(tmp_path)
+    stale_id, stale_dir = store.create()
+    fresh_id, _ = store.create()
+    job = json.loads((stale_dir / "job.json").read_text())
+    job["created_at"] = time.time() - 2 * 3600
+    (stale_dir / "job.json").write_text(json.dumps(job))
+
+    assert store.purge_expired() == 1
+    assert not stale_dir.exists()
+    assert store.get(stale_id) is None
+    assert store.get(fresh_id)["status"] == "queued"
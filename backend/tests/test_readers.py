@@ -0,0 +1,40 @@
+"""Tests for the source readers."""
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+
+from app.converter.readers import TYPE_SAMPLE_ROWS, read_arrow, read_csv, read_parquet
+from app.converter.writers import write_csv
+
+
+def test_parquet_nullable_int_column_stays_integer(tmp_path):
+    path = tmp_path / "counts.parquet"
+    pq.write_table(pa.table({"n": pa.array([1, None, 2], pa.int64())}), path)
+    out = tmp_path / "out"
+    out.mkdir()
+    (csv_file,) = write_csv(read_parquet(path), out)
+    assert csv_file.read_text().splitlines() == ['"n"', "1", '""', "2"]
+
+
+def test_arrow_batches_keep_python_values(tmp_path):
+    path = tmp_path / "counts.arrow"
+    feather.write_feather(pa.table({"n": pa.array([None, 3], pa.int64())}), path)
+    (table,) = read_arrow(path).tables
+    assert list(table.iter_rows()) == [[None], [3]]
+
+
+def test_csv_warns_about_values_past_the_type_sample(tmp_path):
+    path = tmp_path / "ids.csv"
+    rows = [str(i) for i in range(TYPE_SAMPLE_ROWS + 5)] + ["n/a", "7"]
+    path.write_text("id,name\n" + "".join(f"{v},x\n" for v in rows))
+    data = read_csv(path, batch_size=300)
+    assert data.tables[0].columns[0].type == "INTEGER"
+    assert data.warnings == []
+
+    assert sum(len(df) for df in data.tables[0].iter_frames()) == len(rows)
+    assert data.warnings == [
+        f"ids: column 'id' was typed INTEGER from the first {TYPE_SAMPLE_ROWS} rows, "
+        f"but row {TYPE_SAMPLE_ROWS + 6} holds 'n/a'; SQL targets may reject it."
+    ]
+    list(data.tables[0].iter_frames())
+    assert len(data.warnings) == 1
@@ -0,0 +1,33 @@
+"""Regression tests for the SQL dump VALUES parser."""
+from app.converter.sql_dump import parse_flat_values, parse_values
+
+
+def _rows(text, mysql=True):
+    return list(parse_values(text, 0, mysql))
+
+
+def test_json_in_single_quoted_string_keeps_doubled_double_quotes():
+    text = """('{"a":""}', 'say ""hi""', 'it''s')"""
+    expected = [['{"a":""}', 'say ""hi""', "it's"]]
+    assert _rows(text) == expected
+    assert parse_flat_values(text) == expected
+
+
+def test_json_in_single_quoted_string_with_backslash_escapes():
+    text = r"""('{"a":"","b":"x\"y"}\n', 'tab\there ""')"""
+    expected = [['{"a":"","b":"x"y"}\n', 'tab\there ""']]
+    assert _rows(text) == expected
+    assert parse_flat_values(text) == expected
+
+
+def test_double_quoted_string_keeps_doubled_single_quotes():
+    text = '("it\'\'s ""quoted""", "a\\tb\'\'")'
+    expected = [["it''s \"quoted\"", "a\tb''"]]
+    assert _rows(text) == expected
+    assert parse_flat_values(text) == expected
+
+
+def test_nested_expression_falls_back_to_full_parser():
+    text = """(1, '{"k":""}', NOW())"""
+    assert parse_flat_values(text) is None
+    assert _rows(text) == [["1", '{"k":""}', "NOW()"]]
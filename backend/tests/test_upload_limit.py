@@ -0,0 +1,22 @@
+"""Tests for the converter upload limit middleware."""
+from fastapi.testclient import TestClient
+
+from app.converter.limits import MULTIPART_OVERHEAD
+from app.core.config import get_settings
+from app.main import app
+
+ORIGIN = "https://legacytocloud.com"
+
+
+def test_rejected_upload_keeps_cors_headers():
+    too_large = get_settings().converter_max_free_size + MULTIPART_OVERHEAD + 1
+    client = TestClient(app)
+    response = client.post(
+        "/api/convert",
+        params={"outputFormat": "csv"},
+        content=b"",
+        headers={"Origin": ORIGIN, "Content-Length": str(too_large)},
+    )
+    assert response.status_code == 413
+    assert "File too large" in response.json()["detail"]
+    assert response.headers["access-control-allow-origin"] == ORIGIN
@@ -0,0 +1,39 @@
+"""Tests for the SQL dump writers."""
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from app.converter.models import ConvertOptions
+from app.converter.readers import read_parquet
+from app.converter.writers import write_mysql, write_postgresql
+
+
+def _parquet_with_bool_and_binary(tmp_path: Path) -> Path:
+    path = tmp_path / "things.parquet"
+    pq.write_table(
+        pa.table({
+            "id": pa.array([1, 2], pa.int64()),
+            "flag": pa.array([True, None], pa.bool_()),
+            "blob": pa.array([b"\x00\x01", b"it's"], pa.binary()),
+        }),
+        path,
+    )
+    return path
+
+
+def test_parquet_to_mysql_writes_bool_and_binary_literals(tmp_path):
+    data = read_parquet(_parquet_with_bool_and_binary(tmp_path))
+    (out,) = write_mysql(data, tmp_path)
+    dump = out.read_text()
+    assert "`flag` TINYINT(1)" in dump
+    assert "`blob` LONGBLOB" in dump
+    assert "('1', 1, X'0001'),\n('2', NULL, X'69742773');" in dump
+
+
+def test_parquet_to_postgresql_writes_bytea_literals(tmp_path):
+    data = read_parquet(_parquet_with_bool_and_binary(tmp_path))
+    (out,) = write_postgresql(data, tmp_path, ConvertOptions(pg_output="insert"))
+    dump = out.read_text()
+    assert '"blob" BYTEA' in dump
+    assert "('1', 'True', '\\x0001'::bytea),\n('2', NULL, '\\x69742773'::bytea);" in dump
@@ -12,6 +12,8 @@ const SOURCE_FORMATS: Record<string, { label: string; extensions: string }> = {
   sqlite: { label: 'SQLite', extensions: '.sqlite, .db, .sqlite3' },
   sql: { label: 'SQL Dump', extensions: '.sql' },
   dbf: { label: 'DBF / DBase', extensions: '.dbf' },
+  parquet: { label: 'Parquet', extensions: '.parquet' },
+  arrow: { label: 'Arrow / Feather', extensions: '.arrow, .feather' },
 };
 
 const TARGET_FORMATS = [
@@ -20,6 +22,8 @@ const TARGET_FORMATS = [
   { value: 'mysql', label: 'MySQL' },
   { value: 'postgresql', label: 'PostgreSQL' },
   { value: 'sqlite', label: 'SQLite' },
+  { value: 'parquet', label: 'Parquet' },
+  { value: 'arrow', label: 'Arrow (Feather)' },
 ];
 
 type ConvertState = 'idle' | 'uploading' | 'done' | 'error';
@@ -44,6 +48,8 @@ export default function ConvertPage() {
       sqlite: 'sqlite', sqlite3: 'sqlite', db: 'sqlite',
       sql: 'sql',
       dbf: 'dbf',
+      parquet: 'parquet',
+      arrow: 'arrow', feather: 'arrow', ipc: 'arrow',
     };
     return map[ext || ''] || null;
   };
@@ -166,7 +172,7 @@ export default function ConvertPage() {
               <input
                 ref={inputRef}
                 type="file"
-                accept=".csv,.tsv,.xls,.xlsx,.sqlite,.sqlite3,.db,.sql,.dbf"
+                accept=".csv,.tsv,.xls,.xlsx,.sqlite,.sqlite3,.db,.sql,.dbf,.parquet,.arrow,.feather,.ipc"
                 className="hidden"
                 onChange={(e) => e.target.files?.[0] && handleFile(e.target.files[0])}
               />
@@ -16,6 +16,10 @@ import {
   Risk,
 } from '@/lib/api';
 
+// Schema analysis polling: every 2s, for at most 10 minutes
+const ANALYSIS_POLL_INTERVAL_MS = 2000;
+const ANALYSIS_POLL_TIMEOUT_MS = 10 * 60 * 1000;
+
 export default function ProjectsClient() {
   const pathname = usePathname();
 
@@ -168,8 +172,20 @@ function ProjectDetailView({ projectId }: { projectId: string }) {
     }
     setAnalyzing(true);
     try {
-      await analysis.run(projectId, project.source_connection_id);
+      // Analysis runs in the background; poll until it finishes or we give up
+      let current = await analysis.run(projectId, project.source_connection_id);
+      const deadline = Date.now() + ANALYSIS_POLL_TIMEOUT_MS;
+      while (current.status === 'pending' || current.status === 'running') {
+        if (Date.now() > deadline) {
+          throw new Error('Analysis is taking too long. Check back later or run it again.');
+        }
+        await new Promise((resolve) => setTimeout(resolve, ANALYSIS_POLL_INTERVAL_MS));
+        current = await analysis.get(current.id);
+      }
       loadData();
+      if (current.status === 'failed') {
+        alert('Analysis failed: ' + (current.error_message || 'Unknown error'));
+      }
     } catch (err) {
       alert('Analysis failed: ' + (err instanceof Error ? err.message : 'Unknown error'));
     } finally {
@@ -150,6 +150,12 @@ export const analysis = {
       body: JSON.stringify({ connection_id: connectionId }),
     }),
 
+  runBatch: (projectId: string, connectionIds?: string[]) =>
+    request<Analysis[]>(`/analysis/batch/${projectId}`, {
+      method: 'POST',
+      body: JSON.stringify({ connection_ids: connectionIds ?? null }),
+    }),
+
   get: (id: string) => request<Analysis>(`/analysis/${id}`),
 
   getTables: (id: string) => request<{ tables: Table[] }>(`/analysis/${id}/tables`),